@@ -0,0 +1,1129 @@
+import jenkins, asyncio, random, os, gzip, json, time, contextlib
+from Jenkins_helper import Jenkins_Helper, BackupWriter, BackupCatalog, RequestCache, BULK_BUILD_TREE, PROGRESSIVE_TEXT, STREAM_CHUNK_SIZE, CONSOLE_FOLLOW_TIMEOUT, FOLDER_DEPTH, config_fingerprint, plugins_to_install, plugin_install_status
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Read endpoints of AsyncJenkinsHelper.read_server, named after the jenkins.Jenkins methods they mirror
+READ_ENDPOINTS = {
+    "get_whoami": jenkins.WHOAMI_URL,
+    "get_job_info": jenkins.JOB_INFO,
+    "get_job_config": jenkins.CONFIG_JOB,
+    "get_build_info": jenkins.BUILD_INFO,
+    "get_build_stages": jenkins.BUILD_STAGES,
+    "get_build_console_output": jenkins.BUILD_CONSOLE_OUTPUT,
+    "get_build_test_report": jenkins.BUILD_TEST_REPORT,
+    "get_view_config": jenkins.CONFIG_VIEW,
+    "get_node_info": jenkins.NODE_INFO,
+    "get_node_config": jenkins.CONFIG_NODE,
+    "get_nodes": jenkins.NODE_LIST,
+    "get_plugins": jenkins.PLUGIN_INFO,
+    "get_queue_info": jenkins.Q_INFO,
+}
+
+class AsyncJenkinsHelper(Jenkins_Helper):
+    def __init__(self, args):
+        """
+        Coroutine version of Jenkins_Helper on a non-blocking aiohttp session.
+
+        Takes the same arguments as Jenkins_Helper (except ARTIFACTS) and stores backups in the same layout, so the two
+        can read each other's backups. The session is opened by `async with AsyncJenkinsHelper(args) as helper:`. Every request
+        is a coroutine, so the number of requests in flight is only bounded by the connection pool (POOL_SIZE).
+
+        Args:
+            args (argparse.Namespace): The same arguments as Jenkins_Helper.
+        """
+        if aiohttp is None:
+            raise Exception("AsyncJenkinsHelper requires aiohttp: pip install aiohttp")
+        self.session = None
+        self.crumb = None
+        self.pending_reads = {}
+        super().__init__(args)
+        if self.ARTIFACTS:
+            raise Exception("ARTIFACTS is not supported by AsyncJenkinsHelper, download artifacts with Jenkins_Helper")
+
+    def login(self):
+        """
+        Create the jenkins.Jenkins client used to build request URLs (it never sends a request itself)
+        """
+        self.server = jenkins.Jenkins(url=self.JENKINS_URL, username=self.JENKINS_USERNAME, password=self.JENKINS_PASSWORD)
+
+    async def __aenter__(self):
+        """
+        Open the session, check the credentials and fetch the CSRF crumb once for the whole session
+        """
+        auth = None
+        if self.JENKINS_USERNAME is not None and self.JENKINS_PASSWORD is not None:
+            auth = aiohttp.BasicAuth(self.JENKINS_USERNAME, self.JENKINS_PASSWORD)
+        self.session = aiohttp.ClientSession(
+            auth=auth, cookie_jar=aiohttp.CookieJar(unsafe=True),
+            connector=aiohttp.TCPConnector(limit=self.POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(sock_connect=self.CONNECT_TIMEOUT, sock_read=self.READ_TIMEOUT))
+        try:
+            await self.get_whoami()
+            try:
+                self.crumb = await self.request_json("GET", self.server._build_url(jenkins.CRUMB_URL))
+            except jenkins.NotFoundException:
+                self.crumb = False
+        except Exception as e:
+            await self.session.close()
+            raise Exception(f"Failed to connect to Jenkins server: {e}")
+        print("Connected to Jenkins server successfully")
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Close the session opened by __aenter__
+
+        Args:
+            exc_type, exc_value, traceback: The exception raised inside the async with block, if any.
+        """
+        await self.session.close()
+        self.session = None
+
+    async def request(self, method, url, data=None, headers=None):
+        """
+        Send a request and read its body
+
+        GET and HEAD requests are retried on connection errors and 429/502/503/504 responses with jittered
+        exponential backoff (like JenkinsTransport). Other requests are only retried when the connection
+        could not be established. With ADAPTIVE or MAX_RPS every attempt waits for a slot of the limiter.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL of the request.
+            data (bytes or dict, optional): The request body. Defaults to None.
+            headers (dict, optional): Extra request headers. Defaults to None.
+
+        Returns:
+            tuple: The response headers and the response body as text.
+        """
+        headers = dict(headers or {})
+        if method not in ("GET", "HEAD") and self.crumb:
+            headers[self.crumb['crumbRequestField']] = self.crumb['crumb']
+        idempotent = method in ("GET", "HEAD")
+        retried_errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if idempotent else (aiohttp.ClientConnectorError,)
+        for attempt in range(self.RETRIES + 1):
+            retry = attempt < self.RETRIES
+            if self.limiter is not None:
+                await self.limiter.acquire_async()
+            started = time.monotonic()
+            overloaded = True
+            try:
+                async with self.session.request(method, url, data=data, headers=headers) as response:
+                    overloaded = response.status in (429, 503)
+                    if idempotent and retry and response.status in (429, 502, 503, 504):
+                        pass
+                    elif response.status == 404:
+                        raise jenkins.NotFoundException(f"Requested item could not be found: {url}")
+                    elif response.status >= 400:
+                        error = response.headers.get('X-Error') or (await response.text())[:200]
+                        raise jenkins.JenkinsException(f"Error in request ({response.status} {response.reason}): {url}: {error}")
+                    else:
+                        return response.headers, await response.text()
+            except retried_errors:
+                if not retry:
+                    raise
+            finally:
+                if self.limiter is not None:
+                    self.limiter.release(time.monotonic() - started, overloaded)
+            await asyncio.sleep(self.BACKOFF * 2 ** attempt + random.uniform(0, self.BACKOFF))
+
+    async def request_json(self, method, url, data=None, headers=None):
+        """
+        Send a request and decode its JSON body (see request)
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL of the request.
+            data (bytes or dict, optional): The request body. Defaults to None.
+            headers (dict, optional): Extra request headers. Defaults to None.
+
+        Returns:
+            object: The decoded JSON body.
+        """
+        headers, body = await self.request(method, url, data, headers)
+        return json.loads(body)
+
+    async def text(self, method, url, data=None, headers=None):
+        """
+        Send a request and return its body as text (see request)
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL of the request.
+            data (bytes or dict, optional): The request body. Defaults to None.
+            headers (dict, optional): Extra request headers. Defaults to None.
+
+        Returns:
+            str: The response body.
+        """
+        headers, body = await self.request(method, url, data, headers)
+        return body
+
+    def url(self, format_spec, name=None, **params):
+        """
+        Build a request URL from a jenkins module URL template, resolving the folder of a job name
+
+        Args:
+            format_spec (str): The URL template, e.g. jenkins.JOB_INFO.
+            name (str, optional): The job, view or node name. Defaults to None.
+            **params: The other template variables. "depth" defaults to 0.
+
+        Returns:
+            str: The full URL.
+        """
+        params.setdefault("depth", 0)
+        if name is not None:
+            params['folder_url'], params['short_name'] = self.server._get_job_folder(name)
+            params['name'] = '(master)' if name == 'Built-In Node' and format_spec.startswith("computer/") else name
+        return self.server._build_url(format_spec, params)
+
+    async def read_server(self, endpoint, **params):
+        """
+        Call a read-only endpoint of the Jenkins server (see READ_ENDPOINTS)
+
+        Inside a request scope (or with CACHE_TTL) every distinct endpoint and parameter pair is fetched only once,
+        concurrent callers awaiting the same request. Only successful results are cached, as plain values, so the
+        cache can outlive the event loop; failed reads are fetched again by the next caller.
+
+        Args:
+            endpoint (str): The name of the jenkins.Jenkins method the endpoint mirrors.
+            **params: The name, number and depth of the request.
+
+        Returns:
+            object: The decoded JSON (or the text for XML and console endpoints).
+        """
+        url = self.url(READ_ENDPOINTS[endpoint], **params)
+        if "api/json" in url or url.endswith("/wfapi/describe/"):
+            fetch = self.request_json("GET", url)
+        else:
+            fetch = self.text("GET", url)
+        cache = self.request_cache
+        if cache is None:
+            return await fetch
+        key = RequestCache.key(endpoint, params)
+        task = self.pending_reads.get(key)
+        if task is None:
+            cached = cache.lookup(key)
+            if cached is not None:
+                fetch.close()
+                return cached.result()
+            task = self.pending_reads[key] = asyncio.ensure_future(fetch)
+            try:
+                result = await task
+            finally:
+                # a write during the request drops the pending entry, and with it the stale result
+                if self.pending_reads.get(key) is task:
+                    del self.pending_reads[key]
+                    if not task.cancelled() and task.exception() is None:
+                        cache.put(key, task.result())
+            return result
+        fetch.close()
+        return await asyncio.shield(task)
+
+    def forget_reads(self, *names):
+        """
+        Invalidate the cached reads a write may have changed, including the reads still in flight (see Jenkins_Helper.forget_reads)
+        """
+        super().forget_reads(*names)
+        self.pending_reads.clear()
+
+    async def get_info(self, item="", query=""):
+        """
+        Get the JSON API of the server root or of an item, optionally with a tree= query
+
+        Args:
+            item (str, optional): The item path, e.g. "job/folder/". Defaults to the root.
+            query (str, optional): The query string, starting with "?". Defaults to "".
+
+        Returns:
+            dict: The information of the item.
+        """
+        return await self.request_json("GET", self.server._build_url(f"{item}api/json{query}"))
+
+    async def get_whoami(self):
+        """
+        Get the user the session is authenticated as (awaited)
+
+        Returns:
+            dict: The information of the user.
+        """
+        return await self.read_server("get_whoami")
+
+    async def get_jobs(self, folder_depth=0):
+        """
+        Get the jobs, as jenkins.Jenkins.get_jobs does
+
+        Args:
+            folder_depth (int, optional): The number of folder levels to descend into, None for all. Defaults to 0 (top level only).
+
+        Returns:
+            list: The jobs, each with its 'fullname'.
+        """
+        jobs_query = 'jobs'
+        for _ in range(10):
+            jobs_query = jenkins.JOBS_QUERY_TREE % jobs_query
+        jobs_query = jenkins.JOBS_QUERY % jobs_query
+        levels = [("", 0, (await self.get_info(query=jobs_query))['jobs'])]
+        jobs = []
+        while levels:
+            folder_name, depth, children = levels.pop(0)
+            for job in children:
+                job['fullname'] = f"{folder_name}/{job['name']}" if folder_name else job['name']
+                jobs.append(job)
+                if 'jobs' in job and (folder_depth is None or depth < folder_depth):
+                    grandchildren = job['jobs']
+                    # below the levels of the nested query Jenkins returns empty objects
+                    if any('url' not in child for child in grandchildren):
+                        item = "".join(f"job/{name}/" for name in job['fullname'].split("/"))
+                        grandchildren = (await self.get_info(item, jobs_query))['jobs']
+                    levels.append((job['fullname'], depth + 1, grandchildren))
+        return jobs
+
+    async def get_views(self):
+        """
+        Get the views of the server with one request of the root API (awaited)
+
+        Returns:
+            list: The views, each with its 'name' and 'url'.
+        """
+        return (await self.get_info())['views']
+
+    async def get_plugins(self):
+        """
+        Get the installed plugins
+
+        Returns:
+            list: The plugin records.
+        """
+        return (await self.read_server("get_plugins", depth=2))['plugins']
+
+    async def get_job_info(self, job_name):
+        """
+        Get the information of a job by its name (awaited, see Jenkins_Helper.get_job_info)
+
+        Args:
+            job_name (str): The name of the job to get the information of.
+
+        Returns:
+            dict: The information of the job.
+        """
+        return await self.read_server("get_job_info", name=job_name)
+
+    async def get_job_config(self, job_name):
+        """
+        Get the configuration of a job by its name (XML format, awaited)
+
+        Args:
+            job_name (str): The name of the job to get the configuration of.
+
+        Returns:
+            str: The configuration of the job, or an empty job configuration if it could not be fetched.
+        """
+        try:
+            return await self.read_server("get_job_config", name=job_name)
+        except Exception as e:
+            return jenkins.EMPTY_CONFIG_XML
+
+    async def create_job(self, job_name, config):
+        """
+        Create a job with a name and configuration, updating it if it already exists
+
+        Args:
+            job_name (str): The name of the job to create.
+            config (str): The configuration of the job in XML format.
+
+        Returns:
+            bool: True if the job was created or updated successfully, False otherwise.
+        """
+        try:
+            with self.writing(job_name):
+                await self.request("POST", self.url(jenkins.CREATE_JOB, job_name), config.encode("utf-8"), jenkins.DEFAULT_HEADERS)
+            return True
+        except Exception as e:
+            if "already exists" in str(e):
+                return await self.update_job(job_name, config)
+            return False
+
+    async def create_folder(self, folder_name, config=None):
+        """
+        Create a folder with a name and configuration, updating it if it already exists
+
+        Args:
+            folder_name (str): The full name of the folder to create.
+            config (str, optional): The configuration of the folder in XML format. Defaults to None.
+
+        Returns:
+            bool: True if the folder was created or updated successfully, False otherwise.
+        """
+        return await self.create_job(folder_name, jenkins.EMPTY_FOLDER_XML if config is None else config)
+
+    async def get_folder_config(self, folder_name):
+        """
+        Get the configuration of a folder by its full name (XML format, awaited)
+
+        Args:
+            folder_name (str): The full name of the folder to get the configuration of.
+
+        Returns:
+            str: The configuration of the folder in XML format.
+        """
+        return await self.read_server("get_job_config", name=folder_name)
+
+    async def update_job(self, job_name, config):
+        """
+        Update a job with a name and configuration (awaited)
+
+        Args:
+            job_name (str): The name of the job to update.
+            config (str): The configuration of the job in XML format.
+
+        Returns:
+            bool: True once the job was updated; a failed request raises.
+        """
+        with self.writing(job_name):
+            await self.request("POST", self.url(jenkins.CONFIG_JOB, job_name), config.encode("utf-8"), jenkins.DEFAULT_HEADERS)
+        return True
+
+    async def delete_job(self, job_name):
+        """
+        Delete a job by its name (awaited)
+
+        Args:
+            job_name (str): The name of the job to delete.
+
+        Returns:
+            bool: True once the job was deleted; a failed request raises.
+        """
+        with self.writing(job_name):
+            await self.request("POST", self.url(jenkins.DELETE_JOB, job_name))
+        return True
+
+    async def enable_job(self, job_name):
+        """
+        Enable a job by its name (awaited)
+
+        Args:
+            job_name (str): The name of the job to enable.
+
+        Returns:
+            bool: True once the job was enabled; a failed request raises.
+        """
+        with self.writing(job_name):
+            await self.request("POST", self.url(jenkins.ENABLE_JOB, job_name))
+        return True
+
+    async def disable_job(self, job_name):
+        """
+        Disable a job by its name (awaited)
+
+        Args:
+            job_name (str): The name of the job to disable.
+
+        Returns:
+            bool: True once the job was disabled; a failed request raises.
+        """
+        with self.writing(job_name):
+            await self.request("POST", self.url(jenkins.DISABLE_JOB, job_name))
+        return True
+
+    async def get_queue_info(self):
+        """
+        Get the items of the Jenkins queue (awaited)
+
+        Returns:
+            list: The queue items.
+        """
+        return (await self.read_server("get_queue_info"))['items']
+
+    async def cancel_queue_item(self, queue_id):
+        """
+        Cancel a queued job by its ID (awaited)
+
+        Args:
+            queue_id (int): The ID of the queued job to cancel.
+
+        Returns:
+            bool: True, also when Jenkins answers 404 for an item it cancelled or already removed.
+        """
+        try:
+            with self.writing():
+                await self.request("POST", self.url(jenkins.CANCEL_QUEUE, id=queue_id), headers={'Referer': self.server.server})
+        except jenkins.NotFoundException:
+            # Jenkins answers 404 even when the item was cancelled
+            pass
+        return True
+
+    async def build_job(self, job_name, parameters=None):
+        """
+        Build a job by its name with optional parameters (if any)
+
+        Args:
+            job_name (str): The name of the job to build.
+            parameters (dict, optional): The parameters to pass to the job. Defaults to None.
+
+        Returns:
+            int: The queue item number of the build.
+        """
+        with self.writing(job_name):
+            headers, body = await self.request("POST", self.server.build_job_url(job_name, parameters))
+        return int(headers.get('Location', "").rstrip("/").split("/")[-1] or 0)
+
+    async def get_build_stage(self, job_name, build_number):
+        """
+        Get the stages of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job to get the build stages of.
+            build_number (int): The number of the build to get the stages of.
+
+        Returns:
+            dict: The stages of the build.
+        """
+        return await self.read_server("get_build_stages", name=job_name, number=build_number)
+
+    async def get_job_builds(self, job_name):
+        """
+        Get the builds of a job by its name (awaited)
+
+        Args:
+            job_name (str): The name of the job to get the builds of.
+
+        Returns:
+            list: The builds of the job, or an empty list if they could not be fetched.
+        """
+        try:
+            return (await self.read_server("get_job_info", name=job_name))['builds']
+        except Exception as e:
+            return []
+
+    async def get_build_info(self, job_name, build_number):
+        """
+        Get the information of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+
+        Returns:
+            dict: The information of the build.
+        """
+        return await self.read_server("get_build_info", name=job_name, number=build_number)
+
+    async def get_build_console_output(self, job_name, build_number):
+        """
+        Get the console output of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+
+        Returns:
+            str: The console output of the build, or "" if it could not be fetched.
+        """
+        try:
+            return await self.read_server("get_build_console_output", name=job_name, number=build_number)
+        except Exception as e:
+            return ""
+
+    async def save_build_console_output(self, job_name, build_number):
+        """
+        Stream the console output of a build into a gzip file under Console/ (see Jenkins_Helper.save_build_console_output)
+
+        Args:
+            job_name (str): The name of the job to save the build console output of.
+            build_number (int): The number of the build to save the console output of.
+
+        Returns:
+            str: The path of the saved log, relative to the backup directory, or None if it could not be fetched.
+        """
+        relative_path = f"Console/{job_name}_{build_number}.log.gz"
+        file_name = os.path.join(self.file_path, relative_path)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        start = 0
+        deadline = time.monotonic() + CONSOLE_FOLLOW_TIMEOUT
+        try:
+            with open(file_name + ".part", 'wb') as raw, gzip.GzipFile(filename="", mode='wb', fileobj=raw, mtime=0) as file:
+                while True:
+                    async with self.session.get(self.url(PROGRESSIVE_TEXT, job_name, number=build_number, start=start)) as response:
+                        response.raise_for_status()
+                        received = 0
+                        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                            file.write(chunk)
+                            received += len(chunk)
+                        start = int(response.headers.get('X-Text-Size', start + received))
+                        if response.headers.get('X-More-Data') != 'true' or received == 0 or time.monotonic() > deadline:
+                            break
+        except Exception as e:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(file_name + ".part")
+            return None
+        self.store_file(relative_path, file_name + ".part", compress=False)
+        return relative_path
+
+    async def get_build_test_report(self, job_name, build_number):
+        """
+        Get the test report of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+
+        Returns:
+            dict: The test report of the build, or {} if the build has none.
+        """
+        try:
+            return await self.read_server("get_build_test_report", name=job_name, number=build_number)
+        except Exception as e:
+            return {}
+
+    async def get_build_changeset(self, job_name, build_number):
+        """
+        Get the changeset of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+
+        Returns:
+            list: The changes of the build, or an empty list if they could not be fetched.
+        """
+        try:
+            return (await self.read_server("get_build_info", name=job_name, number=build_number))['changeSet']['items']
+        except Exception as e:
+            return []
+
+    async def get_build_artifacts(self, job_name, build_number):
+        """
+        Get the artifact entries of a build by its job name and build number (awaited)
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+
+        Returns:
+            list: The artifacts of the build, or an empty list if they could not be fetched.
+        """
+        try:
+            return (await self.read_server("get_build_info", name=job_name, number=build_number))['artifacts']
+        except Exception as e:
+            return []
+
+    async def create_view(self, view_name, view_config=None):
+        """
+        Create a view with a name and configuration, updating it if it already exists (awaited)
+
+        Args:
+            view_name (str): The name of the view to create.
+            view_config (str, optional): The configuration of the view in XML format. Defaults to an empty view.
+
+        Returns:
+            bool: True if the view was created or updated successfully, False otherwise.
+        """
+        if view_config is None:
+            view_config = jenkins.EMPTY_VIEW_CONFIG_XML
+        try:
+            with self.writing(view_name):
+                await self.request("POST", self.url(jenkins.CREATE_VIEW, view_name), view_config.encode("utf-8"), jenkins.DEFAULT_HEADERS)
+            return True
+        except Exception as e:
+            if "already exists" in str(e):
+                return await self.update_view(view_name, view_config)
+            return False
+
+    async def update_view(self, view_name, view_config):
+        """
+        Update a view with a name and configuration (awaited)
+
+        Args:
+            view_name (str): The name of the view to update.
+            view_config (str): The configuration of the view in XML format.
+
+        Returns:
+            bool: True once the view was updated; a failed request raises.
+        """
+        with self.writing(view_name):
+            await self.request("POST", self.url(jenkins.CONFIG_VIEW, view_name), view_config.encode("utf-8"), jenkins.DEFAULT_HEADERS)
+        return True
+
+    async def get_view_config(self, view_name):
+        """
+        Get the configuration of a view by its name (XML format, awaited) and save it under view/
+
+        Args:
+            view_name (str): The name of the view to get the configuration of.
+
+        Returns:
+            str: The configuration of the view, or an empty view configuration if it could not be fetched.
+        """
+        try:
+            config = await self.read_server("get_view_config", name=view_name)
+        except Exception as e:
+            config = jenkins.EMPTY_VIEW_CONFIG_XML
+        self.save_xml(config, view_name, "view")
+        return config
+
+    async def get_node_info(self, node_name):
+        """
+        Get the information of a node by its name (awaited)
+
+        Args:
+            node_name (str): The name of the node to get the information of.
+
+        Returns:
+            dict: The information of the node.
+        """
+        return await self.read_server("get_node_info", name=node_name)
+
+    async def get_all_nodes(self):
+        """
+        Get the names and states of all nodes with one request (awaited)
+
+        Returns:
+            list: The nodes, each with its 'name' and 'offline' state.
+        """
+        nodes = await self.read_server("get_nodes")
+        return [{'name': node['displayName'], 'offline': node['offline']} for node in nodes['computer']]
+
+    async def get_node_config(self, node_name):
+        """
+        Get the configuration of a node by its name (XML format, awaited) and save it under node/
+
+        Args:
+            node_name (str): The name of the node to get the configuration of.
+
+        Returns:
+            str: The configuration of the node, or an empty configuration if it could not be fetched.
+        """
+        try:
+            config = await self.read_server("get_node_config", name=node_name)
+        except Exception as e:
+            config = jenkins.EMPTY_CONFIG_XML
+        self.save_xml(config, node_name, "node")
+        return config
+
+    async def create_node(self, node_name, config):
+        """
+        Create a node with a name and configuration, updating it if it already exists
+
+        Args:
+            node_name (str): The name of the node to create.
+            config (str): The configuration of the node in XML format.
+
+        Returns:
+            bool: True if the node was created successfully, False otherwise.
+        """
+        try:
+            with self.writing(node_name):
+                await self.request("POST", self.server._build_url(jenkins.CREATE_NODE), {
+                    'name': node_name, 'type': jenkins.NODE_TYPE,
+                    'json': json.dumps({'name': node_name, 'nodeDescription': None, 'numExecutors': 2, 'remoteFS': '/var/lib/jenkins',
+                                        'labelString': None, 'mode': 'NORMAL', 'nodeProperties': {'stapler-class-bag': 'true'},
+                                        'retentionStrategy': {'stapler-class': 'hudson.slaves.RetentionStrategy$Always'},
+                                        'launcher': {'stapler-class': jenkins.LAUNCHER_COMMAND}})})
+        except Exception as e:
+            if "already exists" not in str(e):
+                return False
+        return await self.update_node(node_name, config)
+
+    async def update_node(self, node_name, config):
+        """
+        Update a node with a name and configuration (awaited)
+
+        Args:
+            node_name (str): The name of the node to update.
+            config (str): The configuration of the node in XML format.
+
+        Returns:
+            bool: True once the node was updated; a failed request raises.
+        """
+        with self.writing(node_name):
+            await self.request("POST", self.url(jenkins.CONFIG_NODE, node_name), config.encode("utf-8"), jenkins.DEFAULT_HEADERS)
+        return True
+
+    async def install_plugins(self, plugins, timeout=900):
+        """
+        Install a batch of plugins with one request and at most one safe restart (see Jenkins_Helper.install_plugins)
+
+        Args:
+            plugins (list): The plugin records of a backup, each with a "shortName" and "version".
+            timeout (int): The number of seconds to wait for the downloads and for the restart. Default is 900.
+
+        Returns:
+            list: The names of the plugins that failed to install.
+        """
+        installed = {plugin['shortName']: str(plugin['version']) for plugin in await self.get_plugins()}
+        missing = plugins_to_install(installed, plugins)
+        print(f"Installing {len(missing)} of {len(plugins)} Plugins ...")
+        if not missing:
+            return []
+        body = "<jenkins>" + "".join(f'<install plugin="{name}@{version}" />' for name, version in missing.items()) + "</jenkins>"
+        with self.writing(*missing):
+            await self.request("POST", self.server._build_url('pluginManager/installNecessaryPlugins'),
+                               body.encode("utf-8"), {'Content-Type': 'text/xml'})
+        deadline = time.monotonic() + timeout
+        interval = 1
+        while True:
+            center = await self.get_info("updateCenter/", "?tree=restartRequiredForCompletion,jobs[name,status[_class]]")
+            pending, failed, skipped = plugin_install_status(missing, center)
+            if not pending:
+                break
+            if time.monotonic() > deadline:
+                raise Exception(f"Timed out waiting for {len(pending)} plugins to install")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, 10)
+        if skipped:
+            print(f"Skipped {len(skipped)} Plugins unknown to the update center or already newer: {', '.join(skipped)}")
+        if center.get('restartRequiredForCompletion'):
+            print("Restarting Jenkins to finish the plugin installation ...")
+            await self.request("POST", self.server._build_url('safeRestart'))
+            while True:
+                try:
+                    if (await self.get_info()).get('mode') is not None:
+                        break
+                except Exception as e:
+                    pass
+                if time.monotonic() > deadline:
+                    raise Exception("Jenkins did not come back after the plugin restart")
+                await asyncio.sleep(1)
+        return failed
+
+    async def map_concurrently(self, func, items):
+        """
+        Await a coroutine function for every item concurrently
+
+        Args:
+            func (callable): The coroutine function to call with each item.
+            items (iterable): The items to process.
+
+        Returns:
+            list: The results of the function, in the same order as the items.
+        """
+        return await asyncio.gather(*(func(item) for item in items))
+
+    async def harvest_jobs(self, folder_name=""):
+        """
+        Get the jobs of a folder with their builds using depth-limited tree= queries (see Jenkins_Helper.harvest_jobs)
+
+        Args:
+            folder_name (str, optional): The full name of the folder to harvest. Defaults to the top level.
+
+        Returns:
+            list: The jobs of the folder, each with its 'builds' list. Subfolders also have a 'jobs' key.
+        """
+        item = "".join(f"job/{name}/" for name in folder_name.split("/") if name)
+        jobs, details = await asyncio.gather(
+            self.get_info(item, "?tree=jobs[name,url,color,builds[number,url],jobs[name]{0,1}]"),
+            self.get_info(item, f"?tree=jobs[name,builds[{BULK_BUILD_TREE}]{{0,{self.BUILD_DEPTH + 2}}}]"))
+        details = {job['name']: job.get('builds', []) for job in details['jobs']}
+        jobs = jobs['jobs']
+        for job in jobs:
+            job['fullname'] = f"{folder_name}/{job['name']}" if folder_name else job['name']
+            job.setdefault('builds', [])
+            if self.request_cache is not None:
+                for build in details.get(job['name'], []):
+                    self.request_cache.put(RequestCache.key("get_build_info", {"name": job['fullname'], "number": build['number']}), build)
+        return jobs
+
+    async def list_folder(self, folder_name=""):
+        """
+        List the direct children of a folder with one request (two with BULK, see Jenkins_Helper.list_folder)
+
+        Args:
+            folder_name (str, optional): The full name of the folder to list. Defaults to the top level.
+
+        Returns:
+            list: The children of the folder with their 'fullname'. Subfolders have a 'jobs' key.
+        """
+        if self.BULK:
+            return await self.harvest_jobs(folder_name)
+        item = "".join(f"job/{name}/" for name in folder_name.split("/") if name)
+        children = (await self.get_info(item, "?tree=jobs[name,url,color,jobs[name]{0,1}]"))['jobs']
+        for child in children:
+            child['fullname'] = f"{folder_name}/{child['name']}" if folder_name else child['name']
+        return children
+
+    async def crawl_folders(self):
+        """
+        Walk the folder tree breadth-first, listing all folders of a level concurrently (see Jenkins_Helper.crawl_folders)
+
+        Returns:
+            tuple: The folders and the jobs of the tree, both in breadth-first server order.
+        """
+        folders, jobs, level = [], [], [""]
+        depth = 0
+        while level:
+            next_level = []
+            for parent, children in zip(level, await self.map_concurrently(self.list_folder, level)):
+                for child in children:
+                    if 'jobs' in child:
+                        del child['jobs']
+                        child.pop('builds', None)
+                        folders.append(dict(child, name=child['fullname'], parent=parent))
+                        next_level.append(child['fullname'])
+                    else:
+                        jobs.append(dict(child, name=child['fullname']))
+            print(f"Crawled {len(level)} folders, found {len(next_level)} subfolders ...")
+            if FOLDER_DEPTH is not None and depth >= FOLDER_DEPTH:
+                break
+            level = next_level
+            depth += 1
+        return folders, jobs
+
+    async def save_build_data(self, job_name, build):
+        """
+        Fetch the information, console output, test report, changeset and artifacts of a build concurrently
+
+        Args:
+            job_name (str): The name of the job of the build.
+            build (dict): The build entry to fill in.
+        """
+        print(f"Saving {job_name} {build['number']} Info ...")
+        console = (self.save_build_console_output if self.CONSOLE_FILES else self.get_build_console_output)(job_name, build['number'])
+        build['info'], console, build['test_report'], build['changeset'], build['artifacts'] = await asyncio.gather(
+            self.get_build_info(job_name, build['number']), console,
+            self.get_build_test_report(job_name, build['number']),
+            self.get_build_changeset(job_name, build['number']),
+            self.get_build_artifacts(job_name, build['number']))
+        build['console_log' if self.CONSOLE_FILES else 'console_output'] = console
+        if self.test_results is not None:
+            self.test_results.add(job_name, build['number'], build['test_report'])
+
+    async def save_job_data(self, job):
+        """
+        Save the configuration and build history of a single job (see Jenkins_Helper.save_job_data)
+
+        The builds of the job are fetched concurrently.
+
+        Args:
+            job (dict): The job entry as returned by the Jenkins server.
+
+        Returns:
+            dict: A copy of the job entry with its builds filled in.
+        """
+        if job['name'] in self.checkpoint_jobs:
+            print(f"Resuming {job['name']} from checkpoint ...")
+            job = self.checkpoint_jobs.pop(job['name'])
+        else:
+            job = dict(job)
+            self.save_xml(await self.get_job_config(job['name']), job['name'], "Job")
+
+            builds = job['builds'] if 'builds' in job else await self.get_job_builds(job['name'])
+            job['builds'] = [dict(build) for build in builds]
+            stubs = [dict(build) for build in builds]
+            carried = {**self.previous_builds.get(job['name'], {}), **self.checkpoint_builds.pop(job['name'], {})}
+            # same depth rule as the serial loop: stop after the first build past BUILD_DEPTH
+            selected = job['builds'][:self.BUILD_DEPTH + 2]
+            fetched = []
+            for build in selected:
+                if build['number'] in carried:
+                    print(f"Keeping {job['name']} {build['number']} Info ...")
+                    build.update(carried[build['number']])
+                    if build.get('console_log'):
+                        self.carry_blob(build['console_log'])
+                else:
+                    fetched.append(self.save_build_data(job['name'], build))
+            await asyncio.gather(*fetched)
+            for build in selected:
+                self.checkpoint("build", build, job=job['name'])
+            self.checkpoint("job", dict(job, builds=stubs))
+        if self.manifest is not None:
+            archived = [build['number'] for build in job['builds'] if 'info' in build]
+            with self.manifest_lock:
+                self.manifest['jobs'][job['name']] = {"last_build": max(archived, default=0)}
+        self.forget_job_reads(job)
+        return job
+
+    async def save_folder_data(self, folder):
+        """
+        Save the configuration of a single folder under its full name (see Jenkins_Helper.save_folder_data)
+
+        Args:
+            folder (dict): The folder entry as returned by crawl_folders.
+
+        Returns:
+            dict: The folder entry.
+        """
+        if folder['name'] in self.checkpoint_items['folders']:
+            print(f"Resuming {folder['name']} from checkpoint ...")
+            return self.checkpoint_items['folders'][folder['name']]
+        print(f"Saving {folder['name']} Info ...")
+        self.save_xml(await self.get_folder_config(folder['name']), folder['name'], "Folder")
+        self.checkpoint("folder", folder)
+        return folder
+
+    async def save_view_data(self, view):
+        """
+        Save the configuration of a single view (see Jenkins_Helper.save_view_data)
+
+        Args:
+            view (dict): The view entry as returned by get_views.
+
+        Returns:
+            dict: The view entry.
+        """
+        if view['name'] in self.checkpoint_items['views']:
+            print(f"Resuming {view['name']} from checkpoint ...")
+            return self.checkpoint_items['views'][view['name']]
+        print(f"Saving {view['name']} Info ...")
+        self.save_xml(await self.get_view_config(view['name']), view['name'], "View")
+        self.checkpoint("view", view)
+        return view
+
+    async def save_node_data(self, node):
+        """
+        Save the configuration of a single node (see Jenkins_Helper.save_node_data)
+
+        Args:
+            node (dict): The node entry as returned by get_all_nodes.
+
+        Returns:
+            dict: The node entry.
+        """
+        if node['name'] in self.checkpoint_items['nodes']:
+            print(f"Resuming {node['name']} from checkpoint ...")
+            return self.checkpoint_items['nodes'][node['name']]
+        print(f"Saving {node['name']} Info ...")
+        self.save_xml(await self.get_node_config(node['name']), node['name'], "Node")
+        self.checkpoint("node", node)
+        return node
+
+    async def save_jenkins_data(self):
+        """
+        Save all Jenkins data, with the same options and output as Jenkins_Helper.save_jenkins_data (ARTIFACTS is rejected in __init__)
+
+        Every folder, job, build, view and node is fetched concurrently; records are written in server order.
+        With FOLDERS, nested folders are crawled level by level, one concurrent round per level.
+        """
+        if self.INCREMENTAL:
+            self.start_incremental_backup()
+        if self.DEDUP:
+            self.start_object_index()
+        with self.checkpoint_scope():
+            catalog = BackupCatalog(self.catalog_file, write=True) if self.CATALOG else None
+            with self.request_scope(), self.archive_scope(), self.test_results_scope(), BackupWriter(self.file_name, self.FORMAT, catalog) as writer:
+                print("Saving Jobs Info ...")
+                folders = []
+                if self.FOLDERS:
+                    folders, jobs = await self.crawl_folders()
+                else:
+                    jobs = await self.harvest_jobs() if self.BULK else await self.get_jobs()
+                for folder in await self.map_concurrently(self.save_folder_data, folders):
+                    writer.write("folders", folder)
+                for job in await self.map_concurrently(self.save_job_data, jobs):
+                    writer.write("jobs", job)
+
+                print("Saving Views Info ...")
+                for view in await self.map_concurrently(self.save_view_data, await self.get_views()):
+                    writer.write("views", view)
+
+                print("Saving Plugins Info ...")
+                plugins = await self.get_plugins()
+                print(f"Saving {len(plugins)} Plugins Info ...")
+                for plugin in plugins:
+                    print(f"Saving {plugin['shortName']} Info ...")
+                    writer.write("plugins", plugin)
+
+                print("Saving Nodes Info ...")
+                for node in await self.map_concurrently(self.save_node_data, await self.get_all_nodes()):
+                    writer.write("nodes", node)
+
+            if self.INCREMENTAL:
+                self.finish_incremental_backup()
+            if self.DEDUP:
+                self.finish_object_index()
+        print("Jenkins data saved successfully")
+
+    async def load_remote_items(self):
+        """
+        Fetch the names of the folders, jobs, views and nodes that already exist on the server, concurrently
+        (see Jenkins_Helper.load_remote_items)
+
+        Returns:
+            dict: The sets of existing names keyed by "Folder", "Job", "View" and "Node".
+        """
+        jobs, views, nodes = await asyncio.gather(self.get_jobs(folder_depth=FOLDER_DEPTH), self.get_views(), self.get_all_nodes())
+        jobs = {job['fullname'] for job in jobs}
+        return {"Folder": jobs, "Job": jobs, "View": {view['name'] for view in views},
+                "Node": {node['name'] for node in nodes}}
+
+    async def restore_config(self, name, type, config):
+        """
+        Create or reconfigure an item only when its configuration differs (see Jenkins_Helper.restore_config)
+
+        Args:
+            name (str): The name of the item.
+            type (str): The type of the item ("Folder", "Job", "View" or "Node").
+            config (str): The backed-up configuration in XML format.
+
+        Returns:
+            str: "created", "updated" or "unchanged".
+        """
+        get_config, create, update = {
+            "Folder": ("get_job_config", self.create_folder, self.update_job),
+            "Job": ("get_job_config", self.create_job, self.update_job),
+            "View": ("get_view_config", self.create_view, self.update_view),
+            "Node": ("get_node_config", self.create_node, self.update_node),
+        }[type]
+        if name not in self.remote_items[type]:
+            await create(name, config)
+            outcome = "created"
+        elif config_fingerprint(await self.read_server(get_config, name=name)) != config_fingerprint(config):
+            await update(name, config)
+            outcome = "updated"
+        else:
+            outcome = "unchanged"
+        self.restore_stats[outcome] = self.restore_stats.get(outcome, 0) + 1
+        return outcome
+
+    async def restore_item(self, item):
+        """
+        Restore a single item of a restore plan (see Jenkins_Helper.restore_item)
+
+        Args:
+            item (tuple): The kind ("node", "folder", "job" or "view") and backup record of the item.
+        """
+        kind, record = item
+        type = {"node": "Node", "view": "View", "folder": "Folder", "job": "Job"}[kind]
+        print(f"Restoring {record['name']} Info ...")
+        config = self.get_xml(record['name'], type)
+        if self.SKIP_UNCHANGED:
+            if await self.restore_config(record['name'], type, config) != "created":
+                return
+        elif kind == "node":
+            await self.create_node(record['name'], config)
+        elif kind == "view":
+            await self.create_view(record['name'], config)
+        elif kind == "folder":
+            await self.create_folder(record['name'], config)
+        else:
+            await self.create_job(record['name'], config)
+        if kind == "job":
+            for build in record['builds'][:self.BUILD_DEPTH + 2]:
+                print(f"Restoring {record['name']} {build['number']} Info ...")
+                await self.build_job(record['name'], build)
+
+    async def restore_jenkins_data(self):
+        """
+        Restore all Jenkins data, with the same options as Jenkins_Helper.restore_jenkins_data
+
+        Plugins are installed as one batch, then each level of the restore plan is restored concurrently.
+        """
+        with self.request_scope():
+            data = self.load_jenkins_data()
+            failed = await self.install_plugins(data['plugins'])
+            if failed:
+                print(f"Failed to install {len(failed)} Plugins: {', '.join(failed)}")
+            if self.SKIP_UNCHANGED:
+                self.remote_items = await self.load_remote_items()
+                self.restore_stats = {}
+            levels = self.plan_restore(data)
+            for index, level in enumerate(levels):
+                print(f"Restoring level {index + 1}/{len(levels)}: {len(level)} items ...")
+                await self.map_concurrently(self.restore_item, level)
+            if self.SKIP_UNCHANGED:
+                print(", ".join(f"{self.restore_stats.get(outcome, 0)} {outcome}" for outcome in ("created", "updated", "unchanged")))
+        print("Jenkins data restored successfully")
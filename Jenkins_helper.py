@@ -1,4 +1,996 @@
-import jenkins, os, argparse, json
+import jenkins, requests, os, io, argparse, json, threading, contextlib, gzip, hashlib, zipfile, time, re, asyncio, collections, fnmatch, sqlite3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from xml.etree import ElementTree
+from concurrent.futures import Future, ThreadPoolExecutor
+
+BULK_BUILD_TREE = ("number,url,result,building,timestamp,duration,estimatedDuration,id,queueId,keepLog,"
+                   "displayName,fullDisplayName,description,builtOn,"
+                   "actions[parameters[name,value],causes[shortDescription,userId,userName]],"
+                   "artifacts[fileName,relativePath,displayPath],fingerprint[fileName,hash],"
+                   "changeSet[kind,items[*,author[fullName],paths[*]]],culprits[fullName]")
+PROGRESSIVE_TEXT = '%(folder_url)sjob/%(short_name)s/%(number)s/logText/progressiveText?start=%(start)s'
+ARTIFACT = '%(folder_url)sjob/%(short_name)s/%(number)s/artifact/%(path)s'
+STREAM_CHUNK_SIZE = 64 * 1024
+# Seconds save_build_console_output keeps following the log of a running build before it saves what it has
+CONSOLE_FOLLOW_TIMEOUT = 10
+# Seconds the long-lived read cache (CACHE_TTL) keeps the results of endpoints that rarely change
+CACHE_TTLS = {"get_plugins": 300, "get_plugin_info": 300, "get_build_test_report": 3600}
+# Folder levels below the top level that select_jobs, load_remote_items and crawl_folders descend into (None for all)
+FOLDER_DEPTH = None
+# Polling rounds an item that left the queue may take to show up as a build before it counts as cancelled
+LEFT_QUEUE_ROUNDS = 2
+QUEUE_TREE = "items[id,inQueueSince,why,blocked,buildable,stuck,params,task[name,url]]"
+BUILD_STATUS_TREE = "number,url,queueId,building,result,duration,timestamp,actions[failCount,skipCount,totalCount]"
+
+def config_fingerprint(config):
+    """
+    Hash an XML configuration so formatting-only differences compare equal
+    
+    The XML declaration is dropped and the document is canonicalized with whitespace-only text removed.
+    Configurations that do not parse fall back to a hash of their stripped text.
+    
+    Args:
+        config (str): The configuration in XML format.
+        
+    Returns:
+        str: The hex SHA-256 digest of the normalized configuration.
+    """
+    config = re.sub(r"^\s*<\?xml[^>]*\?>", "", config)
+    try:
+        config = ElementTree.canonicalize(config, strip_text=True)
+    except ElementTree.ParseError:
+        config = config.strip()
+    return content_hash(config.encode("utf-8"))
+
+def queue_events(previous, current):
+    """
+    Compare two snapshots of the build queue
+    
+    Args:
+        previous (dict): The queue items of the earlier snapshot keyed by ID.
+        current (dict): The queue items of the later snapshot keyed by ID.
+        
+    Returns:
+        list: The (event, item) tuples: "added" and "removed" items, then items that became "blocked" or "stuck".
+    """
+    events = [("added", item) for id, item in current.items() if id not in previous]
+    events += [("removed", item) for id, item in previous.items() if id not in current]
+    for id, item in current.items():
+        for state in ("blocked", "stuck"):
+            if item.get(state) and not previous.get(id, {}).get(state):
+                events.append((state, item))
+    return events
+
+def version_key(version):
+    """
+    Get a sortable key of a plugin version such as "2.10.1" or "1.0-beta-2"
+    
+    Args:
+        version (str): The version.
+        
+    Returns:
+        tuple: The numeric and text parts of the version, numbers sorting before text.
+    """
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.split(r"[.\-_+]", str(version)))
+
+def plugins_to_install(installed, plugins):
+    """
+    Select the plugins of a backup that are missing from the server or older there than in the backup
+    
+    Args:
+        installed (dict): The installed versions keyed by plugin name.
+        plugins (list): The plugin records of a backup, each with a "shortName" and "version".
+        
+    Returns:
+        dict: The versions to install keyed by plugin name ("latest" for records without a version).
+    """
+    missing = {}
+    for plugin in plugins:
+        name, version = plugin['shortName'], plugin.get('version')
+        if name not in installed or (version is not None and version_key(installed[name]) < version_key(version)):
+            missing[name] = "latest" if version is None else str(version)
+    return missing
+
+def plugin_install_status(missing, center):
+    """
+    Sort requested plugins by the state of their update-center jobs
+    
+    Jenkins creates no job for a plugin it does not know or that is already installed in a newer version,
+    so a plugin without a job is skipped instead of waited for.
+    
+    Args:
+        missing (dict): The requested plugins, keyed by name.
+        center (dict): The update center with its jobs[name,status[_class]].
+        
+    Returns:
+        tuple: The names of the plugins still pending, the ones that failed and the ones that were skipped.
+    """
+    statuses = {job['name']: (job.get('status') or {}).get('_class', "") for job in center.get('jobs', []) if job.get('name') in missing}
+    pending = [name for name in missing if name in statuses and statuses[name].endswith(("Pending", "Installing"))]
+    failed = [name for name in missing if statuses.get(name, "").endswith("Failure")]
+    skipped = [name for name in missing if name not in statuses]
+    return pending, failed, skipped
+
+def content_hash(data):
+    """
+    Get the SHA-256 hex digest of a text or bytes value
+    
+    Args:
+        data (str | bytes): The content to hash.
+        
+    Returns:
+        str: The hex digest.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def file_md5(file_name):
+    """
+    Get the MD5 hex digest of a file, read in chunks (Jenkins fingerprints are MD5 digests)
+    
+    Args:
+        file_name (str): The file to hash.
+        
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.md5()
+    with open(file_name, 'rb') as file:
+        for chunk in iter(lambda: file.read(STREAM_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AdaptiveLimiter:
+    def __init__(self, max_concurrency, rps=0, adaptive=True, slowdown=2.0):
+        """
+        Bound the requests sent to the Jenkins server, adapting the concurrency to how the server copes (AIMD).
+        
+        While responses stay fast the concurrency limit grows by one per round of requests (additive increase).
+        It is halved, at most once per round, on a 429 or 503 response, a connection error or when the average
+        latency exceeds `slowdown` times the fastest average seen (multiplicative decrease). An optional token
+        bucket caps the rate at `rps` requests per second.
+        
+        Args:
+            max_concurrency (int): The highest number of requests in flight.
+            rps (float, optional): The highest number of requests started per second (0 for no ceiling). Defaults to 0.
+            adaptive (bool, optional): Adapt the concurrency; when False it stays at max_concurrency. Defaults to True.
+            slowdown (float, optional): The latency ratio to the fastest average that counts as a slowdown. Defaults to 2.0.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(max(1, self.max_concurrency // 4)) if adaptive else float(self.max_concurrency)
+        self.adaptive = adaptive
+        self.rps = rps
+        self.slowdown = slowdown
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.latency = None
+        self.fastest = None
+        self.last_decrease = 0.0
+        self.requests = 0
+        self.decreases = 0
+        self.peak = self.limit
+        
+    def try_acquire(self):
+        """
+        Take a slot if the concurrency limit allows it
+        
+        Returns:
+            float: The number of seconds to wait before sending (for the rate ceiling), or None if no slot is free.
+        """
+        with self.condition:
+            if self.in_flight >= int(self.limit):
+                return None
+            self.in_flight += 1
+            self.requests += 1
+            if not self.rps:
+                return 0.0
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + 1.0 / self.rps
+            return start - now
+        
+    def acquire(self):
+        """
+        Block until a request may be sent
+        """
+        while True:
+            delay = self.try_acquire()
+            if delay is not None:
+                break
+            with self.condition:
+                self.condition.wait(0.05)
+        if delay:
+            time.sleep(delay)
+            
+    async def acquire_async(self):
+        """
+        Wait without blocking the event loop until a request may be sent
+        """
+        while True:
+            delay = self.try_acquire()
+            if delay is not None:
+                break
+            await asyncio.sleep(0.005)
+        if delay:
+            await asyncio.sleep(delay)
+    
+    def release(self, latency, overloaded=False):
+        """
+        Free a slot and adapt the concurrency limit to the outcome of the request
+        
+        Args:
+            latency (float): The number of seconds the request took.
+            overloaded (bool, optional): True if the server answered 429/503 or the request failed to connect. Defaults to False.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            self.fastest = self.latency if self.fastest is None else min(self.fastest, self.latency)
+            if self.adaptive:
+                now = time.monotonic()
+                slow = self.latency > self.slowdown * self.fastest and self.latency > 0.05
+                if overloaded or slow:
+                    # one decrease per round trip, or a burst of slow responses collapses the limit
+                    if now - self.last_decrease > self.latency:
+                        self.limit = max(1.0, self.limit / 2)
+                        self.last_decrease = now
+                        self.decreases += 1
+                else:
+                    self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+                    self.peak = max(self.peak, self.limit)
+            self.condition.notify_all()
+
+class RequestMetrics:
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self):
+        """
+        Count the calls made to the Jenkins client per endpoint (the jenkins.Jenkins method) and per phase.
+        
+        For every endpoint and phase it records calls, errors, HTTP requests, bytes received and the time spent,
+        and for every endpoint a latency histogram. The phase ("jobs", "builds", "views", "plugins", "nodes")
+        is set per thread with the phase() context manager.
+        """
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.endpoints = {}
+        self.phases = {}
+    
+    @staticmethod
+    def new_stats():
+        return {"calls": 0, "errors": 0, "http_requests": 0, "bytes": 0, "seconds": 0.0}
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Attribute the calls made by this thread inside the block to a phase
+        
+        Args:
+            name (str): The name of the phase.
+        """
+        previous = getattr(self.local, 'phase', None)
+        self.local.phase = name
+        try:
+            yield
+        finally:
+            self.local.phase = previous
+    
+    @contextlib.contextmanager
+    def measure(self, endpoint):
+        """
+        Time one call of an endpoint and record it, as an error if the block raises
+        
+        Args:
+            endpoint (str): The name of the endpoint.
+        """
+        previous = getattr(self.local, 'endpoint', None)
+        self.local.endpoint = endpoint
+        started = time.monotonic()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.local.endpoint = previous
+            seconds = time.monotonic() - started
+            with self.lock:
+                stats = self.endpoints.setdefault(endpoint, dict(self.new_stats(), buckets=[0] * (len(self.BUCKETS) + 1)))
+                phase = self.phases.setdefault(getattr(self.local, 'phase', None) or "other", self.new_stats())
+                for record in (stats, phase):
+                    record['calls'] += 1
+                    record['errors'] += failed
+                    record['seconds'] += seconds
+                stats['buckets'][next((index for index, bound in enumerate(self.BUCKETS) if seconds <= bound), len(self.BUCKETS))] += 1
+    
+    def add_response(self, size, attempts=1):
+        """
+        Record an HTTP response received for the endpoint this thread is calling
+        
+        Args:
+            size (int): The size of the response body in bytes.
+            attempts (int, optional): The number of HTTP requests sent for it, including retries. Defaults to 1.
+        """
+        endpoint = getattr(self.local, 'endpoint', None) or "connect"
+        with self.lock:
+            stats = self.endpoints.setdefault(endpoint, dict(self.new_stats(), buckets=[0] * (len(self.BUCKETS) + 1)))
+            phase = self.phases.setdefault(getattr(self.local, 'phase', None) or "other", self.new_stats())
+            for record in (stats, phase):
+                record['http_requests'] += attempts
+                record['bytes'] += size
+    
+    def summary(self):
+        """
+        Get a snapshot of the metrics
+        
+        Returns:
+            dict: The "endpoints" and "phases" statistics; histogram buckets are keyed by their upper bound.
+        """
+        with self.lock:
+            endpoints = {}
+            for endpoint, stats in sorted(self.endpoints.items()):
+                endpoints[endpoint] = {key: value for key, value in stats.items() if key != 'buckets'}
+                endpoints[endpoint]['histogram'] = dict(zip([str(bound) for bound in self.BUCKETS] + ["+Inf"], stats['buckets']))
+            return {"endpoints": endpoints, "phases": {phase: dict(stats) for phase, stats in sorted(self.phases.items())}}
+    
+    def to_prometheus(self, prefix="jenkins_helper"):
+        """
+        Render the metrics in the Prometheus text exposition format
+        
+        Args:
+            prefix (str, optional): The prefix of the metric names. Defaults to "jenkins_helper".
+            
+        Returns:
+            str: The metrics.
+        """
+        summary = self.summary()
+        lines = []
+        for name, key, help in (("requests_total", "calls", "Calls of the Jenkins client"),
+                                ("errors_total", "errors", "Calls of the Jenkins client that raised"),
+                                ("http_requests_total", "http_requests", "HTTP requests sent, including retries"),
+                                ("received_bytes_total", "bytes", "Bytes of the HTTP responses received")):
+            for label, records in (("endpoint", summary['endpoints']), ("phase", summary['phases'])):
+                metric = f"{prefix}_{label}_{name}"
+                lines += [f"# HELP {metric} {help} by {label}.", f"# TYPE {metric} counter"]
+                lines += [f'{metric}{{{label}="{value}"}} {stats[key]}' for value, stats in records.items()]
+        metric = f"{prefix}_phase_duration_seconds_total"
+        lines += [f"# HELP {metric} Time spent in calls of the Jenkins client by phase.", f"# TYPE {metric} counter"]
+        lines += [f'{metric}{{phase="{phase}"}} {stats["seconds"]:.6f}' for phase, stats in summary['phases'].items()]
+        metric = f"{prefix}_request_duration_seconds"
+        lines += [f"# HELP {metric} Latency of the calls of the Jenkins client by endpoint.", f"# TYPE {metric} histogram"]
+        for endpoint, stats in summary['endpoints'].items():
+            count = 0
+            for bound, value in stats['histogram'].items():
+                count += value
+                lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+            lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {stats["seconds"]:.6f}')
+            lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {stats["calls"]}')
+        return "\n".join(lines) + "\n"
+    
+    def export(self, file_name):
+        """
+        Write the metrics to a file: a Prometheus textfile if the name ends with ".prom", a JSON summary otherwise
+        
+        The file is replaced atomically, so a textfile collector never reads it half written.
+        
+        Args:
+            file_name (str): The path of the file.
+        """
+        with open(file_name + ".part", 'w') as file:
+            if file_name.endswith(".prom"):
+                file.write(self.to_prometheus())
+            else:
+                json.dump(self.summary(), file, indent=2)
+        os.replace(file_name + ".part", file_name)
+
+class InstrumentedServer:
+    def __init__(self, server, metrics):
+        """
+        Wrap a jenkins.Jenkins client so every public method call is recorded in a RequestMetrics.
+        Private helpers and attributes are passed through unchanged.
+        
+        Args:
+            server (jenkins.Jenkins): The client to wrap.
+            metrics (RequestMetrics): The metrics to record the calls in.
+        """
+        object.__setattr__(self, "_server", server)
+        object.__setattr__(self, "_metrics", metrics)
+        
+    def __getattr__(self, name):
+        attribute = getattr(self._server, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        def call(*args, **kwargs):
+            with self._metrics.measure(name):
+                return attribute(*args, **kwargs)
+        return call
+    
+    def __setattr__(self, name, value):
+        setattr(self._server, name, value)
+
+class JenkinsTransport(HTTPAdapter):
+    """
+    HTTP adapter with a sized keep-alive connection pool, separate connect and read timeouts and retries
+    
+    Idempotent requests (GET and HEAD) are retried on connection errors, read errors and 429/502/503/504
+    responses with jittered exponential backoff (honouring Retry-After). Other methods are only retried
+    when the connection could not be established, so a POST is never sent twice.
+    With a limiter every request waits for a slot of the AdaptiveLimiter and reports its latency to it,
+    with metrics every response is recorded in the RequestMetrics.
+    """
+    
+    def __init__(self, pool_size=10, connect_timeout=10, retries=3, backoff=0.5, limiter=None, metrics=None):
+        """
+        Args:
+            pool_size (int): The number of keep-alive connections kept open to the server. Default is 10.
+            connect_timeout (float): The number of seconds to wait for a connection. Default is 10.
+            retries (int): The number of retries of a failed request. Default is 3.
+            backoff (float): The base delay in seconds of the exponential backoff. Default is 0.5.
+            limiter (AdaptiveLimiter, optional): The limiter bounding the requests. Defaults to None.
+            metrics (RequestMetrics, optional): The metrics recording the responses. Defaults to None.
+        """
+        self.connect_timeout = connect_timeout
+        self.limiter = limiter
+        self.metrics = metrics
+        retry = Retry(total=retries, connect=retries, read=retries, status=retries, other=0,
+                      backoff_factor=backoff, backoff_jitter=backoff, status_forcelist=(429, 502, 503, 504),
+                      allowed_methods=frozenset({"GET", "HEAD"}), raise_on_status=False)
+        super().__init__(pool_connections=1, pool_maxsize=pool_size, pool_block=True, max_retries=retry)
+    
+    def send(self, request, timeout=None, **kwargs):
+        """
+        Send a request, splitting a single timeout into (connect_timeout, timeout)
+        """
+        if timeout is not None and not isinstance(timeout, tuple):
+            timeout = (self.connect_timeout, timeout)
+        if self.limiter is None:
+            return self.record(super().send(request, timeout=timeout, **kwargs), kwargs.get('stream'))
+        self.limiter.acquire()
+        started = time.monotonic()
+        overloaded = True
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+            retries = getattr(response.raw, 'retries', None)
+            statuses = [response.status_code] + [error.status for error in getattr(retries, 'history', ())]
+            overloaded = any(status in (429, 503) for status in statuses)
+            return self.record(response, kwargs.get('stream'))
+        finally:
+            self.limiter.release(time.monotonic() - started, overloaded)
+            
+    def record(self, response, stream=False):
+        """
+        Record a response and its retries in the metrics (streamed bodies are counted by their Content-Length)
+        
+        Returns:
+            requests.Response: The response.
+        """
+        if self.metrics is not None:
+            retries = getattr(response.raw, 'retries', None)
+            self.metrics.add_response(int(response.headers.get('Content-Length') or 0) if stream else len(response.content),
+                                      1 + len(getattr(retries, 'history', ())))
+        return response
+
+class RequestCache:
+    def __init__(self, ttl=None, max_entries=None, ttls=None):
+        """
+        Memoize Jenkins server reads, for the duration of one backup or restore run or, with a ttl, for a long-lived helper.
+        Concurrent callers asking for the same endpoint and parameters share a single request.
+        
+        Args:
+            ttl (float, optional): Seconds a result stays fresh. Defaults to None (results never expire and errors are cached).
+            max_entries (int, optional): Evict the least recently used results beyond this number. Defaults to None (unbounded).
+            ttls (dict, optional): Seconds a result stays fresh per endpoint, overriding ttl. Defaults to None.
+        """
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+        
+    def get(self, key, fetch):
+        """
+        Get the cached result for a key, calling fetch the first time the key is seen or once its result expired
+        
+        Args:
+            key (tuple): The endpoint and parameters of the request.
+            fetch (callable): The function that performs the request.
+            
+        Returns:
+            object: The result of the request. Without a ttl errors are cached and raised again.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self.entries[key]
+                entry = None
+                self.expired += 1
+            owner = entry is None
+            if owner:
+                future = Future()
+                self.store(key, future)
+                self.misses += 1
+            else:
+                future = entry[0]
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if owner:
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                future.set_exception(e)
+                if self.ttl is not None:
+                    with self.lock:
+                        if self.entries.get(key, (None,))[0] is future:
+                            del self.entries[key]
+        return future.result()
+    
+    def lookup(self, key):
+        """
+        Get the cached result for a key without fetching it, for callers that fetch on their own (e.g. coroutines)
+        
+        Args:
+            key (tuple): The endpoint and parameters of the request.
+            
+        Returns:
+            Future: The resolved future of the result, or None if the key is not cached or its result expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self.entries[key]
+                entry = None
+                self.expired += 1
+            if entry is None or not entry[0].done():
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, value):
+        """
+        Store a result obtained elsewhere (e.g. a bulk query) unless the key is already cached
+        
+        Args:
+            key (tuple): The endpoint and parameters of the request.
+            value (object): The result to return for the request.
+        """
+        with self.lock:
+            if key not in self.entries:
+                future = Future()
+                future.set_result(value)
+                self.store(key, future)
+                
+    def store(self, key, future):
+        """
+        Add an entry with its expiry time and evict the least recently used entries beyond max_entries (lock held)
+        """
+        ttl = self.ttls.get(key[0], self.ttl)
+        self.entries[key] = (future, None if ttl is None else time.monotonic() + ttl)
+        while self.max_entries is not None and len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+    
+    @staticmethod
+    def key(endpoint, params):
+        """
+        Build the cache key of a request
+        
+        Args:
+            endpoint (str): The name of the jenkins.Jenkins method.
+            params (dict): The keyword arguments of the call.
+            
+        Returns:
+            tuple: The cache key.
+        """
+        return (endpoint, tuple(sorted(params.items())))
+    
+    def discard(self, key):
+        """
+        Forget a cached result, e.g. once a streamed job has been written
+        
+        Args:
+            key (tuple): The endpoint and parameters of the request.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+            
+    def invalidate(self, names=()):
+        """
+        Forget the results a write to the named items may have changed
+        
+        The results of every listing (a request without a name parameter) are dropped as well as the results
+        about the named items and, for folders, about the items inside them.
+        
+        Args:
+            names (iterable, optional): The names of the written jobs, folders, views, nodes or plugins. Defaults to none.
+        """
+        names = [str(name) for name in names]
+        def stale(key):
+            params = dict(key[1])
+            if "name" not in params:
+                return True
+            name = str(params["name"])
+            return any(name == written or name.startswith(written + "/") for written in names)
+        with self.lock:
+            for key in [key for key in self.entries if stale(key)]:
+                del self.entries[key]
+                self.invalidations += 1
+                
+    def stats(self):
+        """
+        Get the statistics of the cache
+        
+        Returns:
+            dict: The hits, misses, expired, evicted and invalidated results, the number of entries and the hit ratio.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "expired": self.expired, "evictions": self.evictions,
+                    "invalidations": self.invalidations, "entries": len(self.entries),
+                    "hit_ratio": self.hits / lookups if lookups else 0.0}
+
+class BackupWriter:
+    SECTIONS = ("jobs", "views", "plugins", "nodes", "folders")
+    
+    def __init__(self, file_name, format="json", catalog=None):
+        """
+        Write backup records to a file, either as one JSON document or as JSON Lines.
+        In JSON Lines mode every job, build, view, plugin and node is written and flushed as soon as it is received,
+        so memory use does not grow with the size of the controller. The lines go to a temporary file that replaces
+        the previous backup once it is complete.
+        
+        Args:
+            file_name (str): The backup file to write.
+            format (str, optional): "json" or "jsonl". Defaults to "json".
+            catalog (BackupCatalog, optional): A catalog that also receives every record. Defaults to None.
+        """
+        self.file_name = file_name
+        self.format = format
+        self.catalog = catalog
+        self.lock = threading.Lock()
+        self.data = {section: [] for section in self.SECTIONS}
+        self.file = open(file_name + ".part", 'w') if format == "jsonl" else None
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(complete=exc_type is None)
+        
+    def write(self, section, record):
+        """
+        Write one record of a backup section
+        
+        Args:
+            section (str): The section of the record ("jobs", "views", "plugins", "nodes" or "folders").
+            record (dict): The record to write. Jobs are split into a job line and one line per build.
+        """
+        with self.lock:
+            if self.catalog is not None:
+                self.catalog.add(section, record)
+            if self.file is None:
+                self.data[section].append(record)
+                return
+            if section == "jobs":
+                job = dict(record)
+                builds = job.pop('builds', [])
+                self.write_line({"type": "job", "data": job})
+                for build in builds:
+                    self.write_line({"type": "build", "job": job['name'], "data": build})
+            else:
+                self.write_line({"type": section[:-1], "data": record})
+            self.file.flush()
+            
+    def write_line(self, line):
+        self.file.write(json.dumps(line) + "\n")
+        
+    def close(self, complete=True):
+        """
+        Finish the backup file
+        
+        Args:
+            complete (bool, optional): False if the backup failed; the previous backup file is then kept. Defaults to True.
+        """
+        if self.file is not None:
+            self.file.close()
+            if complete:
+                os.replace(self.file_name + ".part", self.file_name)
+        elif complete:
+            with open(self.file_name, 'w') as file:
+                json.dump(self.data, file)
+        if self.catalog is not None:
+            self.catalog.close(complete)
+    
+    @classmethod
+    def read(cls, file, format="json"):
+        """
+        Read a backup file written by BackupWriter
+        
+        Args:
+            file (file): The backup file, opened in text mode.
+            format (str, optional): "json" or "jsonl". Defaults to "json".
+            
+        Returns:
+            dict: The backup data with "jobs", "views", "plugins", "nodes" and "folders" lists.
+        """
+        if format != "jsonl":
+            data = json.load(file)
+            data.setdefault("folders", [])
+            return data
+        data = {section: [] for section in cls.SECTIONS}
+        jobs = {}
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record['type'] == "build":
+                jobs[record['job']]['builds'].append(record['data'])
+            elif record['type'] == "job":
+                job = jobs[record['data']['name']] = record['data']
+                job['builds'] = []
+                data['jobs'].append(job)
+            else:
+                data[record['type'] + "s"].append(record['data'])
+        return data
+
+def sqlite_rows(connection, lock, sql, params=()):
+    """
+    Run a read-only query on a shared SQLite connection
+    
+    Args:
+        connection (sqlite3.Connection): The connection.
+        lock (threading.Lock): The lock guarding the connection.
+        sql (str): The SQL query.
+        params (tuple, optional): The query parameters. Defaults to ().
+        
+    Returns:
+        list: The rows as dicts keyed by column name.
+    """
+    with lock:
+        cursor = connection.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+class TestResultStore:
+    # pass/fail outcome of the Jenkins case statuses, for finding tests that flipped
+    OUTCOME = "CASE WHEN status IN ('PASSED', 'FIXED') THEN 'pass' WHEN status IN ('FAILED', 'REGRESSION') THEN 'fail' ELSE status END"
+    
+    def __init__(self, file_name):
+        """
+        Keep the test cases of backed-up builds as one flat SQLite table, written build by build during a backup,
+        so flaky or slow tests can be found without loading the test reports of the backup file.
+        
+        Args:
+            file_name (str): The SQLite database file. It is created if missing and reused by later backups.
+        """
+        self.file_name = file_name
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(file_name, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS test_results (
+                job TEXT NOT NULL, build INTEGER NOT NULL, suite TEXT NOT NULL, class_name TEXT NOT NULL, name TEXT NOT NULL,
+                status TEXT, duration REAL, PRIMARY KEY (job, build, suite, class_name, name)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS test_builds (job TEXT NOT NULL, build INTEGER NOT NULL, PRIMARY KEY (job, build)) WITHOUT ROWID;
+        """)
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def add(self, job_name, build_number, report):
+        """
+        Flatten the test report of a build into one row per case, replacing the rows of an earlier run
+        
+        Args:
+            job_name (str): The name of the job.
+            build_number (int): The number of the build.
+            report (dict): The test report as returned by get_build_test_report.
+            
+        Returns:
+            int: The number of cases written.
+        """
+        rows = [(job_name, build_number, suite.get('name') or "", case.get('className') or "", case['name'],
+                 case.get('status'), case.get('duration'))
+                for suite in (report or {}).get('suites', []) for case in suite.get('cases', [])]
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM test_results WHERE job = ? AND build = ?", (job_name, build_number))
+            self.connection.execute("INSERT OR IGNORE INTO test_builds VALUES (?, ?)", (job_name, build_number))
+            self.connection.executemany("INSERT OR REPLACE INTO test_results VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+    
+    def query(self, sql, params=()):
+        """
+        Run a read-only query
+        
+        Args:
+            sql (str): The SQL query on the test_results table.
+            params (tuple, optional): The query parameters. Defaults to ().
+            
+        Returns:
+            list: The rows as dicts.
+        """
+        return sqlite_rows(self.connection, self.lock, sql, params)
+    
+    def recent(self, job_name=None, builds=50):
+        """
+        Get the SQL of the rows of the last builds of every job, or of one job
+        
+        Args:
+            job_name (str, optional): Only select this job. Defaults to None (every job).
+            builds (int, optional): The number of recent builds of every job to select. Defaults to 50.
+            
+        Returns:
+            tuple: The SQL of the subquery and its parameters.
+        """
+        sql = ("SELECT job, build, ROW_NUMBER() OVER (PARTITION BY job ORDER BY build DESC) AS age FROM test_builds"
+               + (" WHERE job = ?" if job_name is not None else ""))
+        params = (job_name,) if job_name is not None else ()
+        return (f"SELECT test_results.*, age FROM ({sql}) AS recent JOIN test_results USING (job, build) WHERE age <= ?",
+                params + (builds,))
+    
+    def slowest_tests(self, job_name=None, builds=50, limit=20):
+        """
+        Get the tests with the highest average duration over the last builds
+        
+        Args:
+            job_name (str, optional): Only look at this job. Defaults to None (every job).
+            builds (int, optional): The number of recent builds of every job to look at. Defaults to 50.
+            limit (int, optional): The number of tests to return. Defaults to 20.
+            
+        Returns:
+            list: The job, suite, class name, name, runs, average and maximum duration of each test, slowest first.
+        """
+        sql, params = self.recent(job_name, builds)
+        return self.query(f"SELECT job, suite, class_name, name, COUNT(*) AS runs, AVG(duration) AS average_duration, "
+                          f"MAX(duration) AS max_duration FROM ({sql}) GROUP BY job, suite, class_name, name "
+                          f"ORDER BY average_duration DESC LIMIT ?", params + (limit,))
+    
+    def flipped_tests(self, job_name=None, builds=50, limit=20):
+        """
+        Get the tests whose outcome changed between consecutive builds, most flips first
+        
+        Args:
+            job_name (str, optional): Only look at this job. Defaults to None (every job).
+            builds (int, optional): The number of recent builds of every job to look at. Defaults to 50.
+            limit (int, optional): The number of tests to return. Defaults to 20.
+            
+        Returns:
+            list: The job, suite, class name, name, runs, number of flips and last status of each test that flipped at least once.
+        """
+        sql, params = self.recent(job_name, builds)
+        return self.query(f"""
+            SELECT job, suite, class_name, name, COUNT(*) AS runs, SUM(outcome != previous) AS flips,
+                   MAX(CASE WHEN age = 1 THEN status END) AS last_status
+            FROM (SELECT *, {self.OUTCOME} AS outcome,
+                         LAG({self.OUTCOME}) OVER (PARTITION BY job, suite, class_name, name ORDER BY build) AS previous
+                  FROM ({sql}))
+            GROUP BY job, suite, class_name, name HAVING flips > 0 ORDER BY flips DESC, runs DESC LIMIT ?""", params + (limit,))
+    
+    def close(self):
+        """
+        Close the database
+        """
+        with self.lock:
+            self.connection.close()
+
+class BackupCatalog:
+    SCHEMA = """
+        CREATE TABLE jobs (name TEXT PRIMARY KEY, class TEXT, url TEXT, color TEXT, last_build INTEGER, data TEXT);
+        CREATE TABLE builds (job TEXT NOT NULL, number INTEGER NOT NULL, result TEXT, building INTEGER, timestamp INTEGER,
+                             duration INTEGER, built_on TEXT, url TEXT, data TEXT, PRIMARY KEY (job, number));
+        CREATE TABLE folders (name TEXT PRIMARY KEY, parent TEXT, url TEXT, data TEXT);
+        CREATE TABLE views (name TEXT PRIMARY KEY, url TEXT, data TEXT);
+        CREATE TABLE nodes (name TEXT PRIMARY KEY, offline INTEGER, data TEXT);
+        CREATE TABLE plugins (name TEXT PRIMARY KEY, version TEXT, enabled INTEGER, data TEXT);
+        CREATE INDEX builds_result ON builds (result, timestamp);
+        CREATE INDEX builds_timestamp ON builds (timestamp);
+        CREATE INDEX builds_built_on ON builds (built_on, timestamp);
+    """
+    
+    def __init__(self, file_name, write=False):
+        """
+        An indexed SQLite catalog of a backup, so questions about jobs, builds, views, nodes and plugins
+        can be answered without loading the backup file.
+        
+        A catalog being written goes to a temporary file that replaces the previous catalog once the backup is complete,
+        like the backup file itself.
+        
+        Args:
+            file_name (str): The SQLite database file.
+            write (bool, optional): Create a new catalog instead of opening an existing one read-only. Defaults to False.
+        """
+        self.file_name = file_name
+        self.write = write
+        self.lock = threading.Lock()
+        if write:
+            if os.path.exists(file_name + ".part"):
+                os.remove(file_name + ".part")
+            self.connection = sqlite3.connect(file_name + ".part", check_same_thread=False)
+            self.connection.executescript(self.SCHEMA)
+        else:
+            self.connection = sqlite3.connect(f"file:{file_name}?mode=ro", uri=True, check_same_thread=False)
+            
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(complete=exc_type is None)
+        
+    def add(self, section, record):
+        """
+        Add one record of a backup section
+        
+        Args:
+            section (str): The section of the record ("jobs", "views", "plugins", "nodes" or "folders").
+            record (dict): The record as written to the backup file. The builds of a job go to the builds table.
+        """
+        if section == "jobs":
+            job = {key: value for key, value in record.items() if key != 'builds'}
+            builds = record.get('builds', [])
+            archived = [build['number'] for build in builds if 'info' in build]
+            rows = [(record['name'], build['number'], build.get('info', {}).get('result'), build.get('info', {}).get('building'),
+                     build.get('info', {}).get('timestamp'), build.get('info', {}).get('duration'),
+                     build.get('info', {}).get('builtOn'), build.get('url'), json.dumps(build.get('info')))
+                    for build in builds]
+            with self.lock:
+                self.connection.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)",
+                                        (record['name'], record.get('_class'), record.get('url'), record.get('color'),
+                                         max(archived, default=None), json.dumps(job)))
+                self.connection.executemany("INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            return
+        row = {
+            "folders": lambda: (record['name'], record.get('parent'), record.get('url')),
+            "views": lambda: (record['name'], record.get('url')),
+            "nodes": lambda: (record['name'], record.get('offline')),
+            "plugins": lambda: (record['shortName'], str(record.get('version')), record.get('enabled')),
+        }[section]() + (json.dumps(record),)
+        with self.lock:
+            self.connection.execute(f"INSERT OR REPLACE INTO {section} VALUES ({', '.join('?' * len(row))})", row)
+            
+    def query(self, sql, params=()):
+        """
+        Run a read-only query
+        
+        Args:
+            sql (str): The SQL query on the catalog tables.
+            params (tuple, optional): The query parameters. Defaults to ().
+            
+        Returns:
+            list: The rows as dicts. The 'data' column is decoded from JSON.
+        """
+        rows = sqlite_rows(self.connection, self.lock, sql, params)
+        for row in rows:
+            if row.get('data') is not None:
+                row['data'] = json.loads(row['data'])
+        return rows
+    
+    def close(self, complete=True):
+        """
+        Close the catalog
+        
+        Args:
+            complete (bool, optional): False if the backup failed; the previous catalog is then kept. Defaults to True.
+        """
+        with self.lock:
+            if self.write and complete:
+                self.connection.commit()
+            self.connection.close()
+        if self.write:
+            if complete:
+                os.replace(self.file_name + ".part", self.file_name)
+            else:
+                os.remove(self.file_name + ".part")
 
 class Jenkins_Helper:
     def __init__(self,args):
@@ -11,6 +1003,29 @@ class Jenkins_Helper:
             --JENKINS_PASSWORD (str): The Jenkins server JENKINS_PASSWORD. Default is "admin".
             --FILE_NAME (str): The Jenkins data file name. Default is "jenkins_data.json".
             --BUILD_DEPTH (int): The number of builds to backup or restore. Default is 3.
+            --WORKERS (int): The number of concurrent requests used by the backup and restore. Default is 1.
+            --BULK (bool): Harvest jobs and builds with a few tree= queries per folder. Default is False.
+            --FORMAT (str): The backup file format, "json" or "jsonl" (streamed, one record per line). Default is "json".
+            --CONSOLE_FILES (bool): Stream console logs into gzip files under Console/ instead of the backup file. Default is False.
+            --INCREMENTAL (bool): Only fetch new builds and rewrite changed configs, using the manifest of the previous backup. Default is False.
+            --DEDUP (bool): Store configs and console logs once per content hash under objects/, referenced by a snapshot index. Default is False.
+            --ARCHIVE (bool): Write the whole backup into one zip archive with a member index (takes precedence over DEDUP). Default is False.
+            --RESUME (bool): Continue a failed backup from its checkpoint instead of starting over. Default is False.
+            --SKIP_UNCHANGED (bool): Restore only the jobs, views and nodes whose remote configuration differs from the backup. Default is False.
+            --POOL_SIZE (int): The number of keep-alive connections to the server (0 uses max(10, WORKERS)). Default is 0.
+            --CONNECT_TIMEOUT (float): The number of seconds to wait for a connection. Default is 10.
+            --READ_TIMEOUT (float): The number of seconds to wait for a response. Default is 60.
+            --RETRIES (int): The number of retries of a failed idempotent request. Default is 3.
+            --BACKOFF (float): The base delay in seconds of the jittered exponential retry backoff. Default is 0.5.
+            --ADAPTIVE (bool): Adapt the number of concurrent requests (up to POOL_SIZE) to the server's latency and errors. Default is False.
+            --MAX_RPS (float): The highest number of requests per second sent to the server (0 for no ceiling). Default is 0.
+            --METRICS (str): Write the request metrics of each backup or restore to this file (".prom" for a Prometheus textfile, JSON otherwise). Default is None.
+            --FOLDERS (bool): Crawl nested folders level by level and back up the jobs inside them under their full names. Default is False.
+            --CACHE_TTL (float): Keep the results of read methods for this many seconds between calls (0 disables the long-lived cache). Default is 0.
+            --CACHE_SIZE (int): The largest number of results kept by the long-lived cache, least recently used first out. Default is 1024.
+            --ARTIFACTS (bool): Download the artifacts of the backed-up builds into Artifacts/, verified against their fingerprints. Default is False.
+            --TEST_RESULTS (bool): Write the test cases of the backed-up builds into a SQLite table next to the backup file. Default is False.
+            --CATALOG (bool): Write an indexed SQLite catalog of the jobs, builds, folders, views, nodes and plugins next to the backup file. Default is False.
         """
         #==============================================================
         #==============================================================
@@ -19,23 +1034,96 @@ class Jenkins_Helper:
         self.JENKINS_PASSWORD = args.JENKINS_PASSWORD
         self.file_name = args.FILE_NAME
         self.BUILD_DEPTH = args.BUILD_DEPTH
+        self.WORKERS = max(1, getattr(args, "WORKERS", 1))
+        self.BULK = getattr(args, "BULK", False)
+        self.FORMAT = getattr(args, "FORMAT", "json")
+        self.CONSOLE_FILES = getattr(args, "CONSOLE_FILES", False)
+        self.INCREMENTAL = getattr(args, "INCREMENTAL", False)
+        self.ARCHIVE = getattr(args, "ARCHIVE", False)
+        self.DEDUP = getattr(args, "DEDUP", False) and not self.ARCHIVE
+        self.RESUME = getattr(args, "RESUME", False)
+        if self.RESUME and self.ARCHIVE:
+            raise Exception("RESUME is not supported with ARCHIVE: a failed archive is discarded")
+        self.request_cache = None
+        self.long_lived_cache = None
+        self.request_cache_stats = {"hits": 0, "misses": 0}
         #==============================================================
         #==============================================================
         curent_path = os.path.dirname(os.path.realpath(__file__))
         self.file_path = os.path.join(curent_path, "jenkins_data")
         os.makedirs(self.file_path, exist_ok=True)
         self.file_name = os.path.join(self.file_path, self.file_name)
-        #============================================================== 
-        #==============================================================  
+        self.manifest_file = os.path.splitext(self.file_name)[0] + "_manifest.json"
+        self.manifest = None
+        self.previous_manifest = None
+        self.previous_builds = {}
+        self.manifest_lock = threading.Lock()
+        self.index_file = os.path.splitext(self.file_name)[0] + "_index.json"
+        self.object_index = None
+        self.previous_object_index = {}
+        self.index_lock = threading.Lock()
+        self.archive_file = os.path.splitext(self.file_name)[0] + ".zip"
+        self.archive_writer = None
+        self.archive_reader = None
+        self.archive_lock = threading.Lock()
+        self.checkpoint_file = os.path.splitext(self.file_name)[0] + "_checkpoint.jsonl"
+        self.checkpoint_journal = None
+        self.checkpoint_jobs = {}
+        self.checkpoint_builds = {}
+        self.checkpoint_items = {"folders": {}, "views": {}, "nodes": {}}
+        self.checkpoint_lock = threading.Lock()
+        #==============================================================
+        self.SKIP_UNCHANGED = getattr(args, "SKIP_UNCHANGED", False)
+        self.remote_items = None
+        self.restore_stats = {}
+        self.restore_lock = threading.Lock()
+        #==============================================================
+        self.POOL_SIZE = getattr(args, "POOL_SIZE", 0) or max(10, self.WORKERS)
+        self.CONNECT_TIMEOUT = getattr(args, "CONNECT_TIMEOUT", 10)
+        self.READ_TIMEOUT = getattr(args, "READ_TIMEOUT", 60)
+        self.RETRIES = getattr(args, "RETRIES", 3)
+        self.BACKOFF = getattr(args, "BACKOFF", 0.5)
+        self.ADAPTIVE = getattr(args, "ADAPTIVE", False)
+        self.MAX_RPS = getattr(args, "MAX_RPS", 0)
+        self.METRICS = getattr(args, "METRICS", None)
+        self.FOLDERS = getattr(args, "FOLDERS", False)
+        #==============================================================
+        self.CACHE_TTL = getattr(args, "CACHE_TTL", 0)
+        self.CACHE_SIZE = getattr(args, "CACHE_SIZE", 1024)
+        self.ARTIFACTS = getattr(args, "ARTIFACTS", False)
+        self.artifacts_file = os.path.splitext(self.file_name)[0] + "_artifacts.json"
+        self.artifacts = None
+        self.artifacts_pool = None
+        self.artifacts_lock = threading.Lock()
+        self.TEST_RESULTS = getattr(args, "TEST_RESULTS", False)
+        self.test_results_file = os.path.splitext(self.file_name)[0] + "_tests.sqlite"
+        self.test_results = None
+        self.CATALOG = getattr(args, "CATALOG", False)
+        self.catalog_file = os.path.splitext(self.file_name)[0] + "_catalog.sqlite"
+        if self.CACHE_TTL:
+            self.long_lived_cache = RequestCache(ttl=self.CACHE_TTL, max_entries=self.CACHE_SIZE, ttls=CACHE_TTLS)
+            self.request_cache = self.long_lived_cache
+        self.metrics = RequestMetrics()
+        self.limiter = None
+        if self.ADAPTIVE or self.MAX_RPS:
+            self.limiter = AdaptiveLimiter(self.POOL_SIZE, rps=self.MAX_RPS, adaptive=self.ADAPTIVE)
+        #==============================================================
+        #==============================================================
+        self.login()
+        
+    def login(self):
+        """
+        Connect to the Jenkins server with the configured credentials and check them
+        """
         if self.JENKINS_USERNAME is None or self.JENKINS_PASSWORD is None:
-            self.server = jenkins.Jenkins(url=self.JENKINS_URL, timeout=60)
+            self.server = self.connect()
             if self.server.get_whoami() is None:
                 raise Exception("Failed to connect to Jenkins server")
             else:
                 JENKINS_USERNAME = os.getenv('JENKINS_USERNAME')
                 JENKINS_PASSWORD = os.getenv('JENKINS_PASSWORD')
                 if JENKINS_USERNAME is None or JENKINS_PASSWORD is None:
-                    self.server = jenkins.Jenkins(url=self.JENKINS_URL, timeout=60)
+                    self.server = self.connect()
                     if self.server.get_whoami() is None:    
                         raise Exception("Failed to connect to Jenkins server")
                     else:
@@ -43,7 +1131,7 @@ class Jenkins_Helper:
         #==============================================================
         #==============================================================
         if self.JENKINS_USERNAME is not None and self.JENKINS_PASSWORD is not None:
-            self.server = jenkins.Jenkins(url=self.JENKINS_URL, username=self.JENKINS_USERNAME, password=self.JENKINS_PASSWORD, timeout=60)
+            self.server = self.connect(self.JENKINS_USERNAME, self.JENKINS_PASSWORD)
             if self.server.get_whoami() is None:
                 raise Exception("Failed to connect to Jenkins server")
             else:
@@ -51,6 +1139,106 @@ class Jenkins_Helper:
         #==============================================================
         #==============================================================
         
+    def connect(self, username=None, password=None):
+        """
+        Create the Jenkins client on a pooled, retrying transport (see JenkinsTransport)
+        
+        Authentication and the CSRF crumb are resolved once here, before any concurrent request,
+        and the crumb is then reused by every request of the session.
+        
+        Args:
+            username (str, optional): The Jenkins user name. Defaults to None.
+            password (str, optional): The Jenkins password or API token. Defaults to None.
+            
+        Returns:
+            InstrumentedServer: The connected client, recording its calls in self.metrics.
+        """
+        server = jenkins.Jenkins(url=self.JENKINS_URL, username=username, password=password, timeout=self.READ_TIMEOUT)
+        server._session.mount(server.server, JenkinsTransport(self.POOL_SIZE, self.CONNECT_TIMEOUT, self.RETRIES, self.BACKOFF,
+                                                              self.limiter, self.metrics))
+        server._maybe_add_auth()
+        server.maybe_add_crumb(requests.Request('POST', server.server))
+        return InstrumentedServer(server, self.metrics)
+    
+    def read_server(self, endpoint, **params):
+        """
+        Call a read-only endpoint of the Jenkins server
+        
+        Inside a request scope every distinct endpoint and parameter pair is fetched only once.
+        With CACHE_TTL results are also kept between calls until they expire or a write invalidates them (see forget_reads).
+        
+        Args:
+            endpoint (str): The name of the jenkins.Jenkins method to call.
+            **params: The keyword arguments to pass to the method.
+            
+        Returns:
+            object: The result of the call.
+        """
+        fetch = lambda: getattr(self.server, endpoint)(**params)
+        if self.request_cache is None:
+            return fetch()
+        return self.request_cache.get(RequestCache.key(endpoint, params), fetch)
+    
+    def forget_reads(self, *names):
+        """
+        Invalidate the cached reads a write may have changed (see RequestCache.invalidate)
+        
+        Inside a request scope the long-lived cache (CACHE_TTL) is set aside but invalidated as well,
+        so it does not serve results from before the write once the scope is over.
+        
+        Args:
+            *names: The names of the written items.
+        """
+        if self.request_cache is not None:
+            self.request_cache.invalidate(names)
+        if self.long_lived_cache is not None and self.long_lived_cache is not self.request_cache:
+            self.long_lived_cache.invalidate(names)
+            
+    @contextlib.contextmanager
+    def writing(self, *names):
+        """
+        Invalidate the cached reads of the named items once the write in the block is done, even if it failed
+        
+        Args:
+            *names: The names of the written items.
+        """
+        try:
+            yield
+        finally:
+            self.forget_reads(*names)
+            
+    def cache_stats(self):
+        """
+        Get the hit and miss statistics of the read cache in use
+        
+        Returns:
+            dict: The statistics of RequestCache.stats, or None without a cache.
+        """
+        return None if self.request_cache is None else self.request_cache.stats()
+    
+    @contextlib.contextmanager
+    def request_scope(self):
+        """
+        Memoize server reads until the end of the block (one backup or restore run)
+        
+        A long-lived cache (CACHE_TTL) is set aside for the block and used again afterwards.
+        
+        Yields:
+            RequestCache: The cache used by read_server inside the block.
+        """
+        long_lived_cache, self.request_cache = self.request_cache, RequestCache()
+        try:
+            yield self.request_cache
+        finally:
+            self.request_cache_stats = {"hits": self.request_cache.hits, "misses": self.request_cache.misses}
+            self.request_cache = long_lived_cache
+            print(f"Request cache served {self.request_cache_stats['hits']} hits for {self.request_cache_stats['misses']} requests")
+            if self.limiter is not None:
+                print(f"Adaptive limiter: {self.limiter.requests} requests, concurrency {int(self.limiter.limit)} (peak {int(self.limiter.peak)}), {self.limiter.decreases} slowdowns")
+            if self.METRICS:
+                self.metrics.export(self.METRICS)
+                print(f"Request metrics written to {self.METRICS}")
+        
     def get_xml(self, path, type="Job"):
         """
         Get the XML data of a path
@@ -61,12 +1249,8 @@ class Jenkins_Helper:
         Returns:
             str: The XML data of the path.
         """
-        file_path = os.path.join(self.file_path, "jenkins_data", type)
-        file_name = os.path.join(file_path, path+"_config.xml")
-        
-        with open(file_name, 'r') as file:
-            data = file.read()
-        return data
+        with self.open_blob(f"{type}/{path}_config.xml") as file:
+            return io.TextIOWrapper(file, encoding='utf-8').read()
     
     def save_xml(self, data, path, type="Job"):
         """
@@ -77,13 +1261,346 @@ class Jenkins_Helper:
             path (str): The path to save the XML data to.
         """
         
-        file_path = os.path.join(self.file_path, type)
-        os.makedirs(file_path, exist_ok=True)
-        file_name = os.path.join(file_path, path+"_config.xml")
+        relative_path = f"{type}/{path}_config.xml"
+        file_name = os.path.join(self.file_path, relative_path)
+        if self.manifest is not None:
+            key, digest = f"{type}/{path}", content_hash(data)
+            with self.manifest_lock:
+                self.manifest['configs'][key] = digest
+            self.checkpoint("config", key=key, digest=digest)
+            if not (self.DEDUP or self.ARCHIVE) and self.previous_manifest['configs'].get(key) == digest and os.path.exists(file_name):
+                print(f"Unchanged {file_name} ... ", "Type: ", type)
+                return
         print(f"Saving {file_name} ... ", "Type: ", type)
+        self.write_blob(relative_path, data)
+        
+    def object_path(self, digest):
+        """
+        Get the path of an object in the content-addressed store
+        
+        Args:
+            digest (str): The SHA-256 hex digest of the object.
+            
+        Returns:
+            str: The path of the object under objects/.
+        """
+        return os.path.join(self.file_path, "objects", digest[:2], digest)
+    
+    def write_blob(self, relative_path, data):
+        """
+        Write a file of the backup
+        
+        With DEDUP the content is stored once under objects/ and the snapshot index maps the path to it.
+        With ARCHIVE the content is added to the backup archive as a compressed member.
+        
+        Args:
+            relative_path (str): The path of the file, relative to the backup directory.
+            data (str | bytes): The content of the file.
+        """
+        if self.ARCHIVE:
+            with self.archive_lock:
+                self.archive_writer.writestr(relative_path, data)
+            return
+        if not self.DEDUP:
+            file_name = os.path.join(self.file_path, relative_path)
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            with open(file_name, 'w' if isinstance(data, str) else 'wb') as file:
+                file.write(data)
+            return
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        digest = content_hash(data)
+        object_path = self.object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            temp_file = f"{object_path}.{threading.get_ident()}.part"
+            with open(temp_file, 'wb') as file:
+                file.write(data)
+            os.replace(temp_file, object_path)
+        self.index_blob(relative_path, digest)
+        
+    def store_file(self, relative_path, temp_file, compress=True):
+        """
+        Move a finished temporary file into the backup
+        
+        Args:
+            relative_path (str): The path of the file, relative to the backup directory.
+            temp_file (str): The temporary file to move. It is removed if its content is already stored.
+            compress (bool, optional): False for content that is already compressed. Defaults to True.
+        """
+        if self.ARCHIVE:
+            with self.archive_lock:
+                self.archive_writer.write(temp_file, relative_path, compress_type=zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+            os.remove(temp_file)
+            return
+        if not self.DEDUP:
+            file_name = os.path.join(self.file_path, relative_path)
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            os.replace(temp_file, file_name)
+            return
+        digest = hashlib.sha256()
+        with open(temp_file, 'rb') as file:
+            for chunk in iter(lambda: file.read(STREAM_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+        object_path = self.object_path(digest)
+        if os.path.exists(object_path):
+            os.remove(temp_file)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(temp_file, object_path)
+        self.index_blob(relative_path, digest)
+        
+    def open_blob(self, relative_path):
+        """
+        Open a file of the backup for reading
+        
+        Args:
+            relative_path (str): The path of the file, relative to the backup directory.
+            
+        Returns:
+            file: The file opened in binary mode.
+        """
+        if self.ARCHIVE:
+            with self.archive_lock:
+                if self.archive_reader is None:
+                    self.archive_reader = zipfile.ZipFile(self.archive_file, 'r')
+            return self.archive_reader.open(relative_path)
+        if not self.DEDUP:
+            return open(os.path.join(self.file_path, relative_path), 'rb')
+        if self.object_index is None:
+            with open(self.index_file, 'r') as file:
+                self.object_index = json.load(file)
+        return open(self.object_path(self.object_index[relative_path]), 'rb')
+    
+    def index_blob(self, relative_path, digest):
+        """
+        Point a path of the current snapshot index to an object
         
-        with open(file_name, 'w') as file:
-            file.write(data)
+        Args:
+            relative_path (str): The path of the file, relative to the backup directory.
+            digest (str): The SHA-256 hex digest of the object.
+        """
+        with self.index_lock:
+            self.object_index[relative_path] = digest
+        self.checkpoint("blob", path=relative_path, digest=digest)
+            
+    def carry_blob(self, relative_path):
+        """
+        Keep a file of the previous snapshot in the current one (used for carried-over builds)
+        
+        Args:
+            relative_path (str): The path of the file, relative to the backup directory.
+        """
+        if self.DEDUP and relative_path in self.previous_object_index:
+            self.index_blob(relative_path, self.previous_object_index[relative_path])
+        elif self.ARCHIVE and os.path.exists(self.archive_file):
+            with self.open_blob(relative_path) as source, self.archive_lock:
+                info = self.archive_reader.getinfo(relative_path)
+                with self.archive_writer.open(zipfile.ZipInfo(relative_path, info.date_time), 'w') as target:
+                    for chunk in iter(lambda: source.read(STREAM_CHUNK_SIZE), b""):
+                        target.write(chunk)
+    
+    def start_object_index(self):
+        """
+        Start a new snapshot index, keeping the previous one for carried-over files
+        """
+        self.previous_object_index = {}
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as file:
+                self.previous_object_index = json.load(file)
+        self.object_index = {}
+        
+    def finish_object_index(self):
+        """
+        Write the snapshot index of the backup that just completed
+        """
+        with open(self.index_file, 'w') as file:
+            json.dump(self.object_index, file, indent=2, sort_keys=True)
+        self.previous_object_index = {}
+        
+    def start_archive(self):
+        """
+        Start writing the backup archive
+        
+        The archive is a zip file: every member is compressed on its own and the central directory
+        indexes members by name, offset and length, so one job or view can be read without
+        decompressing the rest. It is written to a temporary file and replaces the previous archive
+        once the backup completes.
+        """
+        self.archive_writer = zipfile.ZipFile(self.archive_file + ".part", 'w', compression=zipfile.ZIP_DEFLATED)
+        
+    def finish_archive(self, complete=True):
+        """
+        Finish the backup archive
+        
+        Args:
+            complete (bool, optional): False if the backup failed; the previous archive is then kept. Defaults to True.
+        """
+        self.archive_writer.close()
+        self.archive_writer = None
+        if self.archive_reader is not None:
+            self.archive_reader.close()
+            self.archive_reader = None
+        if complete:
+            os.replace(self.archive_file + ".part", self.archive_file)
+        else:
+            os.remove(self.archive_file + ".part")
+        
+    @contextlib.contextmanager
+    def archive_scope(self):
+        """
+        Write the backup into the archive for the duration of the block (no-op without ARCHIVE)
+        
+        The backup file written inside the block is moved into the archive at the end.
+        """
+        if not self.ARCHIVE:
+            yield
+            return
+        self.start_archive()
+        try:
+            yield
+        except BaseException:
+            self.finish_archive(complete=False)
+            raise
+        self.store_file(os.path.basename(self.file_name), self.file_name)
+        self.finish_archive()
+        
+    @contextlib.contextmanager
+    def artifacts_scope(self):
+        """
+        Download artifacts on a pool of WORKERS threads of their own for the duration of the block (no-op without ARTIFACTS)
+        
+        The size and MD5 fingerprint of every verified artifact are recorded in the artifacts manifest next to FILE_NAME,
+        so the next backup skips the files it already has without hashing them again (see download_artifact).
+        """
+        if not self.ARTIFACTS:
+            yield
+            return
+        self.artifacts = {}
+        if os.path.exists(self.artifacts_file):
+            with open(self.artifacts_file, 'r') as file:
+                self.artifacts = json.load(file)
+        self.artifacts_pool = ThreadPoolExecutor(max_workers=max(self.WORKERS, 1))
+        try:
+            yield
+        finally:
+            self.artifacts_pool.shutdown()
+            self.artifacts_pool = None
+            with open(self.artifacts_file + ".part", 'w') as file:
+                json.dump(self.artifacts, file, indent=2)
+            os.replace(self.artifacts_file + ".part", self.artifacts_file)
+            self.artifacts = None
+            
+    @contextlib.contextmanager
+    def test_results_scope(self):
+        """
+        Write the test cases of the saved builds into the test results store for the duration of the block
+        (no-op without TEST_RESULTS)
+        """
+        if not self.TEST_RESULTS:
+            yield
+            return
+        self.test_results = TestResultStore(self.test_results_file)
+        try:
+            yield
+        finally:
+            self.test_results.close()
+            self.test_results = None
+            
+    def open_test_results(self):
+        """
+        Open the test results store written by a backup with TEST_RESULTS, for queries
+        
+        Returns:
+            TestResultStore: The store. Close it when done.
+        """
+        if not os.path.exists(self.test_results_file):
+            raise Exception(f"No test results found at {self.test_results_file}, run a backup with TEST_RESULTS first")
+        return TestResultStore(self.test_results_file)
+    
+    def open_catalog(self):
+        """
+        Open the catalog written by a backup with CATALOG, read-only
+        
+        Returns:
+            BackupCatalog: The catalog. Close it when done.
+        """
+        if not os.path.exists(self.catalog_file):
+            raise Exception(f"No catalog found at {self.catalog_file}, run a backup with CATALOG first")
+        return BackupCatalog(self.catalog_file)
+    
+    def find_builds(self, job_name=None, result=None, node_name=None, since=None, limit=100):
+        """
+        Find backed-up builds in the catalog, newest first
+        
+        Args:
+            job_name (str, optional): Only builds of this job. Defaults to None.
+            result (str, optional): Only builds with this result, e.g. "FAILURE". Defaults to None.
+            node_name (str, optional): Only builds that ran on this node. Defaults to None.
+            since (int, optional): Only builds started at or after this timestamp in milliseconds. Defaults to None.
+            limit (int, optional): The largest number of builds to return. Defaults to 100.
+            
+        Returns:
+            list: The builds with their job, number, result, timestamp, duration, node, URL and build info ('data').
+        """
+        filters = {"job = ?": job_name, "result = ?": result, "built_on = ?": node_name, "timestamp >= ?": since}
+        filters = {condition: value for condition, value in filters.items() if value is not None}
+        where = " WHERE " + " AND ".join(filters) if filters else ""
+        with self.open_catalog() as catalog:
+            return catalog.query(f"SELECT * FROM builds{where} ORDER BY timestamp DESC LIMIT ?", tuple(filters.values()) + (limit,))
+        
+    def find_failed_jobs(self):
+        """
+        Find the jobs whose last backed-up build did not succeed
+        
+        Returns:
+            list: The job name, build number, result and timestamp of the last build of each of these jobs.
+        """
+        with self.open_catalog() as catalog:
+            return catalog.query("""
+                SELECT builds.job, builds.number, builds.result, builds.timestamp FROM jobs
+                JOIN builds ON builds.job = jobs.name AND builds.number = jobs.last_build
+                WHERE builds.result != 'SUCCESS' ORDER BY builds.timestamp DESC""")
+        
+    def find_item(self, kind, name):
+        """
+        Get the backup record of a single item from the catalog
+        
+        Args:
+            kind (str): "job", "folder", "view", "node" or "plugin".
+            name (str): The (full) name of the item.
+            
+        Returns:
+            dict: The record as written to the backup file (without the builds of a job), or None if it is not in the backup.
+        """
+        if kind not in ("job", "folder", "view", "node", "plugin"):
+            raise Exception(f"Unknown kind of item: {kind}")
+        with self.open_catalog() as catalog:
+            rows = catalog.query(f"SELECT data FROM {kind}s WHERE name = ?", (name,))
+        return rows[0]['data'] if rows else None
+    
+    def backup_exists(self):
+        """
+        Check if a backup was already written to FILE_NAME (or to its archive with ARCHIVE)
+        
+        Returns:
+            bool: True if the backup exists, False otherwise.
+        """
+        return os.path.exists(self.archive_file if self.ARCHIVE else self.file_name)
+        
+    def load_jenkins_data(self):
+        """
+        Read the backup file (from the archive with ARCHIVE)
+        
+        Returns:
+            dict: The backup data with "jobs", "views", "plugins" and "nodes" lists.
+        """
+        if self.ARCHIVE:
+            with self.open_blob(os.path.basename(self.file_name)) as file:
+                return BackupWriter.read(io.TextIOWrapper(file, encoding='utf-8'), self.FORMAT)
+        with open(self.file_name, 'r') as file:
+            return BackupWriter.read(file, self.FORMAT)
     
     def get_job_info(self, job_name):
         """
@@ -95,7 +1612,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the job.
         """
-        return self.server.get_job_info(name=job_name)
+        return self.read_server("get_job_info", name=job_name)
     
     def get_jobs_by_view(self, view_name):
         """
@@ -107,7 +1624,7 @@ class Jenkins_Helper:
         Returns:
             list: The jobs of the view.
         """
-        return self.server.get_jobs(view_name=view_name)
+        return self.read_server("get_jobs", view_name=view_name)
     
     def get_job_config(self, job_name):
         """
@@ -120,7 +1637,7 @@ class Jenkins_Helper:
             str: The configuration of the job in XML format.
         """
         try:
-            return self.server.get_job_config(name=job_name)
+            return self.read_server("get_job_config", name=job_name)
         except Exception as e:
             return jenkins.EMPTY_CONFIG_XML
         
@@ -133,36 +1650,226 @@ class Jenkins_Helper:
             config (str): The configuration of the job in XML format.
 
         Returns:
-            bool: True if the job was created successfully, False otherwise.
+            bool: True if the job was created successfully, False otherwise.
+        """
+        try:
+            with self.writing(job_name):
+                return self.server.create_job(name=job_name, config_xml=config)
+        except Exception as e:
+            if "already exists" in str(e):
+                self.update_job(job_name, config)
+            else:
+                return False
+            
+    def get_queue_info(self):
+        """
+        Get the information of the Jenkins queued jobs
+
+        Returns:
+            dict: The information of the Jenkins queue.
+        """
+        return self.server.get_queue_info()
+    
+    def cancel_queue_item(self, queue_id):
+        """
+        Cancel a queued job by its ID
+        
+        Args:
+            queue_id (int): The ID of the queued job to cancel.
+            
+        Returns:
+            bool: True if the queued job was canceled successfully, False otherwise.
+        """
+        with self.writing():
+            return self.server.cancel_queue(id=queue_id)
+        
+    def get_queue_items(self):
+        """
+        Get the items of the Jenkins queue with one tree= query of the fields the queue watcher needs
+        
+        Returns:
+            list: The queue items with their ID, task, state and reason for waiting.
+        """
+        return self.server.get_info("queue", "?tree=" + QUEUE_TREE)['items']
+    
+    def watch_queue(self, interval=1, max_interval=30, timeout=None):
+        """
+        Poll the Jenkins queue and yield only what changed between two polls
+        
+        The first poll reports every queued item as added. The polling interval starts at interval,
+        doubles after every poll without changes up to max_interval and drops back once something changes.
+        
+        Args:
+            interval (float, optional): The shortest polling interval in seconds. Defaults to 1.
+            max_interval (float, optional): The longest polling interval in seconds. Defaults to 30.
+            timeout (float, optional): Stop watching after this many seconds. Defaults to None (watch until the caller stops).
+            
+        Yields:
+            tuple: The event ("added", "removed", "blocked" or "stuck") and the queue item (see queue_events).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        previous, delay = {}, interval
+        while True:
+            current = {item['id']: item for item in self.get_queue_items()}
+            events = queue_events(previous, current)
+            previous = current
+            yield from events
+            delay = interval if events else min(delay * 2, max_interval)
+            if deadline is not None and time.monotonic() + delay > deadline:
+                return
+            time.sleep(delay)
+            
+    def cancel_queue_items(self, predicate):
+        """
+        Cancel every queued item matching a predicate, with up to WORKERS concurrent requests
+        
+        Args:
+            predicate (callable): Called with each queue item (see get_queue_items), True to cancel it.
+            
+        Returns:
+            tuple: The IDs of the cancelled items and the IDs of the items that could not be cancelled.
         """
-        try:
-            return self.server.create_job(name=job_name, config_xml=config)
-        except Exception as e:
-            if "already exists" in str(e):
-                self.update_job(job_name, config)
-            else:
+        def cancel(item):
+            try:
+                self.cancel_queue_item(item['id'])
+                return True
+            except Exception as e:
+                print(f"Failed to cancel queue item {item['id']}: {e}")
                 return False
+        items = [item for item in self.get_queue_items() if predicate(item)]
+        print(f"Cancelling {len(items)} queue items ...")
+        cancelled, failed = [], []
+        for item, done in zip(items, self.map_concurrently(cancel, items)):
+            (cancelled if done else failed).append(item['id'])
+        return cancelled, failed
+    
+    def trigger_builds(self, builds):
+        """
+        Trigger many builds with up to WORKERS concurrent requests
+        
+        Args:
+            builds (iterable): Job names, or (job name, parameters) tuples for parameterized builds.
             
-    def get_queue_info(self):
+        Returns:
+            list: One record per build with its 'job', 'parameters' and 'queue_id', or the 'error' that prevented the trigger.
+        """
+        def trigger(build):
+            job_name, parameters = (build, None) if isinstance(build, str) else build
+            record = {"job": job_name, "parameters": parameters, "queue_id": None, "error": None}
+            try:
+                with self.writing(job_name):
+                    record['queue_id'] = self.server.build_job(name=job_name, parameters=parameters)
+            except Exception as e:
+                record['error'] = str(e) or type(e).__name__
+            return record
+        builds = list(builds)
+        print(f"Triggering {len(builds)} builds ...")
+        return list(self.map_concurrently(trigger, builds))
+    
+    def poll_builds(self, folder_name, jobs):
         """
-        Get the information of the Jenkins queued jobs
-
+        Get the latest builds of several jobs of a folder with one tree= query
+        
+        Args:
+            folder_name (str): The full name of the folder ("" for the top level).
+            jobs (dict): The number of recent builds to return, keyed by the short names of the jobs.
+            
         Returns:
-            dict: The information of the Jenkins queue.
+            dict: The builds (with BUILD_STATUS_TREE fields) keyed by the short names of the jobs.
         """
-        return self.server.get_queue_info()
+        item = "".join(f"job/{name}/" for name in folder_name.split("/") if name)
+        window = max(jobs.values())
+        listing = self.server.get_info(item=item, query=f"?tree=jobs[name,builds[{BUILD_STATUS_TREE}]{{0,{window}}}]")['jobs']
+        return {job['name']: job.get('builds', []) for job in listing if job['name'] in jobs}
     
-    def cancel_queue_item(self, queue_id):
+    def wait_for_builds(self, triggered, interval=2, max_interval=30, timeout=None):
         """
-        Cancel a queued job by its ID
+        Follow triggered builds from their queue items to their results, yielding each build as it finishes
+        
+        Every polling round makes one queue request and one request per folder with pending builds
+        (see poll_builds), however many builds are pending. Queue items are matched to builds by their queue ID.
+        An item that left the queue is resolved through the builds of its job; if no build with its queue ID
+        shows up within LEFT_QUEUE_ROUNDS more rounds, it was cancelled (or removed) before it started.
+        The interval doubles after every round in which nothing progressed, up to max_interval.
         
         Args:
-            queue_id (int): The ID of the queued job to cancel.
+            triggered (list): The records returned by trigger_builds.
+            interval (float, optional): The shortest polling interval in seconds. Defaults to 2.
+            max_interval (float, optional): The longest polling interval in seconds. Defaults to 30.
+            timeout (float, optional): Give up on the builds still pending after this many seconds. Defaults to None.
             
-        Returns:
-            bool: True if the queued job was canceled successfully, False otherwise.
+        Yields:
+            dict: The record of a finished build with its 'number', 'url', 'result', 'duration', 'timestamp' and 'tests'
+                (the total, failed and skipped test counts, or None without a test report). Builds whose item was
+                cancelled get the result "CANCELLED", builds that could not be triggered or did not finish in time an 'error'.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = {}
+        left = {}
+        for record in triggered:
+            if record['queue_id'] is None:
+                yield record
+            else:
+                pending[record['queue_id']] = dict(record, number=None)
+        delay = interval
+        while pending:
+            queued = {item['id'] for item in self.get_queue_items()}
+            folders = {}
+            for record in pending.values():
+                folder_name, _, short_name = record['job'].rpartition("/")
+                jobs = folders.setdefault(folder_name, {})
+                # leave room for the builds other users started since the trigger
+                jobs[short_name] = jobs.get(short_name, 20) + 1
+            builds = {}
+            for listing in self.map_concurrently(lambda folder_name: self.poll_builds(folder_name, folders[folder_name]), folders):
+                for job_builds in listing.values():
+                    for build in job_builds:
+                        builds[build.get('queueId')] = build
+            progressed = False
+            for queue_id, record in list(pending.items()):
+                build = builds.get(queue_id)
+                if build is None:
+                    if queue_id not in queued and record['number'] is None:
+                        # left the queue without a build (yet): the build may still be starting
+                        left[queue_id] = left.get(queue_id, 0) + 1
+                        if left[queue_id] > LEFT_QUEUE_ROUNDS:
+                            del pending[queue_id]
+                            progressed = True
+                            yield dict(record, result="CANCELLED")
+                    continue
+                if record['number'] is None:
+                    record['number'] = build['number']
+                    progressed = True
+                if not build['building'] and build.get('result'):
+                    del pending[queue_id]
+                    progressed = True
+                    tests = next(({"total": action['totalCount'], "failed": action['failCount'], "skipped": action['skipCount']}
+                                  for action in build.get('actions', []) if action and 'totalCount' in action), None)
+                    yield dict(record, url=build['url'], result=build['result'], duration=build['duration'],
+                               timestamp=build['timestamp'], tests=tests)
+            if not pending:
+                break
+            delay = interval if progressed else min(delay * 2, max_interval)
+            if deadline is not None and time.monotonic() + delay > deadline:
+                for record in pending.values():
+                    yield dict(record, error="Timed out waiting for the build")
+                return
+            time.sleep(delay)
+    
+    def trigger_and_wait(self, builds, interval=2, max_interval=30, timeout=None):
+        """
+        Trigger many builds concurrently and yield each one as it finishes (see trigger_builds and wait_for_builds)
+        
+        Args:
+            builds (iterable): Job names, or (job name, parameters) tuples for parameterized builds.
+            interval (float, optional): The shortest polling interval in seconds. Defaults to 2.
+            max_interval (float, optional): The longest polling interval in seconds. Defaults to 30.
+            timeout (float, optional): Give up on the builds still pending after this many seconds. Defaults to None.
+            
+        Yields:
+            dict: The record of a finished build (see wait_for_builds).
         """
-        return self.server.cancel_queue(queue_id=queue_id)
+        yield from self.wait_for_builds(self.trigger_builds(builds), interval, max_interval, timeout)
     
     def update_job(self, job_name, config):
         """
@@ -175,7 +1882,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the job was updated successfully, False otherwise.
         """
-        return self.server.reconfig_job(name=job_name, config_xml=config)
+        with self.writing(job_name):
+            return self.server.reconfig_job(name=job_name, config_xml=config)
     
     def copy_job(self, job_name, new_job_name):
         """
@@ -188,7 +1896,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the job was copied successfully, False otherwise.
         """
-        return self.server.copy_job(from_name=job_name, to_name=new_job_name)
+        with self.writing(job_name, new_job_name):
+            return self.server.copy_job(from_name=job_name, to_name=new_job_name)
     
     def delete_job(self, job_name):
         """
@@ -200,7 +1909,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the job was deleted successfully, False otherwise.
         """
-        return self.server.delete_job(name=job_name)
+        with self.writing(job_name):
+            return self.server.delete_job(name=job_name)
     
     def enable_job(self, job_name):
         """
@@ -212,7 +1922,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the job was enabled successfully, False otherwise.
         """
-        return self.server.enable_job(name=job_name)
+        with self.writing(job_name):
+            return self.server.enable_job(name=job_name)
     
     def disable_job(self, job_name):
         """
@@ -224,7 +1935,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the job was disabled successfully, False otherwise.
         """
-        return self.server.disable_job(name=job_name)
+        with self.writing(job_name):
+            return self.server.disable_job(name=job_name)
     
     def build_job(self, job_name, parameters=None):
         """
@@ -235,13 +1947,14 @@ class Jenkins_Helper:
             parameters (dict, optional): The parameters to pass to the job. Defaults to None.
 
         Returns:
-            bool: True if the job was built successfully, False otherwise.
+            int: The ID of the queue item of the build, False if the build could not be triggered.
         """
         try:
-            return self.server.build_job(name=job_name, parameters=parameters)
+            with self.writing(job_name):
+                return self.server.build_job(name=job_name, parameters=parameters)
         except Exception as e:
-            "already exists" in str(e)
-            return "Job already exists"
+            print(f"Failed to build {job_name}: {e}")
+            return False
     
     def get_build_stage(self, job_name, build_number):
         """
@@ -254,7 +1967,7 @@ class Jenkins_Helper:
         Returns:
             str: The stage of the build.
         """
-        return self.server.get_build_stages(name=job_name, number=build_number)
+        return self.read_server("get_build_stages", name=job_name, number=build_number)
     
     def get_job_builds(self, job_name):
         """
@@ -267,7 +1980,7 @@ class Jenkins_Helper:
             list: The builds of the job.
         """
         try:
-            return self.server.get_job_info(name=job_name)['builds']
+            return self.read_server("get_job_info", name=job_name)['builds']
         except Exception as e:
             return []
             
@@ -285,7 +1998,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the build.
         """
-        return self.server.get_build_info(name=job_name, number=build_number)
+        return self.read_server("get_build_info", name=job_name, number=build_number)
     
     def get_job_last_build(self, job_name):
         """
@@ -297,7 +2010,7 @@ class Jenkins_Helper:
         Returns:
             dict: The last build of the job.
         """
-        return self.server.get_job_info(name=job_name)['lastBuild']
+        return self.read_server("get_job_info", name=job_name)['lastBuild']
     
     def get_job_last_build_number(self, job_name, build="lastCompletedBuild"):
         """
@@ -312,7 +2025,7 @@ class Jenkins_Helper:
             int: The last build number of the job.
         """
         try:
-            return self.server.get_job_info(name=job_name)[build]['number']
+            return self.read_server("get_job_info", name=job_name)[build]['number']
         except Exception as e:
             return 0
         
@@ -328,10 +2041,173 @@ class Jenkins_Helper:
             str: The console output of the build.
         """
         try:
-            return self.server.get_build_console_output(name=job_name, number=build_number)
+            return self.read_server("get_build_console_output", name=job_name, number=build_number)
         except Exception as e:
             return ""
         
+    def save_build_console_output(self, job_name, build_number):
+        """
+        Stream the console output of a build into a gzip file under Console/
+        
+        The log is read in chunks from the progressive-text endpoint and compressed on the fly,
+        so it is never held in memory. The log of a running build is followed for at most CONSOLE_FOLLOW_TIMEOUT
+        seconds and saved as far as it was written by then.
+        
+        Args:
+            job_name (str): The name of the job to save the build console output of.
+            build_number (int): The number of the build to save the console output of.
+            
+        Returns:
+            str: The path of the saved log, relative to the backup directory, or None if it could not be fetched.
+        """
+        relative_path = f"Console/{job_name}_{build_number}.log.gz"
+        file_name = os.path.join(self.file_path, relative_path)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        folder_url, short_name = self.server._get_job_folder(job_name)
+        start = 0
+        deadline = time.monotonic() + CONSOLE_FOLLOW_TIMEOUT
+        try:
+            # mtime=0 and no file name in the header, so identical logs compress to identical bytes
+            with open(file_name + ".part", 'wb') as raw, gzip.GzipFile(filename="", mode='wb', fileobj=raw, mtime=0) as file:
+                while True:
+                    url = self.server._build_url(PROGRESSIVE_TEXT, {"folder_url": folder_url, "short_name": short_name,
+                                                                    "number": build_number, "start": start})
+                    with contextlib.closing(self.server.jenkins_request(requests.Request('GET', url), stream=True)) as response:
+                        received = 0
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            file.write(chunk)
+                            received += len(chunk)
+                        start = int(response.headers.get('X-Text-Size', start + received))
+                        if response.headers.get('X-More-Data') != 'true' or received == 0 or time.monotonic() > deadline:
+                            break
+        except Exception as e:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(file_name + ".part")
+            return None
+        self.store_file(relative_path, file_name + ".part", compress=False)
+        return relative_path
+    
+    def download_artifact(self, job_name, build_number, artifact, md5=None):
+        """
+        Stream one artifact of a build to Artifacts/<job>/<build>/<relative path>
+        
+        The artifact is written in chunks to a .part file. An interrupted download continues from the end of that file
+        with a Range request, up to RETRIES times. The finished file is checked against the size announced by the server
+        and, if known, the MD5 fingerprint. Inside artifacts_scope an artifact whose file still has the size and fingerprint
+        recorded by an earlier download is skipped without reading it. Artifacts are plain files even with DEDUP or ARCHIVE,
+        so they can be resumed and skipped.
+        
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+            artifact (dict): The artifact entry of the build info ('relativePath' and 'fileName').
+            md5 (str, optional): The MD5 fingerprint of the artifact. Defaults to None.
+            
+        Returns:
+            dict: The 'path' of the file relative to the backup directory, its 'size' and 'md5', the 'status'
+                ("downloaded", "skipped" or "failed") and the 'error' of a failed download.
+        """
+        relative_path = f"Artifacts/{job_name}/{build_number}/{artifact['relativePath']}"
+        file_name = os.path.join(self.file_path, relative_path)
+        record = {"path": relative_path, "size": None, "md5": md5, "status": "downloaded", "error": None}
+        recorded = None if self.artifacts is None else self.artifacts.get(relative_path)
+        if recorded is not None and recorded['md5'] == md5 and os.path.exists(file_name) and os.path.getsize(file_name) == recorded['size']:
+            print(f"Keeping {relative_path} ...")
+            record.update(size=recorded['size'], status="skipped")
+            return record
+        print(f"Downloading {relative_path} ...")
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        folder_url, short_name = self.server._get_job_folder(job_name)
+        url = self.server._build_url(ARTIFACT, {"folder_url": folder_url, "short_name": short_name, "number": build_number,
+                                                "path": requests.utils.quote(artifact['relativePath'])})
+        temp_file = file_name + ".part"
+        for attempt in range(self.RETRIES + 1):
+            offset = os.path.getsize(temp_file) if os.path.exists(temp_file) else 0
+            try:
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+                with contextlib.closing(self.server.jenkins_request(requests.Request('GET', url, headers=headers), stream=True)) as response:
+                    if response.status_code != 206:
+                        # the server ignored the range and sends the whole artifact
+                        offset = 0
+                    content_range = response.headers.get('Content-Range', "")
+                    if "/" in content_range and not content_range.endswith("/*"):
+                        size = int(content_range.rsplit("/", 1)[1])
+                    elif 'Content-Length' in response.headers and 'Content-Encoding' not in response.headers:
+                        size = offset + int(response.headers['Content-Length'])
+                    else:
+                        size = None
+                    with open(temp_file, 'ab' if offset else 'wb') as file:
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            file.write(chunk)
+                received = os.path.getsize(temp_file)
+                if size is not None and received != size:
+                    raise Exception(f"Received {received} of {size} bytes")
+                record['size'] = received
+                if md5 is not None and file_md5(temp_file) != md5:
+                    os.remove(temp_file)
+                    raise Exception("Checksum does not match the fingerprint")
+                os.replace(temp_file, file_name)
+                record.update(status="downloaded", error=None)
+                if self.artifacts is not None:
+                    with self.artifacts_lock:
+                        self.artifacts[relative_path] = {"size": received, "md5": md5}
+                return record
+            except jenkins.NotFoundException as e:
+                record.update(status="failed", error=str(e))
+                return record
+            except Exception as e:
+                if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code == 416:
+                    # the partial file is longer than the artifact, start over
+                    os.remove(temp_file)
+                record.update(status="failed", error=str(e) or type(e).__name__)
+                if attempt < self.RETRIES:
+                    time.sleep(self.BACKOFF * 2 ** attempt)
+        return record
+    
+    def save_build_artifacts(self, job_name, build_number):
+        """
+        Download the artifacts of a build concurrently (see download_artifact)
+        
+        The artifact list and MD5 fingerprints come from the build info, which a BULK backup already fetched.
+        Inside artifacts_scope the downloads share its pool, so the job workers calling this method do not each
+        open WORKERS more threads. The requests are counted in the "artifacts" metrics phase on whichever thread runs them.
+        
+        Args:
+            job_name (str): The name of the job of the build.
+            build_number (int): The number of the build.
+            
+        Returns:
+            list: The records of download_artifact, one per artifact.
+        """
+        try:
+            with self.metrics.phase("artifacts"):
+                info = self.read_server("get_build_info", name=job_name, number=build_number)
+        except Exception as e:
+            return []
+        names = [fingerprint['fileName'] for fingerprint in info.get('fingerprint') or []]
+        fingerprints = {fingerprint['fileName']: fingerprint['hash'] for fingerprint in info.get('fingerprint') or []
+                        if names.count(fingerprint['fileName']) == 1}
+        def download(artifact):
+            # the phase is per thread, so it is set on the pool thread that runs the download
+            with self.metrics.phase("artifacts"):
+                return self.download_artifact(job_name, build_number, artifact, fingerprints.get(artifact['fileName']))
+        if self.artifacts_pool is None:
+            return list(self.map_concurrently(download, info.get('artifacts') or []))
+        return [future.result() for future in [self.artifacts_pool.submit(download, artifact) for artifact in info.get('artifacts') or []]]
+    
+    def get_console_log(self, relative_path):
+        """
+        Read a console log saved by save_build_console_output
+        
+        Args:
+            relative_path (str): The path stored in the build's 'console_log' entry.
+            
+        Returns:
+            str: The console output of the build.
+        """
+        with self.open_blob(relative_path) as file, gzip.open(file, 'rt') as log:
+            return log.read()
+        
     def get_build_test_report(self, job_name, build_number):
         """
         Get the test report of a build by its job name and build number
@@ -344,7 +2220,7 @@ class Jenkins_Helper:
             dict: The test report of the build.
         """
         try:
-            return self.server.get_build_test_report(name=job_name, number=build_number)
+            return self.read_server("get_build_test_report", name=job_name, number=build_number)
         except Exception as e:
             return {}
         
@@ -360,7 +2236,7 @@ class Jenkins_Helper:
             list: The changeset of the build.
         """
         try:
-            return self.server.get_build_info(name=job_name, number=build_number)['changeSet']['items']
+            return self.read_server("get_build_info", name=job_name, number=build_number)['changeSet']['items']
         except Exception as e:
             return []
     
@@ -375,7 +2251,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the next build number was updated successfully, False otherwise.
         """
-        return self.server.set_next_build_number(name=job_name, number=next_build_number)
+        with self.writing(job_name):
+            return self.server.set_next_build_number(name=job_name, number=next_build_number)
     
     def get_build_artifacts(self, job_name, build_number):
         """
@@ -389,7 +2266,7 @@ class Jenkins_Helper:
             list: The artifacts of the build.
         """
         try:
-            return self.server.get_build_info(name=job_name, number=build_number)['artifacts']
+            return self.read_server("get_build_info", name=job_name, number=build_number)['artifacts']
         except Exception as e:
             return []
         
@@ -403,7 +2280,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the view.
         """
-        return self.server.view_exists(name=view_name)
+        return self.read_server("view_exists", name=view_name)
     
     def create_view(self, view_name, view_config = None):
         """
@@ -419,7 +2296,8 @@ class Jenkins_Helper:
         if view_config is None:
             view_config = jenkins.EMPTY_VIEW_CONFIG_XML
         try:
-            return self.server.create_view(name=view_name, config_xml=view_config)
+            with self.writing(view_name):
+                return self.server.create_view(name=view_name, config_xml=view_config)
         except Exception as e:
             if "already exists" in str(e):
                 self.update_view(view_name, view_config)
@@ -437,7 +2315,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the view was updated successfully, False otherwise.
         """
-        return self.server.reconfig_view(name=view_name, config_xml=view_config)
+        with self.writing(view_name):
+            return self.server.reconfig_view(name=view_name, config_xml=view_config)
     
     def delete_view(self, view_name):
         """
@@ -449,7 +2328,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the view was deleted successfully, False otherwise.
         """
-        return self.server.delete_view(name=view_name)
+        with self.writing(view_name):
+            return self.server.delete_view(name=view_name)
     
     def get_view_config(self, view_name):
         """
@@ -461,12 +2341,12 @@ class Jenkins_Helper:
         Returns:
             str: The configuration of the view in XML format.
         """
-        try:    
-            self.save_xml(self.server.get_view_config(name=view_name), view_name, "view")
-            return self.server.get_view_config(name=view_name)
+        try:
+            config = self.read_server("get_view_config", name=view_name)
         except Exception as e:
-            self.save_xml(jenkins.EMPTY_VIEW_CONFIG_XML, view_name, "view")
-            return jenkins.EMPTY_VIEW_CONFIG_XML
+            config = jenkins.EMPTY_VIEW_CONFIG_XML
+        self.save_xml(config, view_name, "view")
+        return config
         
     def get_plugin_info(self, plugin_name):
         """
@@ -478,7 +2358,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the plugin.
         """
-        return self.server.get_plugin_info(name=plugin_name)
+        return self.read_server("get_plugin_info", name=plugin_name)
     
     def get_plugin_version(self, plugin_name):
         """
@@ -490,7 +2370,7 @@ class Jenkins_Helper:
         Returns:
             str: The version of the plugin.
         """
-        return self.server.get_plugin_info(name=plugin_name)['version']
+        return self.read_server("get_plugin_info", name=plugin_name)['version']
     
     def install_plugin(self, plugin_name):
         """
@@ -503,12 +2383,59 @@ class Jenkins_Helper:
             bool: True if the plugin was installed successfully, False otherwise.
         """
         try:
-            return self.server.install_plugin(name=plugin_name)
+            with self.writing(plugin_name):
+                return self.server.install_plugin(name=plugin_name)
         except Exception as e:
             if "already exists" in str(e):
                 return True
             else:
                 return False
+    
+    def install_plugins(self, plugins, timeout=900):
+        """
+        Install a batch of plugins with one request and at most one safe restart
+        
+        Plugins that are already installed with the same or a newer version are left alone. The rest are submitted
+        together to the plugin manager, the update center is polled (with a growing interval) until
+        every download has finished, and Jenkins is safely restarted once if any plugin requires it.
+        Plugins for which Jenkins created no update-center job are reported as skipped (see plugin_install_status).
+        
+        Args:
+            plugins (list): The plugin records of a backup, each with a "shortName" and "version".
+            timeout (int): The number of seconds to wait for the downloads and for the restart. Default is 900.
+            
+        Returns:
+            list: The names of the plugins that failed to install.
+        """
+        installed = {plugin['shortName']: str(plugin['version']) for plugin in self.server.get_plugins(depth=1).values()}
+        missing = plugins_to_install(installed, plugins)
+        print(f"Installing {len(missing)} of {len(plugins)} Plugins ...")
+        if not missing:
+            return []
+        body = "<jenkins>" + "".join(f'<install plugin="{name}@{version}" />' for name, version in missing.items()) + "</jenkins>"
+        self.server.jenkins_request(requests.Request(
+            'POST', self.server._build_url('pluginManager/installNecessaryPlugins'),
+            data=body.encode("utf-8"), headers={'Content-Type': 'text/xml'}))
+        deadline = time.monotonic() + timeout
+        interval = 1
+        while True:
+            center = self.server.get_info("updateCenter", "?tree=restartRequiredForCompletion,jobs[name,status[_class]]")
+            pending, failed, skipped = plugin_install_status(missing, center)
+            if not pending:
+                break
+            if time.monotonic() > deadline:
+                raise Exception(f"Timed out waiting for {len(pending)} plugins to install")
+            time.sleep(interval)
+            interval = min(interval * 2, 10)
+        if skipped:
+            print(f"Skipped {len(skipped)} Plugins unknown to the update center or already newer: {', '.join(skipped)}")
+        if center.get('restartRequiredForCompletion'):
+            print("Restarting Jenkins to finish the plugin installation ...")
+            self.server.jenkins_request(requests.Request('POST', self.server._build_url('safeRestart')))
+            if not self.server.wait_for_normal_op(timeout):
+                raise Exception("Jenkins did not come back after the plugin restart")
+        self.forget_reads(*missing)
+        return failed
             
     def get_node_info(self, node_name):
         """
@@ -520,7 +2447,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the node.
         """
-        return self.server.get_node_info(name=node_name)
+        return self.read_server("get_node_info", name=node_name)
     
     def get_all_nodes(self):
         """
@@ -529,7 +2456,7 @@ class Jenkins_Helper:
         Returns:
             list: The information of all nodes.
         """
-        return self.server.get_nodes()
+        return self.read_server("get_nodes")
     
     def get_node_config(self, node_name):
         """
@@ -542,11 +2469,11 @@ class Jenkins_Helper:
             str: The configuration of the node in XML format.
         """
         try:
-            self.save_xml(self.server.get_node_config(name=node_name), node_name, "node")
-            return self.server.get_node_config(name=node_name)
+            config = self.read_server("get_node_config", name=node_name)
         except Exception as e:
-            self.save_xml(jenkins.EMPTY_CONFIG_XML, node_name, "node")
-            return jenkins.EMPTY_CONFIG_XML
+            config = jenkins.EMPTY_CONFIG_XML
+        self.save_xml(config, node_name, "node")
+        return config
     
     def create_node(self, node_name, config):
         """
@@ -560,12 +2487,13 @@ class Jenkins_Helper:
             bool: True if the node was created successfully, False otherwise.
         """
         try:
-            return self.server.create_node(name=node_name, config_xml=config)
-        except:
-            if "already exists" in str(e):
-                self.update_node(node_name, config)
-            else:
+            with self.writing(node_name):
+                self.server.create_node(name=node_name)
+        except Exception as e:
+            if "already exists" not in str(e):
                 return False
+        self.update_node(node_name, config)
+        return True
         
     def update_node(self, node_name, config):
         """
@@ -578,7 +2506,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the node was updated successfully, False otherwise.
         """
-        return self.server.reconfig_node(name=node_name, config_xml=config)
+        with self.writing(node_name):
+            return self.server.reconfig_node(name=node_name, config_xml=config)
     
     def delete_node(self, node_name):
         """
@@ -590,7 +2519,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the node was deleted successfully, False otherwise.
         """
-        return self.server.delete_node(name=node_name)
+        with self.writing(node_name):
+            return self.server.delete_node(name=node_name)
     
     def enable_node(self, node_name):
         """
@@ -602,7 +2532,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the node was enabled successfully, False otherwise.
         """
-        return self.server.enable_node(name=node_name)
+        with self.writing(node_name):
+            return self.server.enable_node(name=node_name)
     
     def disable_node(self, node_name):
         """
@@ -614,7 +2545,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the node was disabled successfully, False otherwise.
         """
-        return self.server.disable_node(name=node_name)
+        with self.writing(node_name):
+            return self.server.disable_node(name=node_name)
     
     def get_folder_info(self, folder_name):
         """
@@ -626,7 +2558,7 @@ class Jenkins_Helper:
         Returns:
             dict: The information of the folder.
         """
-        return self.server.get_job_info(name=folder_name)
+        return self.read_server("get_job_info", name=folder_name)
     
     def create_folder(self, folder_name, config=None):
         """
@@ -642,10 +2574,11 @@ class Jenkins_Helper:
         if config is None:
             config = jenkins.EMPTY_FOLDER_XML
         try:
-            return self.server.create_job(name=folder_name, config_xml=config)
+            with self.writing(folder_name):
+                return self.server.create_job(name=folder_name, config_xml=config)
         except Exception as e:
             if "already exists" in str(e):
-                self.update_folder(folder_name, config)
+                return self.update_job(folder_name, config)
             else:
                 return False
             
@@ -659,7 +2592,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the folder was deleted successfully, False otherwise.
         """
-        return self.server.delete_job(name=folder_name)
+        with self.writing(folder_name):
+            return self.server.delete_job(name=folder_name)
     
     def copy_folder(self, folder_name, new_folder_name):
         """
@@ -672,7 +2606,8 @@ class Jenkins_Helper:
         Returns:
             bool: True if the folder was copied successfully, False otherwise.
         """
-        return self.server.copy_job(from_name=folder_name, to_name=new_folder_name)
+        with self.writing(folder_name, new_folder_name):
+            return self.server.copy_job(from_name=folder_name, to_name=new_folder_name)
     
     def get_folder_config(self, folder_name):
         """
@@ -684,7 +2619,7 @@ class Jenkins_Helper:
         Returns:
             str: The configuration of the folder in XML format.
         """
-        return self.server.get_job_config(name=folder_name)
+        return self.read_server("get_job_config", name=folder_name)
     
     def get_promotions(self, promo_job_name):
         """
@@ -696,7 +2631,7 @@ class Jenkins_Helper:
         Returns:
             list: The promotions of the job.
         """
-        return self.server.get_promotions(name=promo_job_name)
+        return self.read_server("get_promotions", name=promo_job_name)
     
     def create_promotion(self, promo_job_name, promotion_name, promotion_config = None):
         """
@@ -712,7 +2647,8 @@ class Jenkins_Helper:
         """
         if promotion_config is None:
             promotion_config = jenkins.EMPTY_PROMO_CONFIG_XML
-        return self.server.create_promotion(name=promo_job_name, promotion_name=promotion_name, config_xml=promotion_config)
+        with self.writing(promo_job_name):
+            return self.server.create_promotion(name=promo_job_name, promotion_name=promotion_name, config_xml=promotion_config)
     
     def check_promotion_exists(self, promo_job_name, promotion_name):
         """
@@ -739,11 +2675,11 @@ class Jenkins_Helper:
             str: The configuration of the promotion in XML format.
         """
         try:
-            self.save_xml(self.server.get_promotion_config(name=promo_job_name, promotion_name=promotion_name), promo_job_name, "promotion")
-            return self.server.get_promotion_config(name=promo_job_name, promotion_name=promotion_name)
+            config = self.read_server("get_promotion_config", name=promo_job_name, promotion_name=promotion_name)
         except Exception as e:
-            self.save_xml(jenkins.EMPTY_PROMO_CONFIG_XML, promo_job_name, "promotion")
-            return jenkins.EMPTY_PROMO_CONFIG_XML
+            config = jenkins.EMPTY_PROMO_CONFIG_XML
+        self.save_xml(config, promo_job_name, "promotion")
+        return config
     
     def reconfig_promotion(self, promo_job_name, promotion_name, promotion_config = None):
         """
@@ -759,7 +2695,8 @@ class Jenkins_Helper:
         """
         if promotion_config is None:
             promotion_config = jenkins.PROMO_RECONFIG_XML
-        return self.server.reconfig_promotion(name=promo_job_name, promotion_name=promotion_name, config_xml=promotion_config)
+        with self.writing(promo_job_name):
+            return self.server.reconfig_promotion(name=promo_job_name, promotion_name=promotion_name, config_xml=promotion_config)
     
     def delete_promotion(self, promo_job_name, promotion_name):
         """
@@ -772,97 +2709,666 @@ class Jenkins_Helper:
         Returns:
             bool: True if the promotion was deleted successfully, False otherwise.
         """
-        return self.server.delete_promotion(name=promo_job_name, promotion_name=promotion_name)
+        with self.writing(promo_job_name):
+            return self.server.delete_promotion(name=promo_job_name, promotion_name=promotion_name)
     
-    def save_jenkins_data(self):
+    def map_concurrently(self, func, items):
         """
-        Save all Jenkins data to a JSON file
+        Apply a function to every item using a bounded pool of WORKERS threads
+        
+        At most 2 * WORKERS items are submitted ahead of the result being yielded, so a slow item holds back
+        a fixed number of finished results instead of all of them (a streamed backup keeps its memory flat).
         
         Args:
-            None
+            func (callable): The function to call with each item.
+            items (iterable): The items to process.
+            
+        Returns:
+            generator: The results of the function, in the same order as the items.
+        """
+        items = list(items)
+        if self.WORKERS <= 1 or len(items) <= 1:
+            for item in items:
+                yield func(item)
+            return
+        window = collections.deque()
+        with ThreadPoolExecutor(max_workers=min(self.WORKERS, len(items))) as executor:
+            try:
+                for item in items:
+                    if len(window) >= 2 * self.WORKERS:
+                        yield window.popleft().result()
+                    window.append(executor.submit(func, item))
+                while window:
+                    yield window.popleft().result()
+            finally:
+                for future in window:
+                    future.cancel()
+    
+    def select_jobs(self, jobs):
+        """
+        Resolve the jobs a bulk operation applies to
+        
+        Args:
+            jobs (list | str): The full names of the jobs, or a glob pattern matched against the full names
+                of every job in every folder (e.g. "team-a/*" or "*-nightly").
+                
+        Returns:
+            list: The full names of the jobs.
+        """
+        if not isinstance(jobs, str):
+            return list(jobs)
+        return [job['fullname'] for job in self.server.get_jobs(folder_depth=FOLDER_DEPTH)
+                if 'jobs' not in job and fnmatch.fnmatchcase(job['fullname'], jobs)]
+    
+    def run_bulk(self, action, jobs, operation):
+        """
+        Apply an operation to many jobs with up to WORKERS concurrent requests, without stopping at the first failure
+        
+        Args:
+            action (str): The name of the operation, for the progress output.
+            jobs (list | str): The job names or a glob pattern (see select_jobs).
+            operation (callable): Called with the full name of each job. Failing means raising or returning False.
+            
+        Returns:
+            dict: The names of the jobs that "succeeded" and the error of every job that "failed", keyed by name.
+        """
+        def run(name):
+            try:
+                return None if operation(name) is not False else f"{action} returned False"
+            except Exception as e:
+                return str(e) or type(e).__name__
+        names = self.select_jobs(jobs)
+        print(f"{action} {len(names)} jobs ...")
+        report = {"succeeded": [], "failed": {}}
+        for name, error in zip(names, self.map_concurrently(run, names)):
+            if error is None:
+                report["succeeded"].append(name)
+            else:
+                report["failed"][name] = error
+        print(f"{action}: {len(report['succeeded'])} succeeded, {len(report['failed'])} failed")
+        return report
+    
+    def enable_jobs(self, jobs):
+        """
+        Enable many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        return self.run_bulk("Enabling", jobs, self.enable_job)
+    
+    def disable_jobs(self, jobs):
+        """
+        Disable many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        return self.run_bulk("Disabling", jobs, self.disable_job)
+    
+    def delete_jobs(self, jobs):
+        """
+        Delete many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        return self.run_bulk("Deleting", jobs, self.delete_job)
+    
+    def copy_jobs(self, jobs, new_job_name):
+        """
+        Copy many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            new_job_name (str | callable): The name of each copy, a format string with {name} (e.g. "{name}-release")
+                or a function of the job name. Copies stay in the folder of their job.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        rename = new_job_name if callable(new_job_name) else lambda name: new_job_name.format(name=name)
+        return self.run_bulk("Copying", jobs, lambda name: self.copy_job(name, rename(name)))
+    
+    def update_jobs(self, jobs, config):
+        """
+        Reconfigure many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            config (str | callable): The new configuration in XML format, or a function called with the job name
+                and its current configuration that returns the new one.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        if callable(config):
+            return self.run_bulk("Updating", jobs, lambda name: self.update_job(name, config(name, self.server.get_job_config(name))))
+        return self.run_bulk("Updating", jobs, lambda name: self.update_job(name, config))
+    
+    def update_next_build_numbers(self, jobs, next_build_number):
+        """
+        Set the next build number of many jobs concurrently (see run_bulk)
+        
+        Args:
+            jobs (list | str): The job names or a glob pattern.
+            next_build_number (int): The next build number of every job.
+            
+        Returns:
+            dict: The per-job report of run_bulk.
+        """
+        return self.run_bulk("Renumbering", jobs, lambda name: self.update_next_build_number(name, next_build_number))
+    
+    def harvest_jobs(self, folder_name=""):
+        """
+        Get the jobs of a folder with their builds using depth-limited tree= queries
+        
+        Two requests are made per folder: one lists every job with its build numbers,
+        the other returns the stored build fields for the builds within BUILD_DEPTH.
+        Inside a request scope those fields answer get_build_info for the rest of the run.
+        
+        Args:
+            folder_name (str, optional): The full name of the folder to harvest. Defaults to the top level.
+            
+        Returns:
+            list: The jobs of the folder, each with its 'builds' list. Subfolders also have a 'jobs' key.
+        """
+        item = "".join(f"job/{name}/" for name in folder_name.split("/") if name)
+        jobs = self.server.get_info(item=item, query="?tree=jobs[name,url,color,builds[number,url],jobs[name]{0,1}]")['jobs']
+        details = self.server.get_info(item=item, query=f"?tree=jobs[name,builds[{BULK_BUILD_TREE}]{{0,{self.BUILD_DEPTH + 2}}}]")['jobs']
+        details = {job['name']: job.get('builds', []) for job in details}
+        
+        for job in jobs:
+            job['fullname'] = f"{folder_name}/{job['name']}" if folder_name else job['name']
+            job.setdefault('builds', [])
+            if self.request_cache is not None:
+                for build in details.get(job['name'], []):
+                    key = RequestCache.key("get_build_info", {"name": job['fullname'], "number": build['number']})
+                    self.request_cache.put(key, build)
+        return jobs
+    
+    def list_folder(self, folder_name=""):
+        """
+        List the direct children of a folder with one request (two with BULK, see harvest_jobs)
+        
+        Args:
+            folder_name (str, optional): The full name of the folder to list. Defaults to the top level.
+            
+        Returns:
+            list: The children of the folder with their 'fullname'. Subfolders have a 'jobs' key.
+        """
+        if self.BULK:
+            return self.harvest_jobs(folder_name)
+        item = "".join(f"job/{name}/" for name in folder_name.split("/") if name)
+        children = self.server.get_info(item=item, query="?tree=jobs[name,url,color,jobs[name]{0,1}]")['jobs']
+        for child in children:
+            child['fullname'] = f"{folder_name}/{child['name']}" if folder_name else child['name']
+        return children
+    
+    def crawl_folders(self):
+        """
+        Walk the folder tree breadth-first, listing all folders of a level concurrently
+        
+        Every level costs one round of up to WORKERS concurrent requests, so the time of the crawl grows
+        with the depth of the tree rather than with the number of folders.
+        Jobs inside folders are returned under their full name ("folder/subfolder/job"),
+        which is the name the other job methods take. The crawl stops after FOLDER_DEPTH levels below the top level.
+        
+        Returns:
+            tuple: The folders and the jobs of the tree, both in breadth-first server order.
+                Each folder records its 'fullname' and its 'parent' ("" at the top level).
+        """
+        folders, jobs, level = [], [], [""]
+        depth = 0
+        while level:
+            next_level = []
+            for parent, children in zip(level, self.map_concurrently(self.list_folder, level)):
+                for child in children:
+                    if 'jobs' in child:
+                        del child['jobs']
+                        child.pop('builds', None)
+                        folders.append(dict(child, name=child['fullname'], parent=parent))
+                        next_level.append(child['fullname'])
+                    else:
+                        jobs.append(dict(child, name=child['fullname']))
+            print(f"Crawled {len(level)} folders, found {len(next_level)} subfolders ...")
+            if FOLDER_DEPTH is not None and depth >= FOLDER_DEPTH:
+                break
+            level = next_level
+            depth += 1
+        return folders, jobs
+    
+    def save_folder_data(self, folder):
         """
-        data = {}
-        print("Saving Jobs Info ...")
-        data['jobs'] = self.server.get_jobs()
-        for job in data['jobs']:   
-            self.save_xml(self.get_job_config(job['name']), job['name'], "Job")
+        Save the configuration of a single folder under its full name
+        
+        Args:
+            folder (dict): The folder entry as returned by crawl_folders.
+        """
+        if folder['name'] in self.checkpoint_items['folders']:
+            print(f"Resuming {folder['name']} from checkpoint ...")
+            return self.checkpoint_items['folders'][folder['name']]
+        print(f"Saving {folder['name']} Info ...")
+        with self.metrics.phase("folders"):
+            self.save_xml(self.get_folder_config(folder['name']), folder['name'], "Folder")
+        self.checkpoint("folder", folder)
+        return folder
+    
+    def save_job_data(self, job):
+        """
+        Save the configuration and build history of a single job
+        
+        Args:
+            job (dict): The job entry as returned by the Jenkins server.
             
-            job['builds'] = self.get_job_builds(job['name'])
+        Returns:
+            dict: A copy of the job entry with its builds filled in.
+        """
+        if job['name'] in self.checkpoint_jobs:
+            print(f"Resuming {job['name']} from checkpoint ...")
+            job = self.checkpoint_jobs.pop(job['name'])
+        else:
+            job = dict(job)
+            with self.metrics.phase("jobs"):
+                self.save_xml(self.get_job_config(job['name']), job['name'], "Job")
+                builds = job['builds'] if 'builds' in job else self.get_job_builds(job['name'])
+            job['builds'] = [dict(build) for build in builds]
+            stubs = [dict(build) for build in builds]
+            carried = {**self.previous_builds.get(job['name'], {}), **self.checkpoint_builds.pop(job['name'], {})}
             for build in job['builds']:
-                print(f"Saving {job['name']} {build['number']} Info ...")
-                build['info'] = self.get_build_info(job['name'], build['number'])
-                build['console_output'] = self.get_build_console_output(job['name'], build['number'])
-                build['test_report'] = self.get_build_test_report(job['name'], build['number'])
-                build['changeset'] = self.get_build_changeset(job['name'], build['number'])
-                build['artifacts'] = self.get_build_artifacts(job['name'], build['number'])
+                if build['number'] in carried:
+                    print(f"Keeping {job['name']} {build['number']} Info ...")
+                    build.update(carried[build['number']])
+                    if build.get('console_log'):
+                        self.carry_blob(build['console_log'])
+                else:
+                    print(f"Saving {job['name']} {build['number']} Info ...")
+                    with self.metrics.phase("builds"):
+                        build['info'] = self.get_build_info(job['name'], build['number'])
+                        if self.CONSOLE_FILES:
+                            build['console_log'] = self.save_build_console_output(job['name'], build['number'])
+                        else:
+                            build['console_output'] = self.get_build_console_output(job['name'], build['number'])
+                        build['test_report'] = self.get_build_test_report(job['name'], build['number'])
+                        if self.test_results is not None:
+                            self.test_results.add(job['name'], build['number'], build['test_report'])
+                        build['changeset'] = self.get_build_changeset(job['name'], build['number'])
+                        build['artifacts'] = self.get_build_artifacts(job['name'], build['number'])
+                    if self.ARTIFACTS:
+                        build['artifact_files'] = self.save_build_artifacts(job['name'], build['number'])
+                self.checkpoint("build", build, job=job['name'])
                 if job['builds'].index(build) > self.BUILD_DEPTH:
                     break
-                
-        print("Saving Views Info ...")
-        data['views'] = self.server.get_views()
-        for view in data['views']:
-            print(f"Saving {view['name']} Info ...")
-            self.save_xml(self.get_view_config(view['name']), view['name'], "View")
+            self.checkpoint("job", dict(job, builds=stubs))
+        if self.manifest is not None:
+            archived = [build['number'] for build in job['builds'] if 'info' in build]
+            with self.manifest_lock:
+                self.manifest['jobs'][job['name']] = {"last_build": max(archived, default=0)}
+        self.forget_job_reads(job)
+        return job
+    
+    def forget_job_reads(self, job):
+        """
+        Drop the cached reads of a saved job so a streamed backup does not keep them in memory
         
-        print("Saving Plugins Info ...")
-        plugins = self.server.get_plugins()
-        data['plugins'] = []
-        print(f"Saving {len(plugins)} Plugins Info ..." )
-
-        for key, plugin in plugins.items():
-            print(f"Saving {plugin['shortName']} Info ...")
-            data['plugins'].append(plugin)
+        Args:
+            job (dict): The saved job entry.
+        """
+        if self.request_cache is None:
+            return
+        self.request_cache.discard(RequestCache.key("get_job_info", {"name": job['name']}))
+        self.request_cache.discard(RequestCache.key("get_job_config", {"name": job['name']}))
+        for build in job['builds']:
+            for endpoint in ("get_build_info", "get_build_console_output", "get_build_test_report"):
+                self.request_cache.discard(RequestCache.key(endpoint, {"name": job['name'], "number": build['number']}))
+    
+    def start_incremental_backup(self):
+        """
+        Load the manifest and snapshot of the previous backup for an incremental run
+        
+        The manifest records, per job, the highest archived build number and the hash of every saved config XML.
+        Completed builds up to that number are carried over from the previous snapshot instead of being fetched again,
+        and config files whose hash did not change are not rewritten.
+        """
+        self.manifest = {"configs": {}, "jobs": {}}
+        self.previous_manifest = {"configs": {}, "jobs": {}}
+        self.previous_builds = {}
+        if not (os.path.exists(self.manifest_file) and self.backup_exists()):
+            print("No previous manifest found, running a full backup ...")
+            return
+        with open(self.manifest_file, 'r') as file:
+            self.previous_manifest = json.load(file)
+        previous = self.load_jenkins_data()
+        for job in previous['jobs']:
+            last_build = self.previous_manifest['jobs'].get(job['name'], {}).get('last_build', 0)
+            self.previous_builds[job['name']] = {build['number']: build for build in job['builds']
+                                                 if 'info' in build and build['number'] <= last_build
+                                                 and not build['info'].get('building')}
             
-        print("Saving Nodes Info ...")
-        data['nodes'] = self.server.get_nodes()
-        for node in data['nodes']:
-            print(f"Saving {node['name']} Info ...")
+    def finish_incremental_backup(self):
+        """
+        Write the manifest of the backup that just completed
+        """
+        with open(self.manifest_file, 'w') as file:
+            json.dump(self.manifest, file, indent=2)
+        self.manifest = None
+        self.previous_manifest = None
+        self.previous_builds = {}
+    
+    def checkpoint(self, type, data=None, **fields):
+        """
+        Record in the checkpoint journal that an item of the running backup is persisted
+        
+        Args:
+            type (str): The kind of item ("folder", "job", "build", "view", "node", "config" or "blob").
+            data (dict, optional): The backup record of the item. Defaults to None.
+            **fields: Extra fields identifying the item.
+        """
+        if self.checkpoint_journal is None:
+            return
+        line = json.dumps({"type": type, **fields, "data": data})
+        with self.checkpoint_lock:
+            self.checkpoint_journal.write(line + "\n")
+            self.checkpoint_journal.flush()
+            
+    def load_checkpoint(self):
+        """
+        Load the checkpoint journal of a failed backup so RESUME skips what it already persisted
+        
+        Finished folders, jobs, views and nodes are reused as they are, the saved builds of unfinished jobs are reused
+        like carried-over builds, and config hashes and object index entries are restored.
+        """
+        self.checkpoint_jobs, self.checkpoint_builds = {}, {}
+        self.checkpoint_items = {"folders": {}, "views": {}, "nodes": {}}
+        if not os.path.exists(self.checkpoint_file):
+            print("No checkpoint found, starting from the beginning ...")
+            return
+        with open(self.checkpoint_file, 'r') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may be cut short by the failure
+                    continue
+                if record['type'] == "build":
+                    self.checkpoint_builds.setdefault(record['job'], {})[record['data']['number']] = record['data']
+                elif record['type'] == "job":
+                    self.checkpoint_jobs[record['data']['name']] = record['data']
+                elif record['type'] in ("folder", "view", "node"):
+                    self.checkpoint_items[record['type'] + "s"][record['data']['name']] = record['data']
+                elif record['type'] == "config" and self.manifest is not None:
+                    self.manifest['configs'][record['key']] = record['digest']
+                elif record['type'] == "blob" and self.object_index is not None:
+                    self.object_index[record['path']] = record['digest']
+        for name, job in self.checkpoint_jobs.items():
+            builds = self.checkpoint_builds.pop(name, {})
+            job['builds'] = [builds.get(build['number'], build) for build in job['builds']]
+        print(f"Resuming from checkpoint: {len(self.checkpoint_items['folders'])} folders, {len(self.checkpoint_jobs)} jobs, {len(self.checkpoint_items['views'])} views and {len(self.checkpoint_items['nodes'])} nodes already saved")
+        
+    @contextlib.contextmanager
+    def checkpoint_scope(self):
+        """
+        Journal persisted items for the duration of the block
+        
+        The journal is kept if the block fails, so a later run with RESUME can continue from it,
+        and removed once the block completes.
+        """
+        if self.RESUME:
+            self.load_checkpoint()
+        self.checkpoint_journal = open(self.checkpoint_file, 'a' if self.RESUME else 'w')
+        try:
+            yield
+        finally:
+            self.checkpoint_journal.close()
+            self.checkpoint_journal = None
+        os.remove(self.checkpoint_file)
+    
+    def save_view_data(self, view):
+        """
+        Save the configuration of a single view
+        
+        Args:
+            view (dict): The view entry as returned by the Jenkins server.
+        """
+        if view['name'] in self.checkpoint_items['views']:
+            print(f"Resuming {view['name']} from checkpoint ...")
+            return self.checkpoint_items['views'][view['name']]
+        print(f"Saving {view['name']} Info ...")
+        with self.metrics.phase("views"):
+            self.save_xml(self.get_view_config(view['name']), view['name'], "View")
+        self.checkpoint("view", view)
+        return view
+    
+    def save_node_data(self, node):
+        """
+        Save the configuration of a single node
+        
+        Args:
+            node (dict): The node entry as returned by the Jenkins server.
+        """
+        if node['name'] in self.checkpoint_items['nodes']:
+            print(f"Resuming {node['name']} from checkpoint ...")
+            return self.checkpoint_items['nodes'][node['name']]
+        print(f"Saving {node['name']} Info ...")
+        with self.metrics.phase("nodes"):
             self.save_xml(self.get_node_config(node['name']), node['name'], "Node")
+        self.checkpoint("node", node)
+        return node
+    
+    def save_jenkins_data(self):
+        """
+        Save all Jenkins data to a JSON file (or a JSON Lines file, written as records are fetched, with FORMAT "jsonl")
+        
+        Jobs, views and nodes are fetched with up to WORKERS concurrent requests.
+        With BULK, jobs and build details are harvested with tree= queries instead of one request per build.
+        With FOLDERS, nested folders are crawled level by level (see crawl_folders) and their configs are saved
+        under Folder/ with their full names.
+        Results are collected in server order, so the saved files are the same as a serial run.
+        With INCREMENTAL, builds and configs saved by the previous backup are carried over (see start_incremental_backup).
+        With DEDUP, configs and console logs go to the content-addressed store under objects/ (see write_blob).
+        With ARCHIVE, everything is written into a single zip archive next to FILE_NAME (see start_archive).
+        With ARTIFACTS, the artifacts of every saved build are downloaded on a pool of their own (see artifacts_scope).
+        With TEST_RESULTS, the test cases of every saved build are also written into a SQLite table (see TestResultStore).
+        With CATALOG, every record is also written into an indexed SQLite catalog (see BackupCatalog and find_builds).
+        Every persisted folder, job, build, view and node is recorded in a checkpoint journal, so a failed backup
+        can be continued with RESUME (see load_checkpoint).
+        
+        Args:
+            None
+        """
+        if self.INCREMENTAL:
+            self.start_incremental_backup()
+        if self.DEDUP:
+            self.start_object_index()
+        with self.checkpoint_scope():
+            catalog = BackupCatalog(self.catalog_file, write=True) if self.CATALOG else None
+            with self.request_scope(), self.archive_scope(), self.test_results_scope(), self.artifacts_scope(), \
+                    BackupWriter(self.file_name, self.FORMAT, catalog) as writer:
+                print("Saving Jobs Info ...")
+                folders = []
+                with self.metrics.phase("jobs"):
+                    if self.FOLDERS:
+                        folders, jobs = self.crawl_folders()
+                    else:
+                        jobs = self.harvest_jobs() if self.BULK else self.server.get_jobs()
+                for folder in self.map_concurrently(self.save_folder_data, folders):
+                    writer.write("folders", folder)
+                for job in self.map_concurrently(self.save_job_data, jobs):
+                    writer.write("jobs", job)
+                
+                print("Saving Views Info ...")
+                with self.metrics.phase("views"):
+                    views = self.server.get_views()
+                for view in self.map_concurrently(self.save_view_data, views):
+                    writer.write("views", view)
         
-        with open(self.file_name, 'w') as file:
-            json.dump(data, file)
+                print("Saving Plugins Info ...")
+                with self.metrics.phase("plugins"):
+                    plugins = self.server.get_plugins()
+                print(f"Saving {len(plugins)} Plugins Info ..." )
+
+                for key, plugin in plugins.items():
+                    print(f"Saving {plugin['shortName']} Info ...")
+                    writer.write("plugins", plugin)
+            
+                print("Saving Nodes Info ...")
+                with self.metrics.phase("nodes"):
+                    nodes = self.server.get_nodes()
+                for node in self.map_concurrently(self.save_node_data, nodes):
+                    writer.write("nodes", node)
    
+            if self.INCREMENTAL:
+                self.finish_incremental_backup()
+            if self.DEDUP:
+                self.finish_object_index()
         print("Jenkins data saved successfully")
     
+    def load_remote_items(self):
+        """
+        Fetch the names of the jobs, views and nodes that already exist on the server
+        
+        Uses one request per kind (jobs are listed with a single nested tree query).
+        
+        Returns:
+            dict: The sets of existing names keyed by "Folder", "Job", "View" and "Node".
+        """
+        jobs = {job['fullname'] for job in self.server.get_jobs(folder_depth=FOLDER_DEPTH)}
+        return {
+            "Folder": jobs,
+            "Job": jobs,
+            "View": {view['name'] for view in self.server.get_views()},
+            "Node": {node['name'] for node in self.server.get_nodes()},
+        }
+    
+    def restore_config(self, name, type, config):
+        """
+        Create or reconfigure an item only when the server does not already have the backed-up configuration
+        
+        Missing items are created, existing items are compared by config_fingerprint and reconfigured only
+        when they differ.
+        
+        Args:
+            name (str): The name of the item.
+            type (str): The type of the item ("Folder", "Job", "View" or "Node").
+            config (str): The backed-up configuration in XML format.
+            
+        Returns:
+            str: "created", "updated" or "unchanged".
+        """
+        get_config, create, update = {
+            "Folder": (self.server.get_job_config, self.create_folder, self.update_job),
+            "Job": (self.server.get_job_config, self.create_job, self.update_job),
+            "View": (self.server.get_view_config, self.create_view, self.update_view),
+            "Node": (self.server.get_node_config, self.create_node, self.update_node),
+        }[type]
+        if name not in self.remote_items[type]:
+            create(name, config)
+            outcome = "created"
+        elif config_fingerprint(get_config(name)) != config_fingerprint(config):
+            update(name, config)
+            outcome = "updated"
+        else:
+            outcome = "unchanged"
+        with self.restore_lock:
+            self.restore_stats[outcome] = self.restore_stats.get(outcome, 0) + 1
+        return outcome
+    
+    def plan_restore(self, data):
+        """
+        Order the restore of a backup into levels of independent items
+        
+        Nodes come first (they depend on nothing), then folders and jobs grouped by depth so every folder
+        exists before the items inside it, then views, which list jobs. Plugins are not part of the plan,
+        they are installed as one batch beforehand (see install_plugins).
+        
+        Args:
+            data (dict): The backup data.
+            
+        Returns:
+            list: The levels, each a list of (kind, record) tuples that can be restored concurrently.
+        """
+        levels = [[("node", node) for node in data['nodes']]]
+        depths = {}
+        for folder in data.get('folders', []):
+            depths.setdefault(folder['name'].count("/"), []).append(("folder", folder))
+        for job in data['jobs']:
+            depths.setdefault(job.get('fullname', job['name']).count("/"), []).append(("job", job))
+        levels += [depths[depth] for depth in sorted(depths)]
+        levels.append([("view", view) for view in data['views']])
+        return [level for level in levels if level]
+    
+    def restore_item(self, item):
+        """
+        Restore a single item of a restore plan
+        
+        Args:
+            item (tuple): The kind ("node", "folder", "job" or "view") and backup record of the item.
+        """
+        kind, record = item
+        type = {"node": "Node", "view": "View", "folder": "Folder", "job": "Job"}[kind]
+        print(f"Restoring {record['name']} Info ...")
+        config = self.get_xml(record['name'], type)
+        with self.metrics.phase(kind + "s"):
+            if self.SKIP_UNCHANGED:
+                if self.restore_config(record['name'], type, config) != "created":
+                    return
+            elif kind == "node":
+                self.create_node(record['name'], config)
+            elif kind == "view":
+                self.create_view(record['name'], config)
+            elif kind == "folder":
+                self.create_folder(record['name'], config)
+            else:
+                self.create_job(record['name'], config)
+        if kind == "job":
+            for build in record['builds']:
+                print(f"Restoring {record['name']} {build['number']} Info ...")
+                with self.metrics.phase("builds"):
+                    self.build_job(record['name'],build)
+                if record['builds'].index(build) > self.BUILD_DEPTH:
+                    break
+    
     def restore_jenkins_data(self):
         """
-        Restore all Jenkins data from a JSON file
+        Restore all Jenkins data from a JSON file (or a JSON Lines file with FORMAT "jsonl")
+        
+        Missing plugins are installed first as a single batch (see install_plugins), then the other
+        items are restored level by level in dependency order (see plan_restore), with up to WORKERS
+        concurrent requests inside each level. With SKIP_UNCHANGED only the differing items are written
+        (see restore_config) and builds are replayed only for newly created jobs.
         
         Args:
             None
         """
-        with open(self.file_name, 'r') as file:
-            data = json.load(file)
-
-        print("Restoring Jobs Info ...")
-        jobs = data['jobs']
-        for job in jobs:
-            print(f"Restoring {job['name']} Info ...")
-            self.create_job(job['name'], self.get_xml(job['name'], "Job"))
-            for build in job['builds']:
-                print(f"Restoring {job['name']} {build['number']} Info ...")
-                self.build_job(job['name'],build)
-                if job['builds'].index(build) > self.BUILD_DEPTH:
-                    break
-                
-        print("Restoring Views Info ...")
-        views = data['views']
-        for view in views:
-            print(f"Restoring {view['name']} Info ...")
-            self.create_view(view['name'], self.get_xml(view['name'], "View"))
-            
-        print("Restoring Plugins Info ...")
-        plugins = data['plugins']
-        print(f"Restoring {len(plugins)} Plugins Info ..." )
-        for plugin in plugins:
-            print(f"Restoring {plugin['shortName']} Info ...")
-            self.install_plugin(plugin['shortName'])
-            
-        print("Restoring Nodes Info ...")
-        nodes = data['nodes']
-        for node in nodes:
-            print(f"Restoring {node['name']} Info ...")
-            self.create_node(node['name'], self.get_xml(node['name'], "Node"))   
+        with self.request_scope():
+            data = self.load_jenkins_data()
+            with self.metrics.phase("plugins"):
+                failed = self.install_plugins(data['plugins'])
+            if failed:
+                print(f"Failed to install {len(failed)} Plugins: {', '.join(failed)}")
+            if self.SKIP_UNCHANGED:
+                with self.metrics.phase("jobs"):
+                    self.remote_items = self.load_remote_items()
+                self.restore_stats = {}
+            levels = self.plan_restore(data)
+            for index, level in enumerate(levels):
+                kinds = {}
+                for kind, record in level:
+                    kinds[kind] = kinds.get(kind, 0) + 1
+                print(f"Restoring level {index + 1}/{len(levels)}: " + ", ".join(f"{count} {kind}s" for kind, count in kinds.items()) + " ...")
+                for result in self.map_concurrently(self.restore_item, level):
+                    pass
+            if self.SKIP_UNCHANGED:
+                print(", ".join(f"{self.restore_stats.get(outcome, 0)} {outcome}" for outcome in ("created", "updated", "unchanged")))
         print("Jenkins data restored successfully")
              
 if __name__ == '__main__':
@@ -875,11 +3381,34 @@ if __name__ == '__main__':
     args.add_argument("--RESTORE", help="Restore Jenkins data", action="store_true", default=False)
     args.add_argument("--FILE_NAME", help="Jenkins data file name", default="jenkins_data.json")
     args.add_argument("--BUILD_DEPTH", help="Number of builds to backup or restore", default=3, type=int)
+    args.add_argument("--WORKERS", help="Number of concurrent requests used by the backup and restore", default=1, type=int)
+    args.add_argument("--BULK", help="Harvest jobs and builds with tree= queries", action="store_true", default=False)
+    args.add_argument("--FORMAT", help="Backup file format", choices=["json", "jsonl"], default="json")
+    args.add_argument("--CONSOLE_FILES", help="Save console logs as gzip files under Console/", action="store_true", default=False)
+    args.add_argument("--INCREMENTAL", help="Only fetch what changed since the previous backup", action="store_true", default=False)
+    args.add_argument("--DEDUP", help="Store configs and console logs in a content-addressed object store", action="store_true", default=False)
+    args.add_argument("--ARCHIVE", help="Write the backup into a single indexed zip archive", action="store_true", default=False)
+    args.add_argument("--RESUME", help="Continue a failed backup from its checkpoint", action="store_true", default=False)
+    args.add_argument("--SKIP_UNCHANGED", help="Restore only items whose remote configuration differs from the backup", action="store_true", default=False)
+    args.add_argument("--POOL_SIZE", help="Number of keep-alive connections to the server (0 uses max(10, WORKERS))", default=0, type=int)
+    args.add_argument("--CONNECT_TIMEOUT", help="Seconds to wait for a connection", default=10, type=float)
+    args.add_argument("--READ_TIMEOUT", help="Seconds to wait for a response", default=60, type=float)
+    args.add_argument("--RETRIES", help="Number of retries of a failed idempotent request", default=3, type=int)
+    args.add_argument("--BACKOFF", help="Base delay in seconds of the jittered exponential retry backoff", default=0.5, type=float)
+    args.add_argument("--ADAPTIVE", help="Adapt the number of concurrent requests to the server's latency and errors", action="store_true", default=False)
+    args.add_argument("--MAX_RPS", help="Highest number of requests per second sent to the server (0 for no ceiling)", default=0, type=float)
+    args.add_argument("--METRICS", help="Write request metrics to this file (.prom for a Prometheus textfile, JSON otherwise)", default=None)
+    args.add_argument("--FOLDERS", help="Crawl nested folders and back up the jobs inside them", action="store_true", default=False)
+    args.add_argument("--CACHE_TTL", help="Seconds to keep the results of read methods between calls (0 disables)", default=0, type=float)
+    args.add_argument("--CACHE_SIZE", help="Largest number of results kept by the read cache", default=1024, type=int)
+    args.add_argument("--ARTIFACTS", help="Download the artifacts of the backed-up builds", action="store_true", default=False)
+    args.add_argument("--TEST_RESULTS", help="Write the test cases of the backed-up builds into a SQLite table", action="store_true", default=False)
+    args.add_argument("--CATALOG", help="Write an indexed SQLite catalog of the backup", action="store_true", default=False)
     args = args.parse_args()
     
     jenkins_helper = Jenkins_Helper(args)
-    if args.BACKUP:
-        jenkins_helper.save_jenkins_data()
-    elif args.RESTORE:
+    if args.RESTORE:
         jenkins_helper.restore_jenkins_data()
+    elif args.BACKUP:
+        jenkins_helper.save_jenkins_data()
     
\ No newline at end of file
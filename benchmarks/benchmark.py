@@ -0,0 +1,150 @@
+import argparse, contextlib, json, os, resource, shutil, subprocess, sys, tempfile, time
+from fake_jenkins_server import FakeController, FakeJenkinsServer
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Jenkins_Helper options of every benchmarked mode
+MODES = {
+    "serial": {},
+    "workers": {"WORKERS": 8},
+    "bulk": {"WORKERS": 8, "BULK": True},
+    "stream": {"WORKERS": 8, "BULK": True, "FORMAT": "jsonl", "CONSOLE_FILES": True},
+    "archive": {"WORKERS": 8, "BULK": True, "FORMAT": "jsonl", "CONSOLE_FILES": True, "ARCHIVE": True},
+    "adaptive": {"WORKERS": 16, "BULK": True, "ADAPTIVE": True},
+}
+
+def run_helper(work_dir, url, operation, options):
+    """
+    Run one backup or restore in a fresh interpreter, so its peak RSS is measured on its own
+
+    Args:
+        work_dir (str): The directory holding the copy of Jenkins_helper.py and its jenkins_data/.
+        url (str): The URL of the fake server.
+        operation (str): "backup" or "restore".
+        options (dict): The Jenkins_Helper options of the mode.
+
+    Returns:
+        dict: The wall time in seconds and the peak RSS in kilobytes of the run.
+    """
+    scenario = json.dumps({"work_dir": work_dir, "url": url, "operation": operation, "options": options})
+    output = subprocess.run([sys.executable, os.path.realpath(__file__), "--SCENARIO", scenario],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def run_scenario(scenario):
+    """
+    Body of the child process started by run_helper: print the measurements as the last output line
+    """
+    sys.path.insert(0, scenario["work_dir"])
+    import Jenkins_helper
+    args = argparse.Namespace(JENKINS_URL=scenario["url"], JENKINS_USERNAME="admin", JENKINS_PASSWORD="admin",
+                              FILE_NAME="jenkins_data.json", BUILD_DEPTH=3, **scenario["options"])
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        helper = Jenkins_helper.Jenkins_Helper(args)
+        if scenario["operation"] == "backup":
+            helper.save_jenkins_data()
+        else:
+            helper.restore_jenkins_data()
+    seconds = time.perf_counter() - started
+    print(json.dumps({"seconds": seconds, "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+
+def measure(controller, work_dir, operation, options):
+    """
+    Serve a controller, run one operation against it and collect the client and server side numbers
+
+    Returns:
+        dict: The wall time, request count, bytes sent and received by the server and the client's peak RSS.
+    """
+    server = FakeJenkinsServer(controller).start()
+    try:
+        result = run_helper(work_dir, server.url, operation, options)
+    finally:
+        server.stop()
+    return {"seconds": round(result["seconds"], 3), "requests": controller.requests,
+            "bytes_sent": controller.bytes_sent, "bytes_received": controller.bytes_received,
+            "peak_rss_mb": round(result["peak_rss_kb"] / 1024, 1)}
+
+def benchmark(args):
+    """
+    Back up a synthetic controller and restore it into an empty one for every mode
+
+    Returns:
+        dict: The results keyed by "<mode> <operation>".
+    """
+    size = dict(jobs=args.JOBS, builds=args.BUILDS, log_size=args.LOG_SIZE, folders=args.FOLDERS, latency=args.LATENCY)
+    results = {}
+    for mode in args.MODES.split(","):
+        work_dir = tempfile.mkdtemp(prefix=f"jenkins-benchmark-{mode}-")
+        try:
+            shutil.copy(os.path.join(REPOSITORY, "Jenkins_helper.py"), work_dir)
+            results[f"{mode} backup"] = measure(FakeController(**size), work_dir, "backup", MODES[mode])
+            empty = FakeController(**dict(size, jobs=0, folders=0, views=0, nodes=0, plugins=0))
+            results[f"{mode} restore"] = measure(empty, work_dir, "restore", MODES[mode])
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+def print_results(results, baseline=None):
+    """
+    Print the results as a table, with the change of the wall time against a baseline if given
+    """
+    print(f"{'scenario':<20}{'seconds':>10}{'requests':>10}{'sent MB':>10}{'recv MB':>10}{'RSS MB':>10}{'vs base':>10}")
+    for name, result in results.items():
+        change = ""
+        if baseline and name in baseline:
+            change = f"{result['seconds'] / max(baseline[name]['seconds'], 1e-9) - 1:+.0%}"
+        print(f"{name:<20}{result['seconds']:>10.3f}{result['requests']:>10}{result['bytes_sent'] / 2**20:>10.2f}"
+              f"{result['bytes_received'] / 2**20:>10.2f}{result['peak_rss_mb']:>10.1f}{change:>10}")
+
+def regressions(results, baseline, tolerance):
+    """
+    List the scenarios that got slower, made more requests or used more memory than the baseline allows
+
+    Args:
+        results (dict): The results of this run.
+        baseline (dict): The results of a previous run.
+        tolerance (float): The allowed relative increase, e.g. 0.2 for 20%.
+
+    Returns:
+        list: A description of every regression.
+    """
+    found = []
+    for name, result in results.items():
+        for metric in ("seconds", "requests", "peak_rss_mb"):
+            if name in baseline and result[metric] > baseline[name][metric] * (1 + tolerance):
+                found.append(f"{name}: {metric} {baseline[name][metric]} -> {result[metric]}")
+    return found
+
+if __name__ == '__main__':
+
+    args = argparse.ArgumentParser()
+    args.add_argument("--JOBS", help="Number of jobs in every folder", default=50, type=int)
+    args.add_argument("--BUILDS", help="Number of builds of every job", default=5, type=int)
+    args.add_argument("--LOG_SIZE", help="Size of every console log in bytes", default=64 * 1024, type=int)
+    args.add_argument("--FOLDERS", help="Number of folders", default=0, type=int)
+    args.add_argument("--LATENCY", help="Delay added to every request in seconds", default=0.0, type=float)
+    args.add_argument("--MODES", help="Comma separated modes to run: " + ",".join(MODES), default=",".join(MODES))
+    args.add_argument("--OUTPUT", help="Write the results to this JSON file", default=None)
+    args.add_argument("--BASELINE", help="Compare with the results of a previous --OUTPUT file", default=None)
+    args.add_argument("--TOLERANCE", help="Allowed relative increase over the baseline", default=0.2, type=float)
+    args.add_argument("--SCENARIO", help=argparse.SUPPRESS, default=None)
+    args = args.parse_args()
+
+    if args.SCENARIO:
+        run_scenario(json.loads(args.SCENARIO))
+        sys.exit(0)
+    results = benchmark(args)
+    baseline = None
+    if args.BASELINE:
+        with open(args.BASELINE, 'r') as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+    if args.OUTPUT:
+        with open(args.OUTPUT, 'w') as file:
+            json.dump(results, file, indent=2)
+    if baseline:
+        found = regressions(results, baseline, args.TOLERANCE)
+        for regression in found:
+            print(f"Regression: {regression}")
+        sys.exit(1 if found else 0)
@@ -0,0 +1,641 @@
+import argparse, hashlib, json, re, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+
+JOB_CONFIG_XML = '''<?xml version='1.1' encoding='UTF-8'?>
+<project>
+  <description>{description}</description>
+  <keepDependencies>false</keepDependencies>
+  <properties/>
+  <scm class="hudson.scm.NullSCM"/>
+  <canRoam>true</canRoam>
+  <disabled>false</disabled>
+  <builders>
+    <hudson.tasks.Shell>
+      <command>echo {name}</command>
+    </hudson.tasks.Shell>
+  </builders>
+  <publishers/>
+  <buildWrappers/>
+</project>'''
+
+FOLDER_CONFIG_XML = '''<?xml version='1.1' encoding='UTF-8'?>
+<com.cloudbees.hudson.plugins.folder.Folder plugin="cloudbees-folder@6.1.2">
+  <description>{name}</description>
+  <properties/>
+</com.cloudbees.hudson.plugins.folder.Folder>'''
+
+VIEW_CONFIG_XML = '''<?xml version='1.1' encoding='UTF-8'?>
+<hudson.model.ListView>
+  <name>{name}</name>
+  <filterExecutors>false</filterExecutors>
+  <filterQueue>false</filterQueue>
+  <jobNames>
+{jobs}
+  </jobNames>
+</hudson.model.ListView>'''
+
+NODE_CONFIG_XML = '''<?xml version='1.1' encoding='UTF-8'?>
+<slave>
+  <name>{name}</name>
+  <remoteFS>/var/lib/jenkins</remoteFS>
+  <numExecutors>2</numExecutors>
+  <mode>NORMAL</mode>
+</slave>'''
+
+FOLDER_CLASS = "com.cloudbees.hudson.plugins.folder.Folder"
+JOB_CLASS = "hudson.model.FreeStyleProject"
+BUILD_CLASS = "hudson.model.FreeStyleBuild"
+
+def parse_tree(text):
+    """
+    Parse a Jenkins tree= expression into a list of (field, children, range) tuples
+
+    Args:
+        text (str): The tree expression, e.g. jobs[name,builds[number]{0,3}].
+
+    Returns:
+        list: The parsed fields.
+    """
+    fields, position = parse_fields(text, 0)
+    return fields
+
+def parse_fields(text, position):
+    fields = []
+    while position < len(text) and text[position] != "]":
+        match = re.match(r"[\w$*.]+", text[position:])
+        name = match.group(0)
+        position += len(name)
+        children = None
+        item_range = None
+        if position < len(text) and text[position] == "[":
+            children, position = parse_fields(text, position + 1)
+            position += 1
+        if position < len(text) and text[position] == "{":
+            end = text.index("}", position)
+            item_range = text[position + 1:end]
+            position = end + 1
+        fields.append((name, children, item_range))
+        if position < len(text) and text[position] == ",":
+            position += 1
+    return fields, position
+
+def apply_tree(value, fields):
+    """
+    Filter a JSON value the way Jenkins does for a tree= query
+
+    Args:
+        value (object): The full JSON value.
+        fields (list): The parsed tree expression.
+
+    Returns:
+        object: The filtered JSON value.
+    """
+    if isinstance(value, list):
+        return [apply_tree(item, fields) for item in value]
+    if not isinstance(value, dict) or fields is None:
+        return value
+    result = {"_class": value["_class"]} if "_class" in value else {}
+    for name, children, item_range in fields:
+        names = value.keys() if name == "*" else [name]
+        for key in names:
+            if key not in value:
+                continue
+            item = value[key]
+            if callable(item):
+                item = item()
+            if isinstance(item, list) and item_range is not None:
+                start, _, end = item_range.partition(",")
+                item = item[int(start or 0):int(end) if end else None]
+            result[key] = apply_tree(item, children)
+    return result
+
+class FakeController:
+    def __init__(self, jobs=10, builds=5, log_size=4096, folders=0, folder_depth=1,
+                 views=2, nodes=2, plugins=5, tests=5, latency=0.0, error_every=0, queue_delay=0.2, build_time=0.3, available_plugins=50):
+        """
+        An in-memory Jenkins controller with synthetic jobs, builds, views, nodes and plugins
+
+        Args:
+            jobs (int): The number of jobs in every folder.
+            builds (int): The number of builds of every job.
+            log_size (int): The size of every console log in bytes.
+            folders (int): The number of folders on every folder level.
+            folder_depth (int): The number of nested folder levels.
+            views (int): The number of views.
+            nodes (int): The number of nodes.
+            plugins (int): The number of plugins.
+            tests (int): The number of test cases in every test report.
+            latency (float): The delay added to every request in seconds.
+            error_every (int): Answer every Nth GET request with error_status, 502 by default (0 disables the fault injection).
+            queue_delay (float): The seconds a triggered build waits in the queue before it starts.
+            build_time (float): The seconds a triggered build runs.
+            available_plugins (int): The number of plugins the update center offers ("plugin-0" to "plugin-<n-1>").
+        """
+        self.lock = threading.RLock()
+        self.log_size = log_size
+        self.tests = tests
+        self.latency = latency
+        self.error_every = error_every
+        self.error_status = 502
+        self.errors = 0
+        self.connections = 0
+        self.items = {}
+        self.views = {}
+        self.nodes = {}
+        self.plugins = {}
+        self.queue = {}
+        self.next_queue_id = 1
+        self.queue_delay = queue_delay
+        self.build_time = build_time
+        self.available_plugins = {f"plugin-{index}" for index in range(available_plugins)}
+        self.update_center_jobs = []
+        self.restart_required = False
+        self.restarts = 0
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.requests_by_endpoint = {}
+        self.populate("", jobs, builds, folders, folder_depth)
+        for index in range(views):
+            name = f"view-{index}"
+            members = [path for path in self.items if self.items[path]["kind"] == "job"][index::max(views, 1)]
+            self.views[name] = VIEW_CONFIG_XML.format(name=name, jobs="\n".join(f"    <string>{job}</string>" for job in members))
+        for index in range(nodes):
+            name = f"node-{index}"
+            self.nodes[name] = {"config": NODE_CONFIG_XML.format(name=name), "offline": False}
+        for index in range(plugins):
+            name = f"plugin-{index}"
+            self.plugins[name] = {"shortName": name, "longName": f"Plugin {index}", "version": f"1.{index}",
+                                  "active": True, "enabled": True, "dependencies": []}
+
+    def populate(self, parent, jobs, builds, folders, folder_depth):
+        for index in range(jobs):
+            path = f"{parent}job-{index}"
+            self.items[path] = {"kind": "job", "config": JOB_CONFIG_XML.format(name=path, description=""),
+                                "builds": {}, "next_build": 1}
+            for number in range(1, builds + 1):
+                self.add_build(path, result="SUCCESS" if (number + index) % 3 else "FAILURE")
+        if folder_depth <= 0:
+            return
+        for index in range(folders):
+            path = f"{parent}folder-{index}"
+            self.items[path] = {"kind": "folder", "config": FOLDER_CONFIG_XML.format(name=path)}
+            self.populate(path + "/", jobs, builds, folders, folder_depth - 1)
+
+    def add_build(self, path, result="SUCCESS", building=False, parameters=None, queue_id=0):
+        job = self.items[path]
+        number = job["next_build"]
+        job["next_build"] += 1
+        job["builds"][number] = {"number": number, "result": None if building else result,
+                                 "building": building, "timestamp": 1700000000000 + number * 60000,
+                                 "duration": 0 if building else 1000 * number, "parameters": parameters or {}, "queue_id": queue_id,
+                                 "finish_at": time.time() + (self.build_time if building else 0), "final_result": result}
+        return number
+
+    def refresh(self, build):
+        if build["building"] and time.time() >= build["finish_at"]:
+            build["building"] = False
+            build["result"] = build["final_result"]
+            build["duration"] = 300
+
+    def url(self, path):
+        return "http://fake/" + "".join(f"job/{part}/" for part in path.split("/"))
+
+    def children(self, parent):
+        prefix = parent + "/" if parent else ""
+        return [path for path in self.items if path.startswith(prefix) and "/" not in path[len(prefix):]]
+
+    def console(self, path, number):
+        line = f"[{path} #{number}] step output\n"
+        return (line * (self.log_size // len(line) + 1))[:self.log_size]
+
+    def artifact(self, path, number, name):
+        return (f"{path}#{number}:{name}\n" * 512).encode()
+
+    def build_json(self, path, number):
+        build = self.items[path]["builds"][number]
+        self.refresh(build)
+        artifacts = [{"fileName": "app.txt", "relativePath": "dist/app.txt", "displayPath": "app.txt"}]
+        fail = self.test_report(path, number)["failCount"]
+        return {"_class": BUILD_CLASS, "number": number, "url": f"{self.url(path)}{number}/", "queueId": build["queue_id"],
+                "result": build["result"], "building": build["building"], "timestamp": build["timestamp"],
+                "duration": build["duration"], "builtOn": f"node-{number % 2}", "fullDisplayName": f"{path} #{number}",
+                "artifacts": artifacts,
+                "fingerprint": [{"fileName": "app.txt", "hash": hashlib.md5(self.artifact(path, number, "dist/app.txt")).hexdigest()}],
+                "changeSet": {"_class": "hudson.plugins.git.GitChangeSetList", "kind": "git",
+                              "items": [{"commitId": f"{number:040x}", "msg": f"change {number}", "author": {"fullName": "dev"}}]},
+                "actions": [{"_class": "hudson.model.ParametersAction",
+                             "parameters": [{"name": key, "value": value} for key, value in build["parameters"].items()]},
+                            {"_class": "hudson.tasks.junit.TestResultAction", "failCount": fail, "skipCount": 0, "totalCount": self.tests}]}
+
+    def test_report(self, path, number):
+        cases = [{"className": f"suite.Test{index % 2}", "name": f"test_{index}", "duration": 0.01 * (index + 1),
+                  "status": "FAILED" if (index + number) % 7 == 0 else "PASSED"} for index in range(self.tests)]
+        suites = {}
+        for case in cases:
+            suites.setdefault(case["className"], []).append(case)
+        fail = sum(case["status"] == "FAILED" for case in cases)
+        return {"_class": "hudson.tasks.junit.TestResult", "duration": sum(case["duration"] for case in cases),
+                "failCount": fail, "passCount": len(cases) - fail, "skipCount": 0,
+                "suites": [{"name": name, "duration": sum(case["duration"] for case in items), "cases": items}
+                           for name, items in suites.items()]}
+
+    def job_json(self, path):
+        item = self.items[path]
+        name = path.rsplit("/", 1)[-1]
+        if item["kind"] == "folder":
+            return {"_class": FOLDER_CLASS, "name": name, "fullName": path, "url": self.url(path),
+                    "jobs": lambda: [self.job_json(child) for child in self.children(path)]}
+        numbers = sorted(item["builds"], reverse=True)
+        completed = [number for number in numbers if not item["builds"][number]["building"]]
+        last = lambda numbers: {"_class": BUILD_CLASS, "number": numbers[0], "url": f"{self.url(path)}{numbers[0]}/"} if numbers else None
+        disabled = "<disabled>true</disabled>" in item["config"]
+        return {"_class": JOB_CLASS, "name": name, "fullName": path, "url": self.url(path),
+                "color": "disabled" if disabled else "blue", "buildable": not disabled,
+                "builds": lambda: [self.build_json(path, number) for number in numbers],
+                "lastBuild": last(numbers), "lastCompletedBuild": last(completed), "nextBuildNumber": item["next_build"]}
+
+    def job_summary(self, path, depth_builds=True):
+        info = self.job_json(path)
+        if "builds" in info:
+            numbers = sorted(self.items[path]["builds"], reverse=True)
+            info["builds"] = [{"_class": BUILD_CLASS, "number": number, "url": f"{self.url(path)}{number}/"} for number in numbers]
+        if "jobs" in info:
+            info["jobs"] = [{"_class": self.job_json(child)["_class"], "name": child.rsplit("/", 1)[-1],
+                             "url": self.url(child)} for child in self.children(path)]
+        return info
+
+    def root_json(self):
+        return {"_class": "hudson.model.Hudson", "mode": "NORMAL", "quietingDown": False,
+                "jobs": lambda: [self.job_json(child) for child in self.children("")],
+                "views": [{"_class": "hudson.model.ListView", "name": name, "url": f"http://fake/view/{name}/"} for name in self.views]}
+
+class FakeJenkinsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def controller(self):
+        return self.server.controller
+
+    def setup(self):
+        super().setup()
+        with self.controller.lock:
+            self.controller.connections += 1
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_HEAD(self):
+        self.handle_request("HEAD")
+
+    def handle_request(self, method):
+        controller = self.controller
+        if controller.latency:
+            time.sleep(controller.latency)
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        with controller.lock:
+            controller.requests += 1
+            controller.bytes_received += length
+            endpoint = self.endpoint_name(parts)
+            controller.requests_by_endpoint[endpoint] = controller.requests_by_endpoint.get(endpoint, 0) + 1
+            if controller.error_every and method == "GET" and controller.requests % controller.error_every == 0:
+                controller.errors += 1
+                return self.send_body(controller.error_status, b"Overloaded", "text/plain", {"Retry-After": "0"})
+            try:
+                self.route(method, parts)
+            except KeyError:
+                self.send_body(404, b"Not Found", "text/plain")
+
+    def endpoint_name(self, parts):
+        return "/".join("*" if index > 0 and parts[index - 1] in ("job", "view", "computer", "item") or part.isdigit() else part
+                        for index, part in enumerate(parts)) or "/"
+
+    def send_body(self, status, body=b"", content_type="application/json", headers=None):
+        if isinstance(body, str):
+            body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Jenkins", "2.440")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        self.controller.bytes_sent += len(body)
+
+    def send_json(self, value):
+        tree = self.query.get("tree")
+        if tree:
+            value = apply_tree(value, parse_tree(tree))
+        self.send_body(200, json.dumps(resolve(value)))
+
+    def route(self, method, parts):
+        controller = self.controller
+        path = []
+        while len(parts) >= 2 and parts[0] == "job":
+            path.append(parts[1])
+            parts = parts[2:]
+        path = "/".join(path)
+        if path:
+            return self.item_endpoint(method, path, parts)
+        if not parts or parts == ["api", "json"]:
+            return self.send_json(controller.root_json() if self.query.get("tree") else summary_root(controller))
+        head = parts[0]
+        if head == "me":
+            return self.send_json({"id": "admin", "fullName": "admin"})
+        if head == "crumbIssuer":
+            return self.send_json({"crumb": "fake-crumb", "crumbRequestField": "Jenkins-Crumb"})
+        if head == "createItem" and method == "POST":
+            return self.create_item("", self.query["name"])
+        if head == "createView" and method == "POST":
+            controller.views[self.query["name"]] = self.body.decode() or VIEW_CONFIG_XML.format(name=self.query["name"], jobs="")
+            return self.send_body(200)
+        if head == "view":
+            return self.view_endpoint(method, parts[1], parts[2:])
+        if head == "computer":
+            return self.computer_endpoint(method, parts[1:])
+        if head == "pluginManager":
+            return self.plugin_manager_endpoint(method, parts[1:])
+        if head == "updateCenter":
+            return self.send_json({"_class": "hudson.model.UpdateCenter", "restartRequiredForCompletion": controller.restart_required,
+                               "jobs": controller.update_center_jobs})
+        if head in ("safeRestart", "restart") and method == "POST":
+            controller.restarts += 1
+            controller.restart_required = False
+            return self.send_body(200)
+        if head == "queue":
+            return self.queue_endpoint(method, parts[1:])
+        if head == "scriptText":
+            return self.send_body(200, "Result: false\n", "text/plain")
+        raise KeyError(head)
+
+    def create_item(self, parent, name):
+        controller = self.controller
+        path = f"{parent}/{name}" if parent else name
+        if path in controller.items:
+            return self.send_body(400, f"A job already exists with the name '{name}'", "text/plain")
+        if self.query.get("mode") == "copy":
+            source = f"{parent}/{self.query['from']}" if parent else self.query["from"]
+            config = controller.items[source]["config"]
+        else:
+            config = self.body.decode()
+        kind = "folder" if FOLDER_CLASS in config.split("\n", 2)[-1][:200] else "job"
+        controller.items[path] = {"kind": kind, "config": config, "builds": {}, "next_build": 1}
+        return self.send_body(200)
+
+    def item_endpoint(self, method, path, parts):
+        controller = self.controller
+        item = controller.items[path]
+        if not parts or parts == ["api", "json"]:
+            if self.query.get("tree"):
+                return self.send_json(controller.job_json(path))
+            return self.send_json(controller.job_summary(path))
+        head = parts[0]
+        if head == "config.xml":
+            if method == "POST":
+                item["config"] = self.body.decode()
+                return self.send_body(200)
+            return self.send_body(200, item["config"], "application/xml")
+        if head == "createItem" and method == "POST":
+            return self.create_item(path, self.query["name"])
+        if head == "doDelete" and method == "POST":
+            for other in [other for other in controller.items if other == path or other.startswith(path + "/")]:
+                del controller.items[other]
+            return self.send_body(200)
+        if head in ("enable", "disable") and method == "POST":
+            config = re.sub(r"<disabled>\w+</disabled>", f"<disabled>{'true' if head == 'disable' else 'false'}</disabled>", item["config"])
+            item["config"] = config
+            return self.send_body(200)
+        if head == "nextbuildnumber" and method == "POST":
+            item["next_build"] = int(parse_qs(self.body.decode()).get("nextBuildNumber", [item["next_build"]])[0])
+            return self.send_body(200)
+        if head in ("build", "buildWithParameters") and method == "POST":
+            queue_id = controller.next_queue_id
+            controller.next_queue_id += 1
+            controller.queue[queue_id] = {"id": queue_id, "job": path, "created": time.time(), "parameters": dict(self.query),
+                                          "executable": None, "cancelled": False}
+            return self.send_body(201, b"", "text/plain", {"Location": f"http://fake/queue/item/{queue_id}/"})
+        if head.isdigit() or head in ("lastBuild", "lastCompletedBuild"):
+            number = int(head) if head.isdigit() else controller.job_json(path)[head]["number"]
+            return self.build_endpoint(method, path, number, parts[1:])
+        raise KeyError(head)
+
+    def build_endpoint(self, method, path, number, parts):
+        controller = self.controller
+        build = controller.items[path]["builds"][number]
+        controller.refresh(build)
+        if not parts or parts == ["api", "json"]:
+            return self.send_json(controller.build_json(path, number))
+        head = parts[0]
+        if head == "consoleText":
+            return self.send_body(200, controller.console(path, number), "text/plain")
+        if head == "logText":
+            text = controller.console(path, number).encode()
+            start = int(self.query.get("start") or 0)
+            headers = {"X-Text-Size": str(len(text))}
+            if build["building"]:
+                headers["X-More-Data"] = "true"
+            return self.send_body(200, text[start:], "text/plain", headers)
+        if head == "testReport":
+            return self.send_json(controller.test_report(path, number))
+        if head == "artifact":
+            content = controller.artifact(path, number, "/".join(parts[1:]))
+            byte_range = self.headers.get("Range")
+            if byte_range:
+                start = int(re.match(r"bytes=(\d+)-", byte_range).group(1))
+                return self.send_body(206, content[start:], "application/octet-stream",
+                                  {"Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"})
+            return self.send_body(200, content, "application/octet-stream")
+        if head == "stop" and method == "POST":
+            build["final_result"] = "ABORTED"
+            build["finish_at"] = 0
+            return self.send_body(200)
+        raise KeyError(head)
+
+    def view_endpoint(self, method, name, parts):
+        controller = self.controller
+        config = controller.views[name]
+        if not parts or parts == ["api", "json"]:
+            members = re.findall(r"<string>(.*?)</string>", config)
+            return self.send_json({"_class": "hudson.model.ListView", "name": name, "url": f"http://fake/view/{name}/",
+                               "jobs": [{"name": member, "url": controller.url(member)} for member in members]})
+        if parts[0] == "config.xml":
+            if method == "POST":
+                controller.views[name] = self.body.decode()
+                return self.send_body(200)
+            return self.send_body(200, config, "application/xml")
+        if parts[0] == "doDelete" and method == "POST":
+            del controller.views[name]
+            return self.send_body(200)
+        raise KeyError(parts[0])
+
+    def computer_endpoint(self, method, parts):
+        controller = self.controller
+        if not parts or parts == ["api", "json"]:
+            computers = [{"_class": "hudson.slaves.SlaveComputer", "displayName": name, "offline": node["offline"],
+                          "idle": True, "numExecutors": 2} for name, node in controller.nodes.items()]
+            return self.send_json({"computer": computers, "busyExecutors": 0, "totalExecutors": 2 * len(computers)})
+        if parts[0] == "doCreateItem" and method == "POST":
+            params = parse_qs(self.body.decode())
+            name = params["name"][0]
+            controller.nodes[name] = {"config": NODE_CONFIG_XML.format(name=name), "offline": False}
+            return self.send_body(200)
+        node = controller.nodes[parts[0]]
+        rest = parts[1:]
+        if not rest or rest == ["api", "json"]:
+            return self.send_json({"_class": "hudson.slaves.SlaveComputer", "displayName": parts[0],
+                               "offline": node["offline"], "temporarilyOffline": node["offline"]})
+        if rest[0] == "config.xml":
+            if method == "POST":
+                node["config"] = self.body.decode()
+                return self.send_body(200)
+            return self.send_body(200, node["config"], "application/xml")
+        if rest[0] == "doDelete" and method == "POST":
+            del controller.nodes[parts[0]]
+            return self.send_body(200)
+        if rest[0] == "toggleOffline" and method == "POST":
+            node["offline"] = not node["offline"]
+            return self.send_body(200)
+        raise KeyError(rest[0])
+
+    def plugin_manager_endpoint(self, method, parts):
+        controller = self.controller
+        if not parts or parts == ["api", "json"]:
+            return self.send_json({"plugins": list(controller.plugins.values())})
+        if parts[0] == "installNecessaryPlugins" and method == "POST":
+            for install in ElementTree.fromstring(self.body.decode()).iter("install"):
+                name, _, version = install.get("plugin").partition("@")
+                version = version if version and version != "latest" else "1.0"
+                # like Jenkins, no installation job for plugins the update center does not offer or that are already newer
+                if name not in controller.available_plugins or name in controller.plugins and \
+                        [int(part) for part in controller.plugins[name]["version"].split(".")] >= [int(part) for part in version.split(".")]:
+                    continue
+                controller.plugins[name] = {"shortName": name, "longName": name, "version": version,
+                                            "active": False, "enabled": True, "dependencies": []}
+                controller.update_center_jobs.append({"_class": "hudson.model.UpdateCenter$InstallationJob",
+                                                      "id": len(controller.update_center_jobs) + 1, "name": name,
+                                                      "status": {"_class": "hudson.model.UpdateCenter$DownloadJob$Success", "success": True}})
+                controller.restart_required = True
+            return self.send_body(302, b"", "text/plain", {"Location": "/updateCenter/api/json"})
+        if parts[0] == "plugin":
+            return self.send_json(controller.plugins[parts[1]])
+        raise KeyError(parts[0])
+
+    def queue_endpoint(self, method, parts):
+        controller = self.controller
+        self.advance_queue()
+        if not parts or parts == ["api", "json"]:
+            items = [self.queue_json(item) for item in controller.queue.values() if item["executable"] is None and not item["cancelled"]]
+            return self.send_json({"_class": "hudson.model.Queue", "items": items})
+        if parts[0] == "item":
+            return self.send_json(self.queue_json(controller.queue[int(parts[1])]))
+        if parts[0] == "cancelItem" and method == "POST":
+            controller.queue[int(self.query["id"])]["cancelled"] = True
+            return self.send_body(302, b"", "text/plain", {"Location": "/queue/"})
+        raise KeyError(parts[0])
+
+    def advance_queue(self):
+        controller = self.controller
+        for item in controller.queue.values():
+            if item["executable"] is None and not item["cancelled"] and time.time() - item["created"] > controller.queue_delay:
+                if item["job"] in controller.items:
+                    item["executable"] = controller.add_build(item["job"], building=True, parameters=item["parameters"], queue_id=item["id"])
+
+    def queue_json(self, item):
+        controller = self.controller
+        data = {"_class": "hudson.model.Queue$WaitingItem", "id": item["id"], "blocked": False, "stuck": False,
+                "cancelled": item["cancelled"], "inQueueSince": int(item["created"] * 1000),
+                "task": {"name": item["job"].rsplit("/", 1)[-1], "url": controller.url(item["job"])},
+                "why": None if item["executable"] else "Waiting for next available executor"}
+        if item["executable"] is not None:
+            data["executable"] = {"_class": BUILD_CLASS, "number": item["executable"],
+                                  "url": f"{controller.url(item['job'])}{item['executable']}/"}
+        return data
+
+def summary_root(controller):
+    root = controller.root_json()
+    root["jobs"] = [{"_class": controller.job_json(child)["_class"], "name": child, "url": controller.url(child),
+                     "color": controller.job_json(child).get("color", "")} for child in controller.children("")]
+    return root
+
+def resolve(value):
+    if callable(value):
+        value = value()
+    if isinstance(value, dict):
+        return {key: resolve(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item) for item in value]
+    return value
+
+class FakeJenkinsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, controller, port=0):
+        """
+        A local HTTP server that answers the Jenkins endpoints used by Jenkins_Helper
+
+        Requests are handled on one thread each; the latency delay runs in parallel, the handling itself is
+        serialized by the controller lock.
+
+        Args:
+            controller (FakeController): The synthetic controller to serve.
+            port (int, optional): The port to listen on. Defaults to a free port.
+        """
+        super().__init__(("127.0.0.1", port), FakeJenkinsHandler)
+        self.controller = controller
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def start(self):
+        """
+        Serve requests on a background thread
+
+        Returns:
+            FakeJenkinsServer: The running server.
+        """
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving requests
+        """
+        self.shutdown()
+        self.server_close()
+
+if __name__ == '__main__':
+
+    args = argparse.ArgumentParser()
+    args.add_argument("--PORT", help="Port to listen on", default=8080, type=int)
+    args.add_argument("--JOBS", help="Number of jobs in every folder", default=10, type=int)
+    args.add_argument("--BUILDS", help="Number of builds of every job", default=5, type=int)
+    args.add_argument("--LOG_SIZE", help="Size of every console log in bytes", default=4096, type=int)
+    args.add_argument("--FOLDERS", help="Number of folders on every folder level", default=0, type=int)
+    args.add_argument("--FOLDER_DEPTH", help="Number of nested folder levels", default=1, type=int)
+    args.add_argument("--LATENCY", help="Delay added to every request in seconds", default=0.0, type=float)
+    args.add_argument("--ERROR_EVERY", help="Answer every Nth GET request with a 502 (0 disables it)", default=0, type=int)
+    args = args.parse_args()
+
+    controller = FakeController(jobs=args.JOBS, builds=args.BUILDS, log_size=args.LOG_SIZE, folders=args.FOLDERS,
+                                folder_depth=args.FOLDER_DEPTH, latency=args.LATENCY, error_every=args.ERROR_EVERY)
+    server = FakeJenkinsServer(controller, port=args.PORT)
+    print(f"Fake Jenkins server listening on {server.url}")
+    server.serve_forever()
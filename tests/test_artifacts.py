@@ -0,0 +1,42 @@
+import argparse, contextlib, importlib.util, io, os, shutil, sys, tempfile, unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(REPOSITORY, "benchmarks"))
+from fake_jenkins_server import FakeController, FakeJenkinsServer
+
+class ArtifactsTest(unittest.TestCase):
+    def setUp(self):
+        # a copy of the helper, so its jenkins_data/ directory is created in a temporary directory
+        self.work_dir = tempfile.mkdtemp(prefix="jenkins-helper-test-")
+        shutil.copy(os.path.join(REPOSITORY, "Jenkins_helper.py"), self.work_dir)
+        spec = importlib.util.spec_from_file_location("Jenkins_helper", os.path.join(self.work_dir, "Jenkins_helper.py"))
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.controller = FakeController(jobs=3, builds=2, views=0, nodes=0, plugins=0)
+        self.server = FakeJenkinsServer(self.controller).start()
+        args = argparse.Namespace(JENKINS_URL=self.server.url, JENKINS_USERNAME="admin", JENKINS_PASSWORD="admin",
+                                  FILE_NAME="jenkins_data.json", BUILD_DEPTH=3, WORKERS=4, ARTIFACTS=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.helper = self.module.Jenkins_Helper(args)
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_artifact_requests_are_counted_in_the_artifacts_phase(self):
+        # the connection check is made outside of any phase
+        other = self.helper.metrics.summary()['phases'].get("other")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.helper.save_jenkins_data()
+        downloaded = [artifact for job in self.helper.load_jenkins_data()['jobs'] for build in job['builds']
+                      for artifact in build.get('artifact_files', [])]
+        self.assertTrue(downloaded)
+        self.assertTrue(all(artifact['status'] == "downloaded" for artifact in downloaded))
+        phases = self.helper.metrics.summary()['phases']
+        self.assertIn("artifacts", phases)
+        self.assertGreaterEqual(phases["artifacts"]["http_requests"], len(downloaded))
+        self.assertGreater(phases["artifacts"]["bytes"], 0)
+        self.assertEqual(phases.get("other"), other)
+
+if __name__ == '__main__':
+    unittest.main()
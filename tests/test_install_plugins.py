@@ -0,0 +1,53 @@
+import argparse, contextlib, importlib.util, io, os, shutil, sys, tempfile, unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, os.path.join(REPOSITORY, "benchmarks"))
+from fake_jenkins_server import FakeController, FakeJenkinsServer
+
+class InstallPluginsTest(unittest.TestCase):
+    def setUp(self):
+        # a copy of the helper, so its jenkins_data/ directory is created in a temporary directory
+        self.work_dir = tempfile.mkdtemp(prefix="jenkins-helper-test-")
+        shutil.copy(os.path.join(REPOSITORY, "Jenkins_helper.py"), self.work_dir)
+        spec = importlib.util.spec_from_file_location("Jenkins_helper", os.path.join(self.work_dir, "Jenkins_helper.py"))
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.controller = FakeController(jobs=0, plugins=3, available_plugins=5)
+        self.server = FakeJenkinsServer(self.controller).start()
+        args = argparse.Namespace(JENKINS_URL=self.server.url, JENKINS_USERNAME="admin", JENKINS_PASSWORD="admin",
+                                  FILE_NAME="jenkins_data.json", BUILD_DEPTH=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.helper = self.module.Jenkins_Helper(args)
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def install(self, plugins):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            failed = self.helper.install_plugins(plugins, timeout=5)
+        return failed, output.getvalue()
+
+    def test_unknown_and_newer_plugins_are_skipped(self):
+        installed = self.controller.plugins["plugin-1"]["version"]
+        plugins = [{"shortName": "plugin-4", "version": "1.0"},
+                   {"shortName": "not-in-update-center", "version": "1.0"},
+                   {"shortName": "plugin-1", "version": "0.1"},
+                   {"shortName": "plugin-2", "version": "9.0"}]
+        failed, output = self.install(plugins)
+        self.assertEqual(failed, [])
+        self.assertIn("not-in-update-center", output)
+        self.assertEqual(self.controller.plugins["plugin-1"]["version"], installed)
+        self.assertEqual(self.controller.plugins["plugin-2"]["version"], "9.0")
+        self.assertIn("plugin-4", self.controller.plugins)
+        self.assertNotIn("not-in-update-center", self.controller.plugins)
+        self.assertEqual(self.controller.restarts, 1)
+
+    def test_plugins_to_install(self):
+        installed = {"a": "1.10", "b": "2.0", "c": "1.0"}
+        plugins = [{"shortName": "a", "version": "1.9"}, {"shortName": "b", "version": "2.0.1"},
+                   {"shortName": "c", "version": "1.0"}, {"shortName": "d"}]
+        self.assertEqual(self.module.plugins_to_install(installed, plugins), {"b": "2.0.1", "d": "latest"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import importlib.util, os, shutil, tempfile, unittest
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+class TestResultStoreTest(unittest.TestCase):
+    def setUp(self):
+        # a copy of the helper, so its jenkins_data/ directory is created in a temporary directory
+        self.work_dir = tempfile.mkdtemp(prefix="jenkins-helper-test-")
+        shutil.copy(os.path.join(REPOSITORY, "Jenkins_helper.py"), self.work_dir)
+        spec = importlib.util.spec_from_file_location("Jenkins_helper", os.path.join(self.work_dir, "Jenkins_helper.py"))
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.store = self.module.TestResultStore(os.path.join(self.work_dir, "tests.sqlite"))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_cases_with_the_same_name_in_different_classes_are_kept(self):
+        report = {"suites": [{"name": "pytest", "cases": [
+            {"className": "tests.test_a.TestA", "name": "test_run", "status": "PASSED", "duration": 0.1},
+            {"className": "tests.test_b.TestB", "name": "test_run", "status": "FAILED", "duration": 0.2}]}]}
+        self.assertEqual(self.store.add("job", 1, report), 2)
+        rows = self.store.query("SELECT class_name, status FROM test_results ORDER BY class_name")
+        self.assertEqual(rows, [{"class_name": "tests.test_a.TestA", "status": "PASSED"},
+                                {"class_name": "tests.test_b.TestB", "status": "FAILED"}])
+
+    def test_flipped_tests_are_tracked_per_class(self):
+        for build, statuses in enumerate([("PASSED", "PASSED"), ("FAILED", "PASSED"), ("PASSED", "PASSED")], 1):
+            self.store.add("job", build, {"suites": [{"name": "pytest", "cases": [
+                {"className": "A", "name": "test_run", "status": statuses[0], "duration": 0.1},
+                {"className": "B", "name": "test_run", "status": statuses[1], "duration": 0.1}]}]})
+        flipped = self.store.flipped_tests("job")
+        self.assertEqual([(test["class_name"], test["flips"]) for test in flipped], [("A", 2)])
+
+if __name__ == '__main__':
+    unittest.main()